@@ -1,4 +1,45 @@
 """GDACS library."""
 
-from .feed import GdacsFeed  # noqa: F401
-from .feed_manager import GdacsFeedManager  # noqa: F401
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .feed import GdacsFeed
+    from .feed_aggregator import GdacsFeedAggregator
+    from .feed_manager import GdacsFeedManager, GdacsMultiFeedManager
+    from .multi_feed import GdacsMultiFeed
+
+__all__ = [
+    "GdacsFeed",
+    "GdacsFeedAggregator",
+    "GdacsFeedManager",
+    "GdacsMultiFeed",
+    "GdacsMultiFeedManager",
+]
+
+# Modules are only imported when one of their classes is first accessed,
+# so that importing this package does not import aiohttp and the XML stack.
+_MODULES = {
+    "GdacsFeed": ".feed",
+    "GdacsFeedAggregator": ".feed_aggregator",
+    "GdacsFeedManager": ".feed_manager",
+    "GdacsMultiFeed": ".multi_feed",
+    "GdacsMultiFeedManager": ".feed_manager",
+}
+
+
+def __getattr__(name: str):
+    """Import classes of this package on first access."""
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return names of this package, including classes not imported yet."""
+    return sorted(set(globals()) | set(__all__))
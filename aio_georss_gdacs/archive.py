@@ -0,0 +1,203 @@
+"""Archive of GDACS event versions."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import logging
+import os
+import sqlite3
+import threading
+
+from .event import GdacsEvent
+
+_LOGGER = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS event_versions (
+    event_type TEXT NOT NULL,
+    event_id INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    external_id TEXT,
+    alert_level TEXT,
+    severity TEXT,
+    magnitude REAL,
+    wind_speed REAL,
+    affected_population INTEGER,
+    vulnerability_score REAL,
+    from_date TEXT,
+    to_date TEXT,
+    recorded REAL NOT NULL,
+    PRIMARY KEY (event_type, event_id, version)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS event_versions_event_id ON event_versions (event_id);
+CREATE INDEX IF NOT EXISTS event_versions_recorded ON event_versions (recorded);
+"""
+INSERT_VERSION = """
+INSERT OR IGNORE INTO event_versions (
+    event_type, event_id, version, external_id, alert_level, severity,
+    magnitude, wind_speed, affected_population, vulnerability_score,
+    from_date, to_date, recorded
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SELECT_VERSIONS = """
+SELECT
+    event_type, event_id, version, external_id, alert_level, severity,
+    magnitude, wind_speed, affected_population, vulnerability_score,
+    from_date, to_date, recorded
+FROM event_versions
+"""
+SELECT_LATEST_VERSIONS = """
+SELECT event_type, event_id, MAX(version) FROM event_versions
+GROUP BY event_type, event_id
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class ArchivedEvent:
+    """Version of a GDACS event in the archive."""
+
+    event_type_short: str
+    event_id: int
+    version: int
+    external_id: str | None
+    alert_level: str | None
+    severity: str | None
+    magnitude: float | None
+    wind_speed: float | None
+    affected_population: int | None
+    vulnerability_score: float | None
+    from_date: datetime | None
+    to_date: datetime | None
+    recorded: datetime
+
+    @classmethod
+    def from_row(cls, row: tuple) -> ArchivedEvent:
+        """Create archived event from a database row."""
+        return cls(
+            *row[:10],
+            datetime.fromisoformat(row[10]) if row[10] else None,
+            datetime.fromisoformat(row[11]) if row[11] else None,
+            datetime.fromtimestamp(row[12], UTC),
+        )
+
+
+class GdacsArchive:
+    """Append-only archive of GDACS event versions in a SQLite database.
+
+    Each version of an event is stored once, when it is first recorded.
+    Versions already in the archive are skipped without accessing the
+    database, so that unchanged feed updates cause no writes. The archive
+    may be used from any thread, for example to record events in an
+    executor.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """Open the archive, creating the database if necessary."""
+        self._path: str = os.fspath(path)
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            self._path, check_same_thread=False
+        )
+        # Serialises access to the connection across threads.
+        self._lock: threading.Lock = threading.Lock()
+        with self._connection:
+            self._connection.executescript(SCHEMA)
+            self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        # Latest archived version by event type and id.
+        self._versions: dict[tuple[str, int], int] = {
+            (event_type, event_id): version
+            for event_type, event_id, version in self._connection.execute(
+                SELECT_LATEST_VERSIONS
+            )
+        }
+
+    def __repr__(self):
+        """Return string representation of this archive."""
+        return f"<{self.__class__.__name__}(path={self._path})>"
+
+    def record(
+        self, events: Iterable[GdacsEvent], recorded: datetime | None = None
+    ) -> int:
+        """Store new versions of the events, return the number stored.
+
+        Raises sqlite3.Error if writing fails, in which case none of the
+        versions are considered archived.
+        """
+        with self._lock:
+            timestamp = (recorded or datetime.now(UTC)).timestamp()
+            # Versions to archive, only known as archived once committed.
+            pending: dict[tuple[str, int], int] = {}
+            rows = []
+            for event in events:
+                if (
+                    event.event_type_short is None
+                    or event.event_id is None
+                    or event.version is None
+                ):
+                    continue
+                key = (event.event_type_short, event.event_id)
+                if (
+                    max(self._versions.get(key, -1), pending.get(key, -1))
+                    >= event.version
+                ):
+                    continue
+                pending[key] = event.version
+                rows.append(
+                    (
+                        event.event_type_short,
+                        event.event_id,
+                        event.version,
+                        event.external_id,
+                        event.alert_level,
+                        event.severity,
+                        event.magnitude,
+                        event.wind_speed,
+                        event.affected_population,
+                        event.vulnerability_score,
+                        event.from_date.isoformat() if event.from_date else None,
+                        event.to_date.isoformat() if event.to_date else None,
+                        timestamp,
+                    )
+                )
+            if rows:
+                with self._connection:
+                    self._connection.executemany(INSERT_VERSION, rows)
+                self._versions.update(pending)
+                _LOGGER.debug("Archived %s event versions in %s", len(rows), self._path)
+            return len(rows)
+
+    def timeline(self, event_type_short: str, event_id: int) -> list[ArchivedEvent]:
+        """Return all archived versions of the event, oldest first."""
+        with self._lock:
+            return [
+                ArchivedEvent.from_row(row)
+                for row in self._connection.execute(
+                    SELECT_VERSIONS
+                    + "WHERE event_type = ? AND event_id = ? ORDER BY version",
+                    (event_type_short, event_id),
+                )
+            ]
+
+    def recorded_between(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> list[ArchivedEvent]:
+        """Return event versions recorded within the time window, oldest first."""
+        with self._lock:
+            return [
+                ArchivedEvent.from_row(row)
+                for row in self._connection.execute(
+                    SELECT_VERSIONS + "WHERE recorded >= ? AND recorded <= ? "
+                    "ORDER BY recorded, event_type, event_id, version",
+                    (
+                        start.timestamp() if start else float("-inf"),
+                        end.timestamp() if end else float("inf"),
+                    ),
+                )
+            ]
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,222 @@
+"""Caches sharing parsed GDACS feeds between feeds and processes."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+import contextlib
+from dataclasses import dataclass
+from datetime import datetime
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from aio_georss_client.xml_parser.feed_item import FeedItem
+
+from .feed_entry import GdacsFeedEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TTL = 60.0
+DEFAULT_MAX_ENTRIES = 16
+LOCK_POLL_INTERVAL = 0.05
+
+
+@dataclass(frozen=True, slots=True)
+class CachedFeed:
+    """Parsed feed, before filtering.
+
+    Items are kept as the plain data produced by the XML parser, without
+    objects of the GeoRSS client or attributes already decoded by entries.
+    """
+
+    # Identifies the publication, for example by its publication date.
+    version: str
+    published: datetime | None
+    items: tuple[dict, ...]
+
+    @classmethod
+    def from_entries(
+        cls, version: str, published: datetime | None, entries: list[GdacsFeedEntry]
+    ) -> CachedFeed:
+        """Create cached feed from the data of the provided entries."""
+        return cls(
+            version,
+            published,
+            tuple(entry._rss_entry._source for entry in entries),  # noqa: SLF001
+        )
+
+    def entries(self, home_coordinates: tuple[float, float]) -> list[GdacsFeedEntry]:
+        """Return new entries relative to the home coordinates."""
+        return [GdacsFeedEntry(home_coordinates, FeedItem(item)) for item in self.items]
+
+
+class GdacsCache(ABC):
+    """Base class of caches for parsed feeds.
+
+    Entries expire after the provided number of seconds. Feeds acquire the
+    lock of a key before fetching, so that only one of them fetches while
+    the others wait for the result.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        """Initialise the cache."""
+        self._ttl: float = ttl
+
+    def __repr__(self):
+        """Return string representation of this cache."""
+        return f"<{self.__class__.__name__}(ttl={self._ttl})>"
+
+    @abstractmethod
+    async def get(self, key: str) -> CachedFeed | None:
+        """Return the cached feed, unless missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: CachedFeed):
+        """Cache the feed."""
+
+    @abstractmethod
+    def lock(self, key: str) -> contextlib.AbstractAsyncContextManager:
+        """Return a lock for fetching the feed."""
+
+    @property
+    def ttl(self) -> float:
+        """Return seconds until cached feeds expire."""
+        return self._ttl
+
+
+class MemoryCache(GdacsCache):
+    """Cache shared by all feeds of one process.
+
+    Keeps up to max_entries feeds, discarding the least recently used.
+    """
+
+    def __init__(
+        self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        """Initialise the cache."""
+        super().__init__(ttl)
+        self._max_entries: int = max_entries
+        # Expiry time and cached feed by key.
+        self._entries: OrderedDict[str, tuple[float, CachedFeed]] = OrderedDict()
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def get(self, key: str) -> CachedFeed | None:
+        """Return the cached feed, unless missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: CachedFeed):
+        """Cache the feed."""
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def lock(self, key: str) -> contextlib.AbstractAsyncContextManager:
+        """Return a lock for fetching the feed."""
+        return self._locks.setdefault(key, asyncio.Lock())
+
+
+class FileCache(GdacsCache):
+    """Cache shared by all processes on one host, in a local directory.
+
+    Feeds are stored as pickle files, so the directory must only be
+    writable by trusted users. Locks use flock and are released by the
+    operating system if a process dies while holding them.
+    """
+
+    def __init__(self, directory: str | os.PathLike, ttl: float = DEFAULT_TTL):
+        """Initialise the cache."""
+        if fcntl is None:
+            raise RuntimeError("File cache requires fcntl, which is not available")
+        super().__init__(ttl)
+        self._directory: str = os.fspath(directory)
+        os.makedirs(self._directory, exist_ok=True)
+
+    def __repr__(self):
+        """Return string representation of this cache."""
+        return (
+            f"<{self.__class__.__name__}(directory={self._directory}, ttl={self._ttl})>"
+        )
+
+    async def get(self, key: str) -> CachedFeed | None:
+        """Return the cached feed, unless missing or expired."""
+        return await asyncio.get_running_loop().run_in_executor(None, self._read, key)
+
+    async def set(self, key: str, value: CachedFeed):
+        """Cache the feed, replacing the file atomically."""
+        await asyncio.get_running_loop().run_in_executor(None, self._write, key, value)
+
+    def _read(self, key: str) -> CachedFeed | None:
+        """Read and unpickle the cached feed, outside of the event loop."""
+        try:
+            with open(self._path(key), "rb") as file:
+                expires, value = pickle.load(file)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except (
+            AttributeError,
+            EOFError,
+            ImportError,
+            OSError,
+            TypeError,
+            ValueError,
+            pickle.UnpicklingError,
+        ) as error:
+            # Treat files written by other versions or unreadable as a miss.
+            _LOGGER.warning("Unable to read cached feed for %s: %s", key, error)
+            return None
+        if expires <= time.time():
+            return None
+        return value
+
+    def _write(self, key: str, value: CachedFeed):
+        """Pickle and write the cached feed, outside of the event loop."""
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=self._directory, suffix=".tmp", delete=False
+        ) as file:
+            try:
+                pickle.dump((time.time() + self._ttl, value), file)
+            except BaseException:
+                file.close()
+                os.unlink(file.name)
+                raise
+        os.replace(file.name, self._path(key))
+
+    @contextlib.asynccontextmanager
+    async def lock(self, key: str) -> AsyncIterator[None]:
+        """Hold an exclusive lock on the key's lock file."""
+        with open(self._path(key) + ".lock", "a") as file:
+            while True:
+                try:
+                    fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(LOCK_POLL_INTERVAL)
+            try:
+                yield
+            finally:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+    def _path(self, key: str) -> str:
+        """Return the path of the file caching the key."""
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, f"{name}.pickle")
@@ -0,0 +1,55 @@
+"""Callback dispatcher for GDACS feed manager."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CallbackDispatcher:
+    """Dispatch a callback for many external ids concurrently.
+
+    At most `concurrency` callbacks are running at the same time, each of
+    them is cancelled if it does not complete within `timeout` seconds.
+    A failing callback does not affect the other callbacks.
+    """
+
+    def __init__(self, concurrency: int = 1, timeout: float | None = None):
+        """Initialise the callback dispatcher."""
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        self._concurrency: int = concurrency
+        self._timeout: float | None = timeout
+
+    def __repr__(self):
+        """Return string representation of this dispatcher."""
+        return f"<{self.__class__.__name__}(concurrency={self._concurrency}, timeout={self._timeout})>"
+
+    async def dispatch(
+        self,
+        callback: Callable[[str], Awaitable[None]],
+        external_ids: Iterable[str],
+    ) -> dict[str, Exception]:
+        """Run callback for all external ids and return errors by external id."""
+        external_ids = list(external_ids)
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def _run(external_id: str) -> None:
+            async with semaphore, asyncio.timeout(self._timeout):
+                await callback(external_id)
+
+        results = await asyncio.gather(
+            *(_run(external_id) for external_id in external_ids),
+            return_exceptions=True,
+        )
+        errors: dict[str, Exception] = {}
+        for external_id, result in zip(external_ids, results, strict=True):
+            if isinstance(result, Exception):
+                _LOGGER.warning(
+                    "Callback %s for %s failed: %r", callback, external_id, result
+                )
+                errors[external_id] = result
+        return errors
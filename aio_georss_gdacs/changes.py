@@ -0,0 +1,196 @@
+"""Streams of changes to the entries of a GDACS feed manager."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Mapping
+from dataclasses import dataclass, fields
+import logging
+from typing import Any, Final, Self
+
+from .event import GdacsEvent
+from .feed_entry import GdacsFeedEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE: Final = 1000
+# Wait until the consumer has taken changes from the full stream.
+OVERFLOW_BLOCK: Final = "block"
+# Discard the oldest change in the full stream.
+OVERFLOW_DROP_OLDEST: Final = "drop_oldest"
+# Discard the new change.
+OVERFLOW_DROP_NEWEST: Final = "drop_newest"
+OVERFLOW_POLICIES: Final = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_DROP_NEWEST)
+
+
+@dataclass(frozen=True, slots=True)
+class GdacsChange:
+    """Change to an entry of a feed manager."""
+
+    external_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class EntryAdded(GdacsChange):
+    """Entry new in the feed."""
+
+    entry: GdacsFeedEntry
+
+
+@dataclass(frozen=True, slots=True)
+class EntryUpdated(GdacsChange):
+    """Entry still in the feed, with the previous and new value by field.
+
+    Fields are the ones of GdacsEvent. Changes are empty if nothing changed
+    or if the previous entry is unknown, for example after restoring a
+    snapshot.
+    """
+
+    entry: GdacsFeedEntry
+    changes: Mapping[str, tuple[Any, Any]]
+
+
+@dataclass(frozen=True, slots=True)
+class EntryRemoved(GdacsChange):
+    """Entry no longer in the feed, with the last entry if known."""
+
+    entry: GdacsFeedEntry | None
+
+
+class GdacsChangeStream:
+    """Bounded stream of changes, iterated asynchronously.
+
+    If the stream is full, new changes either wait until the consumer has
+    taken some (backpressure on the feed manager's update), replace the
+    oldest change or are discarded, depending on the overflow policy.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        overflow: str = OVERFLOW_BLOCK,
+        on_close: Callable[[GdacsChangeStream], None] | None = None,
+    ):
+        """Initialise the stream."""
+        if max_size < 1:
+            raise ValueError("Maximum size must be at least 1")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow}")
+        self._max_size: int = max_size
+        self._overflow: str = overflow
+        self._on_close: Callable[[GdacsChangeStream], None] | None = on_close
+        self._changes: deque[GdacsChange] = deque()
+        self._condition: asyncio.Condition = asyncio.Condition()
+        self._closed: bool = False
+        self._dropped: int = 0
+
+    def __repr__(self):
+        """Return string representation of this stream."""
+        return (
+            f"<{self.__class__.__name__}(max_size={self._max_size}, "
+            f"overflow={self._overflow}, pending={len(self._changes)})>"
+        )
+
+    def __len__(self) -> int:
+        """Return the number of changes waiting to be taken."""
+        return len(self._changes)
+
+    def __aiter__(self) -> AsyncIterator[GdacsChange]:
+        """Return this stream as iterator over single changes."""
+        return self
+
+    async def __anext__(self) -> GdacsChange:
+        """Return the next change, wait if there is none."""
+        changes = await self.get_batch(1)
+        if not changes:
+            raise StopAsyncIteration
+        return changes[0]
+
+    async def __aenter__(self) -> Self:
+        """Return this stream, closed when leaving the context."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Close this stream."""
+        await self.aclose()
+
+    async def get_batch(self, max_items: int | None = None) -> list[GdacsChange]:
+        """Wait for changes and return up to max_items of them, oldest first.
+
+        Returns an empty list once the stream is closed and all changes
+        have been taken.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._changes or self._closed)
+            count = len(self._changes)
+            if max_items is not None:
+                count = min(count, max_items)
+            changes = [self._changes.popleft() for _ in range(count)]
+            self._condition.notify_all()
+            return changes
+
+    async def batches(
+        self, max_items: int | None = None
+    ) -> AsyncIterator[list[GdacsChange]]:
+        """Iterate over batches of all changes available at the time."""
+        while changes := await self.get_batch(max_items):
+            yield changes
+
+    async def put(self, change: GdacsChange):
+        """Add a change, applying the overflow policy if the stream is full."""
+        async with self._condition:
+            if self._closed:
+                return
+            if len(self._changes) >= self._max_size:
+                if self._overflow == OVERFLOW_BLOCK:
+                    await self._condition.wait_for(
+                        lambda: len(self._changes) < self._max_size or self._closed
+                    )
+                    if self._closed:
+                        return
+                elif self._overflow == OVERFLOW_DROP_OLDEST:
+                    self._changes.popleft()
+                    self._dropped += 1
+                else:
+                    self._dropped += 1
+                    return
+            self._changes.append(change)
+            self._condition.notify_all()
+
+    async def aclose(self):
+        """Stop receiving changes, iteration ends after the pending changes."""
+        async with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        if self._dropped:
+            _LOGGER.debug("Change stream dropped %s changes", self._dropped)
+        if self._on_close:
+            self._on_close(self)
+
+    @property
+    def closed(self) -> bool:
+        """Return if this stream is closed."""
+        return self._closed
+
+    @property
+    def dropped(self) -> int:
+        """Return the number of changes discarded because the stream was full."""
+        return self._dropped
+
+
+def changed_fields(
+    previous: GdacsEvent | None, event: GdacsEvent
+) -> dict[str, tuple[Any, Any]]:
+    """Return previous and new value of all fields that differ."""
+    if previous is None:
+        return {}
+    changes = {}
+    for field in fields(GdacsEvent):
+        old = getattr(previous, field.name)
+        new = getattr(event, field.name)
+        if old != new:
+            changes[field.name] = (old, new)
+    return changes
@@ -4,11 +4,17 @@ from typing import Final
 
 ATTRIBUTION: Final = "Global Disaster Alert and Coordination System"
 
+# Same mean earth radius (km) as used for the distance to home coordinates.
+AVERAGE_EARTH_RADIUS: Final = 6371.0088
+
+XML_ATTRIBUTE_PREFIX: Final = "@"
+XML_ATTRIBUTE_UNIT: Final = "@unit"
 XML_ATTRIBUTE_VALUE: Final = "@value"
 XML_TEXT: Final = "#text"
 
 XML_TAG_DC_SUBJECT: Final = "dc:subject"
 XML_TAG_GDACS_ALERT_LEVEL: Final = "gdacs:alertlevel"
+XML_TAG_GDACS_BBOX: Final = "gdacs:bbox"
 XML_TAG_GDACS_COUNTRY: Final = "gdacs:country"
 XML_TAG_GDACS_DURATION_IN_WEEK: Final = "gdacs:durationinweek"
 XML_TAG_GDACS_EVENT_ID: Final = "gdacs:eventid"
@@ -24,6 +30,10 @@ XML_TAG_GDACS_TO_DATE: Final = "gdacs:todate"
 XML_TAG_GDACS_VERSION: Final = "gdacs:version"
 XML_TAG_GDACS_VULNERABILITY: Final = "gdacs:vulnerability"
 
+# Units of the severity value of earthquakes and tropical cyclones.
+SEVERITY_UNIT_MAGNITUDE: Final = "M"
+SEVERITY_UNIT_WIND_SPEED: Final = "km/h"
+
 EVENT_TYPE_MAP: Final = {
     "DR": "Drought",
     "EQ": "Earthquake",
@@ -34,4 +44,8 @@ EVENT_TYPE_MAP: Final = {
     "WF": "Wild Fire",
 }
 
+UPDATE_OK_NOT_MODIFIED: Final = "OK_NOT_MODIFIED"
+
 URL: Final = "https://www.gdacs.org/xml/rss.xml"
+URL_24H: Final = "https://www.gdacs.org/xml/rss_24h.xml"
+URL_7D: Final = "https://www.gdacs.org/xml/rss_7d.xml"
@@ -0,0 +1,98 @@
+"""GDACS date parser."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta, timezone
+
+MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+UTC_DESIGNATORS = {"GMT", "UT", "UTC", "Z"}
+
+
+def parse_date(value: str) -> datetime:
+    """Parse the provided GDACS timestamp.
+
+    GDACS publishes timestamps in RFC 822 format, for example
+    "Sun, 29 Dec 2019 12:00:00 GMT". That format and ISO 8601 are parsed
+    directly, anything else is handed over to dateutil.
+    """
+    parsed_date = _parse_rfc822(value)
+    if parsed_date is None:
+        parsed_date = _parse_iso8601(value)
+    if parsed_date is None:
+        # Only import dateutil if needed, it is slow to import.
+        from dateutil import parser  # noqa: PLC0415
+
+        parsed_date = parser.parse(value)
+    return parsed_date
+
+
+def _parse_rfc822(value: str) -> datetime | None:
+    """Parse an RFC 822 timestamp, return None if format does not match."""
+    # Sun, 29 Dec 2019 12:00:00 GMT
+    parts = value.split()
+    if len(parts) == 6 and parts[0].endswith(","):
+        # Weekday is redundant.
+        parts = parts[1:]
+    if len(parts) != 5:
+        return None
+    day, month_name, year, time_of_day, zone = parts
+    month = MONTHS.get(month_name)
+    tzinfo = _parse_zone(zone)
+    time_parts = time_of_day.split(":")
+    if (
+        month is None
+        or tzinfo is None
+        or not day.isdigit()
+        or len(year) != 4
+        or not year.isdigit()
+        or len(time_parts) not in (2, 3)
+        or not all(part.isdigit() for part in time_parts)
+    ):
+        return None
+    try:
+        return datetime(
+            int(year),
+            month,
+            int(day),
+            *(int(part) for part in time_parts),
+            tzinfo=tzinfo,
+        )
+    except ValueError:
+        return None
+
+
+def _parse_zone(zone: str) -> timezone | None:
+    """Parse an RFC 822 time zone, return None if not supported."""
+    if zone in UTC_DESIGNATORS:
+        return UTC
+    # +0100, -0530
+    if len(zone) == 5 and zone[0] in "+-" and zone[1:].isdigit():
+        offset = timedelta(hours=int(zone[1:3]), minutes=int(zone[3:5]))
+        if not offset:
+            return UTC
+        return timezone(-offset if zone[0] == "-" else offset)
+    return None
+
+
+def _parse_iso8601(value: str) -> datetime | None:
+    """Parse an ISO 8601 timestamp, return None if format does not match."""
+    # 2019-12-29T12:00:00Z
+    if len(value) < 10 or value[4] != "-" or not value[:4].isdigit():
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
@@ -0,0 +1,70 @@
+"""GDACS event."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from .feed_entry import GdacsFeedEntry
+
+
+@dataclass(frozen=True, slots=True)
+class GdacsEvent:
+    """Compact, immutable record of a GDACS event.
+
+    Only holds the decoded values of a feed entry, so that the underlying
+    XML data can be released.
+    """
+
+    external_id: str | None
+    event_id: int | None
+    event_type_short: str | None
+    event_type: str | None
+    event_name: str | None
+    alert_level: str | None
+    country: str | None
+    is_current: bool | None
+    version: int | None
+    from_date: datetime | None
+    to_date: datetime | None
+    published: datetime | None
+    severity: str | None
+    population: str | None
+    vulnerability: str | float | None
+    coordinates: tuple[float, float] | None
+    bounding_box: tuple[float, float, float, float] | None
+    distance_to_home: float
+    magnitude: float | None = None
+    depth: float | None = None
+    wind_speed: float | None = None
+    affected_population: int | None = None
+    vulnerability_score: float | None = None
+
+    @classmethod
+    def from_entry(cls, entry: GdacsFeedEntry) -> GdacsEvent:
+        """Create event from the provided feed entry."""
+        return cls(
+            external_id=entry.external_id,
+            event_id=entry.event_id,
+            event_type_short=entry.event_type_short,
+            event_type=entry.event_type,
+            event_name=entry.event_name,
+            alert_level=entry.alert_level,
+            country=entry.country,
+            is_current=entry.is_current,
+            version=entry.version,
+            from_date=entry.from_date,
+            to_date=entry.to_date,
+            published=entry.published,
+            severity=entry.severity,
+            population=entry.population,
+            vulnerability=entry.vulnerability,
+            coordinates=entry.coordinates,
+            bounding_box=entry.bounding_box,
+            distance_to_home=entry.distance_to_home,
+            magnitude=entry.magnitude,
+            depth=entry.depth,
+            wind_speed=entry.wind_speed,
+            affected_population=entry.affected_population,
+            vulnerability_score=entry.vulnerability_score,
+        )
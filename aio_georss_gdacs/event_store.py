@@ -0,0 +1,228 @@
+"""In-memory store of GDACS events."""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime
+import itertools
+
+from .event import GdacsEvent
+
+COUNTRY_SEPARATOR = ","
+
+
+class GdacsEventStore:
+    """In-memory store of GDACS events with secondary indexes.
+
+    Events are indexed by alert level, event type, country, whether they
+    are current, and by their from and to dates, so that queries combining
+    these filters only look at matching events. Events affecting several
+    countries are found by each of them.
+    """
+
+    def __init__(self, events: Iterable[GdacsEvent] = ()):
+        """Initialise the store."""
+        self._events: dict[str, GdacsEvent] = {}
+        self._by_alert_level: dict[str | None, set[str]] = {}
+        self._by_event_type: dict[str | None, set[str]] = {}
+        self._by_country: dict[str, set[str]] = {}
+        self._by_is_current: dict[bool | None, set[str]] = {}
+        # Sorted lists of date and external id of events with a date.
+        self._by_from_date: list[tuple[datetime, str]] = []
+        self._by_to_date: list[tuple[datetime, str]] = []
+        for event in events:
+            self.add(event)
+
+    def __repr__(self):
+        """Return string representation of this store."""
+        return f"<{self.__class__.__name__}(events={len(self._events)})>"
+
+    def __len__(self) -> int:
+        """Return the number of events."""
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[GdacsEvent]:
+        """Iterate over all events."""
+        return iter(self._events.values())
+
+    def __contains__(self, external_id: str) -> bool:
+        """Check if an event with the external id is stored."""
+        return external_id in self._events
+
+    def get(self, external_id: str) -> GdacsEvent | None:
+        """Return the event with the external id, if stored."""
+        return self._events.get(external_id)
+
+    def add(self, event: GdacsEvent):
+        """Add event, replacing any event with the same external id."""
+        existing = self._events.get(event.external_id)
+        if existing == event:
+            return
+        if existing is not None:
+            self._unindex(existing)
+        self._events[event.external_id] = event
+        self._by_alert_level.setdefault(event.alert_level, set()).add(event.external_id)
+        self._by_event_type.setdefault(event.event_type_short, set()).add(
+            event.external_id
+        )
+        for country in _countries(event):
+            self._by_country.setdefault(country, set()).add(event.external_id)
+        self._by_is_current.setdefault(event.is_current, set()).add(event.external_id)
+        if event.from_date is not None:
+            bisect.insort(self._by_from_date, (event.from_date, event.external_id))
+        if event.to_date is not None:
+            bisect.insort(self._by_to_date, (event.to_date, event.external_id))
+
+    def remove(self, external_id: str) -> GdacsEvent | None:
+        """Remove and return the event with the external id, if stored."""
+        event = self._events.pop(external_id, None)
+        if event is not None:
+            self._unindex(event)
+        return event
+
+    def update(self, events: Iterable[GdacsEvent]):
+        """Replace all events, only re-indexing added, changed and removed ones."""
+        events = {event.external_id: event for event in events}
+        for external_id in self._events.keys() - events.keys():
+            self.remove(external_id)
+        for event in events.values():
+            self.add(event)
+
+    def clear(self):
+        """Remove all events."""
+        self._events.clear()
+        self._by_alert_level.clear()
+        self._by_event_type.clear()
+        self._by_country.clear()
+        self._by_is_current.clear()
+        self._by_from_date.clear()
+        self._by_to_date.clear()
+
+    def query(
+        self,
+        alert_levels: Iterable[str] | None = None,
+        event_types: Iterable[str] | None = None,
+        countries: Iterable[str] | None = None,
+        is_current: bool | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        predicate: Callable[[GdacsEvent], bool] | None = None,
+    ) -> list[GdacsEvent]:
+        """Return events matching all provided filters, sorted by external id.
+
+        Alert levels, event types (short form, for example "EQ") and
+        countries match if any of the provided values match. A time window
+        between start and end matches events overlapping it. Finally, the
+        predicate is called for each remaining event.
+        """
+        candidates: list[set[str]] = []
+        if alert_levels is not None:
+            candidates.append(_lookup(self._by_alert_level, alert_levels))
+        if event_types is not None:
+            candidates.append(_lookup(self._by_event_type, event_types))
+        if countries is not None:
+            candidates.append(_lookup(self._by_country, countries))
+        if is_current is not None:
+            candidates.append(self._by_is_current.get(is_current, set()))
+        external_ids: set[str] | None = None
+        # Intersect the smallest sets first.
+        for other in sorted(candidates, key=len):
+            external_ids = set(other) if external_ids is None else external_ids & other
+        if end is not None:
+            # Events starting no later than the end of the window.
+            index = bisect.bisect_right(self._by_from_date, end, key=_date)
+            external_ids = self._narrow(
+                external_ids,
+                self._by_from_date,
+                0,
+                index,
+                lambda event: event.from_date is not None and event.from_date <= end,
+            )
+        if start is not None:
+            # Events ending no earlier than the start of the window.
+            index = bisect.bisect_left(self._by_to_date, start, key=_date)
+            external_ids = self._narrow(
+                external_ids,
+                self._by_to_date,
+                index,
+                len(self._by_to_date),
+                lambda event: event.to_date is not None and event.to_date >= start,
+            )
+        if external_ids is None:
+            external_ids = set(self._events)
+        events = [self._events[external_id] for external_id in sorted(external_ids)]
+        if predicate is not None:
+            events = [event for event in events if predicate(event)]
+        return events
+
+    def _narrow(
+        self,
+        external_ids: set[str] | None,
+        dates: list[tuple[datetime, str]],
+        low: int,
+        high: int,
+        matches: Callable[[GdacsEvent], bool],
+    ) -> set[str]:
+        """Narrow down external ids to events within the range of the date index."""
+        if external_ids is not None and len(external_ids) < high - low:
+            # Fewer events to check than in the range of the date index.
+            return {
+                external_id
+                for external_id in external_ids
+                if matches(self._events[external_id])
+            }
+        window = {external_id for _, external_id in itertools.islice(dates, low, high)}
+        return window if external_ids is None else external_ids & window
+
+    def _unindex(self, event: GdacsEvent):
+        """Remove event from all indexes."""
+        _discard(self._by_alert_level, event.alert_level, event.external_id)
+        _discard(self._by_event_type, event.event_type_short, event.external_id)
+        for country in _countries(event):
+            _discard(self._by_country, country, event.external_id)
+        _discard(self._by_is_current, event.is_current, event.external_id)
+        if event.from_date is not None:
+            _remove_sorted(self._by_from_date, (event.from_date, event.external_id))
+        if event.to_date is not None:
+            _remove_sorted(self._by_to_date, (event.to_date, event.external_id))
+
+
+def _countries(event: GdacsEvent) -> list[str]:
+    """Return the individual countries affected by the event."""
+    if not event.country:
+        return []
+    return [
+        country.strip()
+        for country in event.country.split(COUNTRY_SEPARATOR)
+        if country.strip()
+    ]
+
+
+def _date(item: tuple[datetime, str]) -> datetime:
+    """Return the date of an item of a date index."""
+    return item[0]
+
+
+def _lookup(index: dict, values: Iterable) -> set[str]:
+    """Return external ids of events with any of the values."""
+    external_ids: set[str] = set()
+    for value in values:
+        external_ids.update(index.get(value, ()))
+    return external_ids
+
+
+def _discard(index: dict, value, external_id: str):
+    """Remove external id from the index, dropping empty entries."""
+    external_ids = index.get(value)
+    if external_ids is not None:
+        external_ids.discard(external_id)
+        if not external_ids:
+            del index[value]
+
+
+def _remove_sorted(items: list, item: tuple):
+    """Remove item from the sorted list."""
+    index = bisect.bisect_left(items, item)
+    if index < len(items) and items[index] == item:
+        del items[index]
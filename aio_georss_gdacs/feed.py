@@ -2,36 +2,96 @@
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+from collections.abc import Mapping
+from concurrent.futures import Executor
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+import hashlib
+from http import HTTPStatus
 import logging
+from pyexpat import ExpatError
+import re
+import time
+from typing import TYPE_CHECKING
+import uuid
 
+from aio_georss_client.consts import UPDATE_ERROR, UPDATE_OK, UPDATE_OK_NO_DATA
 from aio_georss_client.feed import GeoRssFeed
+from aio_georss_client.xml_parser import Feed, XmlParser
 from aio_georss_client.xml_parser.feed_item import FeedItem
-from aiohttp import ClientSession
+from aiohttp import ClientSession, client_exceptions, hdrs
 
-from .consts import URL
+from .consts import UPDATE_OK_NOT_MODIFIED, URL
+from .event import GdacsEvent
 from .feed_entry import GdacsFeedEntry
+from .fetcher import FeedResponse, GdacsFetcher, HttpFetcher
+from .metrics import GdacsMetrics
+
+if TYPE_CHECKING:
+    from .cache import CachedFeed, GdacsCache
 
 _LOGGER = logging.getLogger(__name__)
 
+CHANNEL_PUB_DATE = re.compile(rb"<pubDate>\s*([^<]+?)\s*</pubDate>")
+
 
 class GdacsFeed(GeoRssFeed[GdacsFeedEntry]):
     """GDACS feed."""
 
     def __init__(
         self,
-        websession: ClientSession,
+        websession: ClientSession | None,
         home_coordinates: tuple[float, float],
         filter_radius: float | None = None,
         filter_categories: list[str] | None = None,
+        streaming_parser: bool = False,
+        conditional_requests: bool = False,
+        skip_unchanged_content: bool = False,
+        skip_unchanged_pub_date: bool = False,
+        url: str = URL,
+        fetcher: GdacsFetcher | None = None,
+        metrics: GdacsMetrics | None = None,
+        executor: Executor | None = None,
+        cache: GdacsCache | None = None,
     ):
-        """Initialise this service."""
+        """Initialise this service.
+
+        Parsing runs in the provided executor instead of the event loop, if
+        any. Entries only decode what they need, so they are created and
+        filtered on the event loop. With a cache, the parsed feed is shared
+        with other feeds of the same URL using the cache.
+        """
         super().__init__(
             websession,
             home_coordinates,
-            URL,
+            url,
             filter_radius=filter_radius,
             filter_categories=filter_categories,
         )
+        self._fetcher: GdacsFetcher = fetcher or HttpFetcher(
+            websession, self._client_session_timeout()
+        )
+        self._metrics: GdacsMetrics = metrics or GdacsMetrics()
+        self._executor: Executor | None = executor
+        self._cache: GdacsCache | None = cache
+        # Parsed feed last fetched or taken from the cache.
+        self._cached: CachedFeed | None = None
+        self._streaming_parser: bool = streaming_parser
+        self._conditional_requests: bool = conditional_requests
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._skip_unchanged_content: bool = skip_unchanged_content
+        self._content_hash: bytes | None = None
+        self._skip_unchanged_pub_date: bool = skip_unchanged_pub_date
+        self._pub_date: bytes | None = None
+        self._published: datetime | None = None
+        self._max_age: float | None = None
+        self._update_count: int = 0
+        self._not_modified_count: int = 0
+        self._unchanged_content_count: int = 0
+        self._last_entries: list[GdacsFeedEntry] | None = None
 
     def _new_entry(
         self,
@@ -41,3 +101,320 @@ class GdacsFeed(GeoRssFeed[GdacsFeedEntry]):
     ) -> GdacsFeedEntry:
         """Generate a new entry."""
         return GdacsFeedEntry(home_coordinates, feature)
+
+    def _filter_entries(self, entries: list[GdacsFeedEntry]) -> list[GdacsFeedEntry]:
+        """Filter the provided entries without decoding their geometries."""
+        return filter_entries(entries, self._filter_radius, self._filter_categories)
+
+    async def update(self) -> tuple[str, list[GdacsFeedEntry] | None]:
+        """Update from external source and return filtered entries."""
+        self._update_count += 1
+        if self._cache is None:
+            status, entries = await self._fetch_entries()
+        else:
+            status, entries = await self._fetch_entries_cached()
+        if status == UPDATE_OK_NOT_MODIFIED:
+            # Feed has not changed since last update.
+            return UPDATE_OK_NOT_MODIFIED, self._last_entries
+        if status == UPDATE_OK:
+            if entries is not None:
+                start = time.perf_counter()
+                filtered_entries = self._filter_entries(entries)
+                self._metrics.duration("filter", time.perf_counter() - start)
+                self._metrics.count("entries", len(entries))
+                self._metrics.count("filtered_entries", len(filtered_entries))
+                self._last_timestamp = self._extract_last_timestamp(filtered_entries)
+                if (
+                    self._conditional_requests
+                    or self._skip_unchanged_content
+                    or self._skip_unchanged_pub_date
+                    or self._cache is not None
+                ):
+                    self._last_entries = filtered_entries
+                return UPDATE_OK, filtered_entries
+            # Should not happen.
+            return UPDATE_OK, None
+        if status == UPDATE_OK_NO_DATA:
+            return UPDATE_OK_NO_DATA, None
+        # Error happened while fetching the feed.
+        self._last_timestamp = None
+        # Next request must not be conditional, entries may have been removed.
+        self._last_entries = None
+        return UPDATE_ERROR, None
+
+    async def _fetch_entries(self) -> tuple[str, list[GdacsFeedEntry] | None]:
+        """Fetch the feed and return all of its entries."""
+        status, rss_data = await self._fetch(headers=self._request_headers())
+        if status != UPDATE_OK or not rss_data:
+            return status, None
+        self._published = rss_data.published_date
+        global_data = self._extract_from_feed(rss_data)
+        start = time.perf_counter()
+        # Extract data from feed entries.
+        entries = self._create_entries(rss_data, global_data)
+        self._metrics.duration("entries", time.perf_counter() - start)
+        return status, entries
+
+    async def _fetch_entries_cached(self) -> tuple[str, list[GdacsFeedEntry] | None]:
+        """Return all entries of the cached feed, fetching it if necessary."""
+        cached = await self._cache.get(self._url)
+        if cached is None:
+            async with self._cache.lock(self._url):
+                # Another feed may have fetched it while waiting for the lock.
+                cached = await self._cache.get(self._url)
+                if cached is None:
+                    return await self._fetch_entries_into_cache()
+        if self._cached is not None and cached.version == self._cached.version:
+            self._cached = cached
+            return UPDATE_OK_NOT_MODIFIED, None
+        _LOGGER.debug("Using cached feed %s from %s", cached.version, self._url)
+        self._cached = cached
+        self._published = cached.published
+        return UPDATE_OK, cached.entries(self._home_coordinates)
+
+    async def _fetch_entries_into_cache(
+        self,
+    ) -> tuple[str, list[GdacsFeedEntry] | None]:
+        """Fetch the feed and cache all of its entries."""
+        from .cache import CachedFeed  # noqa: PLC0415
+
+        status, entries = await self._fetch_entries()
+        if status == UPDATE_OK_NOT_MODIFIED and self._cached is not None:
+            # Keep sharing the feed last fetched.
+            await self._cache.set(self._url, self._cached)
+        elif status == UPDATE_OK and entries is not None:
+            self._cached = CachedFeed.from_entries(
+                self._published.isoformat() if self._published else uuid.uuid4().hex,
+                self._published,
+                entries,
+            )
+            await self._cache.set(self._url, self._cached)
+        else:
+            self._cached = None
+        return status, entries
+
+    async def update_events(self) -> tuple[str, list[GdacsEvent] | None]:
+        """Update from external source and return filtered events.
+
+        Same as update, but returns compact event records instead of feed
+        entries, which do not reference the parsed XML data. The feed itself
+        still keeps the entries of the last update if conditional requests,
+        skipping unchanged feeds or a cache are enabled.
+        """
+        status, entries = await self.update()
+        if entries is None:
+            return status, None
+        return status, [GdacsEvent.from_entry(entry) for entry in entries]
+
+    async def _fetch(
+        self, method: str = "GET", headers=None, params=None
+    ) -> tuple[str, Feed | None]:
+        """Fetch GeoRSS data from external source."""
+        try:
+            start = time.perf_counter()
+            response = await self._fetcher.fetch(self._url, method, headers, params)
+            self._metrics.duration("fetch", time.perf_counter() - start)
+            return await self._process_response(response)
+        except client_exceptions.ClientError as client_error:
+            _LOGGER.warning(
+                "Requesting data from %s failed with client error: %s",
+                self._url,
+                client_error,
+            )
+            return UPDATE_ERROR, None
+        except TimeoutError:
+            _LOGGER.warning(
+                "Requesting data from %s failed with timeout error", self._url
+            )
+            return UPDATE_ERROR, None
+        except ExpatError as parse_error:
+            _LOGGER.warning(
+                "Parsing data from %s failed with %s", self._url, parse_error
+            )
+            return UPDATE_OK_NO_DATA, None
+
+    async def _process_response(
+        self, response: FeedResponse
+    ) -> tuple[str, Feed | None]:
+        """Parse the response unless feed has not changed."""
+        self._max_age = _max_age(response.headers)
+        if response.status == HTTPStatus.NOT_MODIFIED:
+            _LOGGER.debug("Data from %s not modified", self._url)
+            self._not_modified_count += 1
+            return UPDATE_OK_NOT_MODIFIED, None
+        if response.status >= HTTPStatus.BAD_REQUEST:
+            _LOGGER.warning(
+                "Fetching data from %s failed with status %s",
+                self._url,
+                response.status,
+            )
+            return UPDATE_ERROR, None
+        raw_response = response.body
+        self._metrics.count("response_bytes", len(raw_response))
+        content_hash, pub_date = self._fingerprint(raw_response)
+        if self._last_entries is not None and (
+            (content_hash is not None and content_hash == self._content_hash)
+            or (pub_date is not None and pub_date == self._pub_date)
+        ):
+            _LOGGER.debug("Data from %s unchanged", self._url)
+            self._unchanged_content_count += 1
+            return UPDATE_OK_NOT_MODIFIED, None
+        start = time.perf_counter()
+        feed_data = await self._parse(raw_response, response.encoding)
+        self._metrics.duration("parse", time.perf_counter() - start)
+        self._content_hash = content_hash
+        self._pub_date = pub_date
+        if self._conditional_requests:
+            self._etag = response.headers.get(hdrs.ETAG)
+            self._last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+        return UPDATE_OK, feed_data
+
+    def _fingerprint(self, raw_response: bytes) -> tuple[bytes | None, bytes | None]:
+        """Return hash and channel publication date of the response if enabled."""
+        content_hash = None
+        if self._skip_unchanged_content:
+            content_hash = hashlib.blake2b(raw_response, digest_size=16).digest()
+        pub_date = None
+        if self._skip_unchanged_pub_date:
+            pub_date = _channel_pub_date(raw_response)
+        return content_hash, pub_date
+
+    def _request_headers(self) -> dict[str, str] | None:
+        """Return validators from the last response for a conditional request."""
+        if not self._conditional_requests or self._last_entries is None:
+            return None
+        headers = {}
+        if self._etag:
+            headers[hdrs.IF_NONE_MATCH] = self._etag
+        if self._last_modified:
+            headers[hdrs.IF_MODIFIED_SINCE] = self._last_modified
+        return headers or None
+
+    async def _parse(self, raw_response: bytes, encoding: str) -> Feed | None:
+        """Parse the raw response with the configured XML parser."""
+        arguments = (
+            raw_response,
+            encoding,
+            self._streaming_parser,
+            self._additional_namespaces(),
+        )
+        if self._executor is None:
+            return _parse(*arguments)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, _parse, *arguments
+        )
+
+    def _create_entries(
+        self, rss_data: Feed, global_data: dict
+    ) -> list[GdacsFeedEntry]:
+        """Create entries from the parsed feed."""
+        return [
+            self._new_entry(self._home_coordinates, rss_entry, global_data)
+            for rss_entry in rss_data.entries
+        ]
+
+    @property
+    def url(self) -> str:
+        """Return the URL of this feed."""
+        return self._url
+
+    @property
+    def metrics(self) -> GdacsMetrics:
+        """Return the metrics sink of this feed."""
+        return self._metrics
+
+    @property
+    def published(self) -> datetime | None:
+        """Return the publication date of the feed in the last update."""
+        return self._published
+
+    @property
+    def max_age(self) -> float | None:
+        """Return seconds the last response may be cached according to headers."""
+        return self._max_age
+
+    @property
+    def update_count(self) -> int:
+        """Return the number of updates of this feed."""
+        return self._update_count
+
+    @property
+    def not_modified_count(self) -> int:
+        """Return the number of updates the server responded with not modified."""
+        return self._not_modified_count
+
+    @property
+    def unchanged_content_count(self) -> int:
+        """Return the number of updates skipped because content was unchanged."""
+        return self._unchanged_content_count
+
+
+def _parse(
+    raw_response: bytes,
+    encoding: str,
+    streaming_parser: bool,
+    namespaces: dict | None,
+) -> Feed | None:
+    """Parse the raw response with the streaming or the generic XML parser."""
+    if streaming_parser:
+        # Only import lxml if the streaming parser is used.
+        from .xml_parser import GdacsXmlParser, ParseError  # noqa: PLC0415
+
+        try:
+            return GdacsXmlParser(namespaces).parse(raw_response)
+        except ParseError as error:
+            # Errors of lxml cannot be returned from a process pool.
+            raise ExpatError(str(error)) from error
+    if raw_response.startswith(codecs.BOM_UTF8):
+        text = raw_response.decode("utf-8-sig")
+    else:
+        text = raw_response.decode(encoding)
+    return XmlParser(namespaces).parse(text)
+
+
+def filter_entries(
+    entries: list[GdacsFeedEntry],
+    filter_radius: float | None,
+    filter_categories: list[str] | None,
+) -> list[GdacsFeedEntry]:
+    """Return entries with geometries, within the radius and categories.
+
+    Same as the filter of the GeoRSS client, but only uses the arrays of
+    coordinates, so that geometries of entries are not built.
+    """
+    filtered_entries = [
+        entry
+        for entry in entries
+        if any(entry.shapes)
+        and (not filter_radius or entry.distance_to_home <= filter_radius)
+        and (not filter_categories or entry.category in filter_categories)
+    ]
+    _LOGGER.debug("Entries after filtering %s", filtered_entries)
+    return filtered_entries
+
+
+def _max_age(headers: Mapping[str, str]) -> float | None:
+    """Return seconds a response may be cached according to its headers."""
+    for directive in headers.get(hdrs.CACHE_CONTROL, "").split(","):
+        name, _, value = directive.strip().partition("=")
+        value = value.strip('"')
+        if name.lower() == "max-age" and value.isdigit():
+            age = headers.get(hdrs.AGE, "")
+            return max(int(value) - (int(age) if age.isdigit() else 0), 0)
+    if hdrs.EXPIRES in headers and hdrs.DATE in headers:
+        try:
+            expires = parsedate_to_datetime(headers[hdrs.EXPIRES])
+            date = parsedate_to_datetime(headers[hdrs.DATE])
+            return max((expires - date).total_seconds(), 0.0)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def _channel_pub_date(raw_response: bytes) -> bytes | None:
+    """Find the channel's publication date without parsing the document."""
+    end = raw_response.find(b"<item")
+    match = CHANNEL_PUB_DATE.search(
+        raw_response, 0, end if end >= 0 else len(raw_response)
+    )
+    return match.group(1) if match else None
@@ -0,0 +1,198 @@
+"""Feed Aggregator for GDACS feed."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor
+import logging
+from typing import TYPE_CHECKING
+
+from aio_georss_client.consts import UPDATE_ERROR, UPDATE_OK
+from aio_georss_client.feed import GeoRssFeed
+from aio_georss_client.status_update import StatusUpdate
+from aio_georss_client.xml_parser.feed_item import FeedItem
+from aiohttp import ClientSession
+
+from .consts import UPDATE_OK_NOT_MODIFIED, URL
+from .feed import GdacsFeed, filter_entries
+from .feed_entry import GdacsFeedEntry
+from .feed_manager import GdacsFeedManagerBase
+from .metrics import GdacsMetrics
+
+if TYPE_CHECKING:
+    from .archive import GdacsArchive
+    from .cache import GdacsCache
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GdacsFeedAggregator:
+    """Feed Aggregator for GDACS feed.
+
+    Fetches and parses the GDACS feed once per update and hands the entries
+    to any number of subscriptions, each with its own home coordinates,
+    filters and callbacks.
+    """
+
+    def __init__(
+        self,
+        websession: ClientSession,
+        streaming_parser: bool = False,
+        conditional_requests: bool = False,
+        skip_unchanged_content: bool = False,
+        metrics: GdacsMetrics | None = None,
+        executor: Executor | None = None,
+        cache: GdacsCache | None = None,
+    ):
+        """Initialize the GDACS Feed Aggregator."""
+        self._websession: ClientSession = websession
+        # Entries are not filtered by distance, so home coordinates do not matter.
+        self._feed: GdacsFeed = GdacsFeed(
+            websession,
+            (0.0, 0.0),
+            streaming_parser=streaming_parser,
+            conditional_requests=conditional_requests,
+            skip_unchanged_content=skip_unchanged_content,
+            metrics=metrics,
+            executor=executor,
+            cache=cache,
+        )
+        self._status: str | None = None
+        self._feed_entries: list[GdacsFeedEntry] | None = None
+        self._subscriptions: list[GdacsFeedManagerBase] = []
+
+    def __repr__(self):
+        """Return string representation of this aggregator."""
+        return (
+            f"<{self.__class__.__name__}(feed={self._feed}, "
+            f"subscriptions={len(self._subscriptions)})>"
+        )
+
+    def subscribe(
+        self,
+        generate_async_callback: Callable[[str], Awaitable[None]],
+        update_async_callback: Callable[[str], Awaitable[None]],
+        remove_async_callback: Callable[[str], Awaitable[None]],
+        coordinates: tuple[float, float],
+        filter_radius: float | None = None,
+        filter_categories: list[str] | None = None,
+        status_async_callback: Callable[[StatusUpdate], Awaitable[None]] | None = None,
+        update_changed_only: bool = False,
+        callback_concurrency: int | None = None,
+        callback_timeout: float | None = None,
+        metrics: GdacsMetrics | None = None,
+        archive: GdacsArchive | None = None,
+    ) -> GdacsFeedManagerBase:
+        """Add a subscription and return its feed manager."""
+        feed = GdacsSubscriptionFeed(
+            self,
+            coordinates,
+            filter_radius=filter_radius,
+            filter_categories=filter_categories,
+        )
+        subscription = GdacsFeedManagerBase(
+            feed,
+            generate_async_callback,
+            update_async_callback,
+            remove_async_callback,
+            status_async_callback=status_async_callback,
+            update_changed_only=update_changed_only,
+            callback_concurrency=callback_concurrency,
+            callback_timeout=callback_timeout,
+            metrics=metrics,
+            archive=archive,
+        )
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: GdacsFeedManagerBase):
+        """Remove a subscription, its entities are not removed."""
+        self._subscriptions.remove(subscription)
+
+    async def update(self):
+        """Update the feed once and then update all subscriptions."""
+        self._status, self._feed_entries = await self._feed.update()
+        _LOGGER.debug(
+            "Updating %s subscriptions of %s", len(self._subscriptions), self._feed
+        )
+        for subscription in list(self._subscriptions):
+            await subscription.update()
+
+    @property
+    def websession(self) -> ClientSession:
+        """Return the web session used to fetch the feed."""
+        return self._websession
+
+    @property
+    def status(self) -> str | None:
+        """Return the status of the last feed update."""
+        return self._status
+
+    @property
+    def feed_entries(self) -> list[GdacsFeedEntry] | None:
+        """Return the unfiltered entries of the last feed update."""
+        return self._feed_entries
+
+    @property
+    def subscriptions(self) -> list[GdacsFeedManagerBase]:
+        """Return the feed managers of all subscriptions."""
+        return list(self._subscriptions)
+
+
+class GdacsSubscriptionFeed(GeoRssFeed[GdacsFeedEntry]):
+    """GDACS feed of a single subscription to an aggregator.
+
+    Does not fetch anything itself, but filters the entries of the
+    aggregator's last update relative to its own home coordinates.
+    """
+
+    def __init__(
+        self,
+        aggregator: GdacsFeedAggregator,
+        home_coordinates: tuple[float, float],
+        filter_radius: float | None = None,
+        filter_categories: list[str] | None = None,
+    ):
+        """Initialise this feed."""
+        super().__init__(
+            aggregator.websession,
+            home_coordinates,
+            URL,
+            filter_radius=filter_radius,
+            filter_categories=filter_categories,
+        )
+        self._aggregator: GdacsFeedAggregator = aggregator
+        self._last_entries: list[GdacsFeedEntry] | None = None
+
+    def _new_entry(
+        self,
+        home_coordinates: tuple[float, float],
+        feature: FeedItem,
+        global_data: dict,
+    ) -> GdacsFeedEntry:
+        """Generate a new entry."""
+        return GdacsFeedEntry(home_coordinates, feature)
+
+    def _filter_entries(self, entries: list[GdacsFeedEntry]) -> list[GdacsFeedEntry]:
+        """Filter the provided entries without decoding their geometries."""
+        return filter_entries(entries, self._filter_radius, self._filter_categories)
+
+    async def update(self) -> tuple[str, list[GdacsFeedEntry] | None]:
+        """Return entries of the aggregator's last update, filtered."""
+        status = self._aggregator.status
+        entries = self._aggregator.feed_entries
+        if status == UPDATE_OK_NOT_MODIFIED and self._last_entries is not None:
+            return UPDATE_OK_NOT_MODIFIED, self._last_entries
+        if status in (UPDATE_OK, UPDATE_OK_NOT_MODIFIED) and entries is not None:
+            # First update of this subscription also needs unchanged entries.
+            filtered_entries = self._filter_entries(
+                [entry.relocate(self._home_coordinates) for entry in entries]
+            )
+            self._last_timestamp = self._extract_last_timestamp(filtered_entries)
+            self._last_entries = filtered_entries
+            return UPDATE_OK, filtered_entries
+        if status == UPDATE_ERROR or status is None:
+            self._last_timestamp = None
+            self._last_entries = None
+            return UPDATE_ERROR, None
+        return status, None
@@ -2,19 +2,41 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from array import array
+from collections.abc import Iterator, Mapping
+import copy
 from datetime import datetime
+from functools import cached_property
+import itertools
+import re
 
+from aio_georss_client.consts import (
+    XML_TAG_GEO_LAT,
+    XML_TAG_GEO_LONG,
+    XML_TAG_GEO_POINT,
+    XML_TAG_GEORSS_POINT,
+    XML_TAG_GEORSS_POLYGON,
+    XML_TAG_GEORSS_WHERE,
+    XML_TAG_GML_EXTERIOR,
+    XML_TAG_GML_LINEAR_RING,
+    XML_TAG_GML_POINT,
+    XML_TAG_GML_POLYGON,
+    XML_TAG_GML_POS,
+    XML_TAG_GML_POS_LIST,
+)
 from aio_georss_client.feed_entry import FeedEntry
 from aio_georss_client.xml_parser.feed_item import FeedItem
 from aio_georss_client.xml_parser.geometry import Geometry, Point, Polygon
-import dateutil
 
 from .consts import (
     ATTRIBUTION,
     EVENT_TYPE_MAP,
+    SEVERITY_UNIT_MAGNITUDE,
+    SEVERITY_UNIT_WIND_SPEED,
+    XML_ATTRIBUTE_UNIT,
     XML_ATTRIBUTE_VALUE,
     XML_TAG_GDACS_ALERT_LEVEL,
+    XML_TAG_GDACS_BBOX,
     XML_TAG_GDACS_COUNTRY,
     XML_TAG_GDACS_DURATION_IN_WEEK,
     XML_TAG_GDACS_EVENT_ID,
@@ -31,20 +53,75 @@ from .consts import (
     XML_TAG_GDACS_VULNERABILITY,
     XML_TEXT,
 )
+from .date_parser import parse_date
+from .geometry import (
+    centroid,
+    decode_coordinates,
+    distance_to_points,
+    distance_to_polygon,
+)
+
+# Depth of an earthquake is only provided in the severity text.
+SEVERITY_DEPTH = re.compile(r"Depth:\s*(\d+(?:\.\d+)?)\s*km")
 
 
 class GdacsFeedEntry(FeedEntry):
-    """GDACS feed entry."""
+    """GDACS feed entry.
+
+    GDACS specific attributes are decoded from the underlying feed item the
+    first time they are accessed and then kept with this entry. Geometries
+    are decoded into flat arrays of coordinates, which coordinates and
+    distances are calculated from; geometry objects are only built once
+    geometries are accessed.
+    """
 
     def __init__(self, home_coordinates: tuple[float, float], feature: FeedItem | None):
         """Initialise this service."""
         super().__init__(home_coordinates, feature)
 
+    def relocate(self, home_coordinates: tuple[float, float]) -> GdacsFeedEntry:
+        """Return a copy of this entry relative to other home coordinates.
+
+        Attributes already decoded are shared with the copy.
+        """
+        entry = copy.copy(self)
+        entry._home_coordinates = home_coordinates  # noqa: SLF001
+        return entry
+
     @property
     def features(self) -> list[type[Geometry]]:
         """Only consider Point and Polygon in this integration."""
         return [Point, Polygon]
 
+    @cached_property
+    def geometries(self) -> list[Geometry] | None:
+        """Return all points and polygons of this entry."""
+        if not self._rss_entry:
+            return None
+        points, polygons = self.shapes
+        return _points(points) + [Polygon(_points(polygon)) for polygon in polygons]
+
+    @cached_property
+    def coordinates(self) -> tuple[float, float] | None:
+        """Return the first point, or the centroid of the first polygon."""
+        points, polygons = self.shapes
+        if points:
+            return points[0], points[1]
+        if polygons:
+            return centroid(polygons[0])
+        return None
+
+    @property
+    def distance_to_home(self) -> float:
+        """Return the distance in km of this entry to the home coordinates."""
+        points, polygons = self.shapes
+        distance = distance_to_points(self._home_coordinates, points)
+        for polygon in polygons:
+            distance = min(
+                distance, distance_to_polygon(self._home_coordinates, polygon)
+            )
+        return distance
+
     @property
     def attribution(self) -> str | None:
         """Return the attribution of this entry."""
@@ -55,21 +132,61 @@ class GdacsFeedEntry(FeedEntry):
         """Return the category of this entry."""
         return self.event_type
 
-    @property
+    @cached_property
+    def affected_population(self) -> int | None:
+        """Return the number of people affected by the event of this entry."""
+        value, _ = self._value_and_unit(XML_TAG_GDACS_POPULATION)
+        if value is not None:
+            return int(value)
+        return None
+
+    @cached_property
     def alert_level(self) -> str | None:
         """Return the alert level of this entry."""
         if self._rss_entry:
             return self._rss_entry.get_additional_attribute(XML_TAG_GDACS_ALERT_LEVEL)
         return None
 
-    @property
+    @cached_property
+    def bounding_box(self) -> tuple[float, float, float, float] | None:
+        """Return the bounding box (south, west, north, east) of this entry."""
+        if self._rss_entry:
+            # <!--gdacs:bbox format = lonmin lonmax latmin latmax-->
+            bbox = self._rss_entry.get_additional_attribute(XML_TAG_GDACS_BBOX)
+            if isinstance(bbox, list):
+                bbox = bbox[0]
+            if isinstance(bbox, tuple) and len(bbox) == 4:
+                return bbox[2], bbox[0], bbox[3], bbox[1]
+            # Fall back to the extent of all geometries.
+            points, polygons = self.shapes
+            if points or polygons:
+                latitudes = [points[0::2], *(polygon[0::2] for polygon in polygons)]
+                longitudes = [points[1::2], *(polygon[1::2] for polygon in polygons)]
+                return (
+                    min(itertools.chain.from_iterable(latitudes)),
+                    min(itertools.chain.from_iterable(longitudes)),
+                    max(itertools.chain.from_iterable(latitudes)),
+                    max(itertools.chain.from_iterable(longitudes)),
+                )
+        return None
+
+    @cached_property
     def country(self) -> str | None:
         """Return the country of this entry."""
         if self._rss_entry:
             return self._rss_entry.get_additional_attribute(XML_TAG_GDACS_COUNTRY)
         return None
 
-    @property
+    @cached_property
+    def depth(self) -> float | None:
+        """Return the depth in km of the earthquake of this entry."""
+        if self.magnitude is not None and self.severity:
+            match = SEVERITY_DEPTH.search(self.severity)
+            if match:
+                return float(match.group(1))
+        return None
+
+    @cached_property
     def duration_in_week(self) -> int | None:
         """Return the duration in weeks of this entry."""
         if self._rss_entry:
@@ -83,7 +200,7 @@ class GdacsFeedEntry(FeedEntry):
                 return int(duration_in_week)
         return None
 
-    @property
+    @cached_property
     def event_id(self) -> int | None:
         """Return the event id of this entry."""
         if self._rss_entry:
@@ -92,21 +209,21 @@ class GdacsFeedEntry(FeedEntry):
                 return int(event_id)
         return None
 
-    @property
+    @cached_property
     def event_name(self) -> str | None:
         """Return the event name of this entry."""
         if self._rss_entry:
             return self._rss_entry.get_additional_attribute(XML_TAG_GDACS_EVENT_NAME)
         return None
 
-    @property
+    @cached_property
     def event_type_short(self) -> str | None:
         """Return the short event type of this entry."""
         if self._rss_entry:
             return self._rss_entry.get_additional_attribute(XML_TAG_GDACS_EVENT_TYPE)
         return None
 
-    @property
+    @cached_property
     def event_type(self) -> str | None:
         """Return the event type of this entry."""
         event_type_short = self.event_type_short
@@ -114,7 +231,7 @@ class GdacsFeedEntry(FeedEntry):
             return EVENT_TYPE_MAP[event_type_short]
         return "Unknown"
 
-    @property
+    @cached_property
     def from_date(self) -> datetime | None:
         """Return the from date of this entry."""
         if self._rss_entry:
@@ -122,17 +239,17 @@ class GdacsFeedEntry(FeedEntry):
                 XML_TAG_GDACS_FROM_DATE
             )
             if from_date:
-                return dateutil.parser.parse(from_date)
+                return parse_date(from_date)
         return None
 
-    @property
+    @cached_property
     def icon_url(self) -> str | None:
         """Return the icon url of this entry."""
         if self._rss_entry:
             return self._rss_entry.get_additional_attribute(XML_TAG_GDACS_ICON)
         return None
 
-    @property
+    @cached_property
     def is_current(self) -> bool | None:
         """Return if this entry is current."""
         if self._rss_entry:
@@ -143,7 +260,15 @@ class GdacsFeedEntry(FeedEntry):
                 return GdacsFeedEntry._string2boolean(is_current)
         return None
 
-    @property
+    @cached_property
+    def magnitude(self) -> float | None:
+        """Return the magnitude of the earthquake of this entry."""
+        value, unit = self._value_and_unit(XML_TAG_GDACS_SEVERITY)
+        if unit == SEVERITY_UNIT_MAGNITUDE:
+            return value
+        return None
+
+    @cached_property
     def population(self) -> str | None:
         """Return the population of this entry."""
         if self._rss_entry:
@@ -158,7 +283,7 @@ class GdacsFeedEntry(FeedEntry):
                     return population
         return None
 
-    @property
+    @cached_property
     def severity(self) -> str | None:
         """Return the severity of this entry."""
         if self._rss_entry:
@@ -171,7 +296,7 @@ class GdacsFeedEntry(FeedEntry):
                     return severity
         return None
 
-    @property
+    @cached_property
     def temporary(self) -> bool | None:
         """Return if this entry is temporary."""
         if self._rss_entry:
@@ -182,16 +307,16 @@ class GdacsFeedEntry(FeedEntry):
                 return GdacsFeedEntry._string2boolean(temporary)
         return None
 
-    @property
+    @cached_property
     def to_date(self) -> datetime | None:
         """Return the to date of this entry."""
         if self._rss_entry:
             to_date = self._rss_entry.get_additional_attribute(XML_TAG_GDACS_TO_DATE)
             if to_date:
-                return dateutil.parser.parse(to_date)
+                return parse_date(to_date)
         return None
 
-    @property
+    @cached_property
     def version(self) -> int | None:
         """Return the version of this entry."""
         if self._rss_entry:
@@ -200,7 +325,7 @@ class GdacsFeedEntry(FeedEntry):
                 return int(version)
         return None
 
-    @property
+    @cached_property
     def vulnerability(self) -> str | float | None:
         """Return the vulnerability of this entry."""
         if self._rss_entry:
@@ -218,3 +343,129 @@ class GdacsFeedEntry(FeedEntry):
                 else:
                     return vulnerability
         return None
+
+    @cached_property
+    def vulnerability_score(self) -> float | None:
+        """Return the numerical vulnerability of this entry."""
+        value, _ = self._value_and_unit(XML_TAG_GDACS_VULNERABILITY)
+        return value
+
+    @cached_property
+    def wind_speed(self) -> float | None:
+        """Return the maximum wind speed in km/h of the cyclone of this entry."""
+        value, unit = self._value_and_unit(XML_TAG_GDACS_SEVERITY)
+        if unit == SEVERITY_UNIT_WIND_SPEED:
+            return value
+        return None
+
+    @cached_property
+    def shapes(self) -> tuple[array, list[array]]:
+        """Return points and polygons as flat arrays of coordinates.
+
+        Points are one array of alternating latitudes and longitudes, each
+        polygon is an array of the same form. Bounding boxes are not
+        included.
+        """
+        points = array("d")
+        polygons: list[array] = []
+        if not self._rss_entry:
+            return points, polygons
+        item = self._rss_entry
+        point_values, polygon_values = _geometry_values(item)
+        for value in point_values:
+            if not value:
+                continue
+            coordinates = decode_coordinates(value)[:2]
+            if coordinates and tuple(coordinates) not in _pairs(points):
+                points.extend(coordinates)
+        for value in polygon_values:
+            polygon = decode_coordinates(value)
+            if polygon:
+                polygons.append(polygon)
+        for value in _values(item.get_additional_attribute(XML_TAG_GEORSS_POLYGON)):
+            polygon = decode_coordinates(value)
+            if polygon and polygon not in polygons:
+                polygons.append(polygon)
+        return points, polygons
+
+    def _value_and_unit(self, tag: str) -> tuple[float | None, str | None]:
+        """Return the value and unit attributes of the tag, if numerical."""
+        if self._rss_entry:
+            attribute = self._rss_entry.get_additional_attribute(tag)
+            if isinstance(attribute, Mapping) and XML_ATTRIBUTE_VALUE in attribute:
+                try:
+                    value = float(attribute[XML_ATTRIBUTE_VALUE])
+                except (TypeError, ValueError):
+                    return None, None
+                return value, attribute.get(XML_ATTRIBUTE_UNIT)
+        return None, None
+
+
+def _pairs(coordinates: array) -> Iterator[tuple[float, float]]:
+    """Iterate over latitude and longitude pairs of a flat array."""
+    return zip(coordinates[0::2], coordinates[1::2], strict=True)
+
+
+def _points(coordinates: array) -> list[Point]:
+    """Return points of a flat array of coordinates."""
+    return [Point(latitude, longitude) for latitude, longitude in _pairs(coordinates)]
+
+
+def _geometry_values(item: FeedItem) -> tuple[list, list]:
+    """Return coordinate values of points and of polygons except georss:polygon."""
+    point_values = _values(item.get_additional_attribute(XML_TAG_GEORSS_POINT))
+    polygon_values = []
+    where = item.get_additional_attribute(XML_TAG_GEORSS_WHERE)
+    if isinstance(where, Mapping):
+        pos = _value_in(where, XML_TAG_GML_POINT, XML_TAG_GML_POS)
+        if pos:
+            point_values.append(pos)
+        else:
+            polygon_values = _values(
+                _value_in(
+                    where,
+                    XML_TAG_GML_POLYGON,
+                    XML_TAG_GML_EXTERIOR,
+                    XML_TAG_GML_LINEAR_RING,
+                    XML_TAG_GML_POS_LIST,
+                )
+            )
+    geo_point = item.get_additional_attribute(XML_TAG_GEO_POINT)
+    if isinstance(geo_point, Mapping):
+        point_values.append(_lat_long(geo_point))
+    point_values.append(
+        _lat_long(
+            {
+                XML_TAG_GEO_LAT: item.get_additional_attribute(XML_TAG_GEO_LAT),
+                XML_TAG_GEO_LONG: item.get_additional_attribute(XML_TAG_GEO_LONG),
+            }
+        )
+    )
+    return point_values, polygon_values
+
+
+def _values(value) -> list:
+    """Return the values of a tag that may occur several times."""
+    if not value:
+        return []
+    if isinstance(value, list):
+        return list(value)
+    return [value]
+
+
+def _value_in(structure: Mapping, *keys: str):
+    """Return the value found under the chain of keys, if any."""
+    for key in keys:
+        if not isinstance(structure, Mapping) or key not in structure:
+            return None
+        structure = structure[key]
+    return structure
+
+
+def _lat_long(point: Mapping) -> tuple[float, float] | None:
+    """Return latitude and longitude of a geo:Point, if both are provided."""
+    latitude = point.get(XML_TAG_GEO_LAT)
+    longitude = point.get(XML_TAG_GEO_LONG)
+    if latitude and longitude:
+        return latitude, longitude
+    return None
@@ -2,16 +2,411 @@
 
 from __future__ import annotations
 
-from typing import Awaitable, Callable
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from concurrent.futures import Executor
+from datetime import datetime
+import logging
+import os
+import time
+from typing import TYPE_CHECKING
 
+from aio_georss_client.consts import UPDATE_OK, UPDATE_OK_NO_DATA
+from aio_georss_client.feed import GeoRssFeed
 from aio_georss_client.feed_manager import FeedManagerBase
 from aio_georss_client.status_update import StatusUpdate
 from aiohttp import ClientSession
 
+from .callback_dispatcher import CallbackDispatcher
+from .changes import (
+    DEFAULT_MAX_SIZE,
+    OVERFLOW_BLOCK,
+    EntryAdded,
+    EntryRemoved,
+    EntryUpdated,
+    GdacsChange,
+    GdacsChangeStream,
+    changed_fields,
+)
+from .consts import UPDATE_OK_NOT_MODIFIED, URL
+from .event import GdacsEvent
+from .event_store import GdacsEventStore
 from .feed import GdacsFeed
+from .feed_entry import GdacsFeedEntry
+from .fetcher import GdacsFetcher
+from .metrics import GdacsMetrics, timed_callback
+from .multi_feed import GdacsMultiFeed
+from .snapshot import SnapshotRecord, read_snapshot, write_snapshot
 
+if TYPE_CHECKING:
+    from .archive import GdacsArchive
+    from .cache import GdacsCache
 
-class GdacsFeedManager(FeedManagerBase):
+_LOGGER = logging.getLogger(__name__)
+
+
+class GdacsFeedManagerBase(FeedManagerBase):
+    """Feed Manager base for GDACS feeds."""
+
+    def __init__(
+        self,
+        feed: GeoRssFeed[GdacsFeedEntry] | GdacsMultiFeed,
+        generate_async_callback: Callable[[str], Awaitable[None]],
+        update_async_callback: Callable[[str], Awaitable[None]],
+        remove_async_callback: Callable[[str], Awaitable[None]],
+        status_async_callback: Callable[[StatusUpdate], Awaitable[None]] | None = None,
+        update_changed_only: bool = False,
+        callback_concurrency: int | None = None,
+        callback_timeout: float | None = None,
+        metrics: GdacsMetrics | None = None,
+        archive: GdacsArchive | None = None,
+    ):
+        """Initialize the GDACS Feed Manager."""
+        if metrics is not None:
+            # Only pay for timing callbacks if metrics are recorded.
+            generate_async_callback = timed_callback(
+                metrics, "generate_callback", generate_async_callback
+            )
+            update_async_callback = timed_callback(
+                metrics, "update_callback", update_async_callback
+            )
+            remove_async_callback = timed_callback(
+                metrics, "remove_callback", remove_async_callback
+            )
+        super().__init__(
+            feed,
+            generate_async_callback,
+            update_async_callback,
+            remove_async_callback,
+            status_async_callback,
+        )
+        self._metrics: GdacsMetrics = metrics or GdacsMetrics()
+        self._update_changed_only: bool = update_changed_only
+        self._callback_dispatcher: CallbackDispatcher | None = None
+        if callback_concurrency or callback_timeout:
+            self._callback_dispatcher = CallbackDispatcher(
+                callback_concurrency or 1, callback_timeout
+            )
+        self._callback_errors: dict[str, Exception] = {}
+        self._status: str | None = None
+        self._events: GdacsEventStore = GdacsEventStore()
+        # Events are only brought up to date with the feed entries when used.
+        self._events_outdated: bool = False
+        self._archive: GdacsArchive | None = archive
+        # Events restored from a snapshot, until the next update.
+        self._restored_records: dict[str, SnapshotRecord] = {}
+        # Version and alert level of all events in the last feed update.
+        self._event_versions: dict[
+            tuple[str | None, int | None], tuple[int | None, str | None]
+        ] = {}
+        self._change_streams: list[GdacsChangeStream] = []
+        # Entries and events of the previous update, while publishing changes.
+        self._previous_entries: dict[str, GdacsFeedEntry] = {}
+        self._previous_events: dict[str, GdacsEvent] = {}
+
+    async def update(self):
+        """Update the feed and then update connected entities."""
+        start = time.perf_counter()
+        status, feed_entries = await self._feed.update()
+        entities_start = time.perf_counter()
+        await self._update_from_feed(status, feed_entries)
+        self._metrics.duration("feed_update", entities_start - start)
+        self._metrics.duration("entities_update", time.perf_counter() - entities_start)
+
+    async def _update_from_feed(
+        self, status: str, feed_entries: list[GdacsFeedEntry] | None
+    ):
+        """Update connected entities from the result of a feed update."""
+        # Record current time of update.
+        self._last_update = datetime.now()
+        self._status = status
+        self._callback_errors = {}
+        count_created: int = 0
+        count_updated: int = 0
+        count_removed: int = 0
+        if status == UPDATE_OK_NOT_MODIFIED:
+            # Nothing to compare, entries are the same as in the last update.
+            _LOGGER.debug("Feed %s not modified since last update", self._feed)
+            self._last_update_successful = self._last_update
+            await self._status_update(status, 0, 0, 0)
+            return
+        await self._store_feed_entries(status, feed_entries)
+        if status == UPDATE_OK:
+            _LOGGER.debug("Data retrieved %s", feed_entries)
+            # Record current time of update.
+            self._last_update_successful = self._last_update
+            # For entity management the external ids from the feed are used.
+            feed_external_ids = {entry.external_id for entry in feed_entries}
+            count_removed = await self._update_feed_remove_entries(feed_external_ids)
+            count_updated = await self._update_feed_update_entries(feed_external_ids)
+            count_created = await self._update_feed_create_entries(feed_external_ids)
+            if self._update_changed_only:
+                self._store_event_versions(feed_entries)
+            if self._archive:
+                await self._record_archive()
+        elif status == UPDATE_OK_NO_DATA:
+            _LOGGER.debug("Update successful, but no data received from %s", self._feed)
+            # Record current time of update.
+            self._last_update_successful = self._last_update
+        else:
+            _LOGGER.warning(
+                "Update not successful, no data received from %s", self._feed
+            )
+            # Remove all entities.
+            count_removed = await self._update_feed_remove_entries(set())
+        self._previous_entries = {}
+        self._previous_events = {}
+        # Send status update to subscriber.
+        await self._status_update(status, count_created, count_updated, count_removed)
+
+    async def _record_archive(self):
+        """Archive new versions of all events, logging errors of the database."""
+        # Archive imports sqlite3 already, only import it if an archive is used.
+        import sqlite3  # noqa: PLC0415
+
+        events = list(self.events)
+        try:
+            # Writing to the database must not block the event loop.
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._archive.record, events, self._last_update
+            )
+        except sqlite3.Error as error:
+            _LOGGER.warning("Archiving events in %s failed: %s", self._archive, error)
+
+    async def _store_feed_entries(
+        self, status: str, feed_entries: list[GdacsFeedEntry] | None
+    ):
+        """Keep all feed entries for future lookups."""
+        if self._change_streams:
+            self._previous_entries = dict(self.feed_entries)
+            self._previous_events = {event.external_id: event for event in self.events}
+        await super()._store_feed_entries(status, feed_entries)
+        self._events_outdated = True
+
+    def _update_events(self):
+        """Bring events up to date with the feed entries of the last update.
+
+        Only entries whose version or alert level changed are decoded into
+        new events, all other events are kept.
+        """
+        if not self._events_outdated:
+            return
+        self._events_outdated = False
+        events = []
+        for entry in self.feed_entries.values():
+            event = self._events.get(entry.external_id)
+            if (
+                event is None
+                or event.version is None
+                or (event.version, event.alert_level)
+                != GdacsFeedManagerBase._event_version(entry)
+            ):
+                event = GdacsEvent.from_entry(entry)
+            events.append(event)
+        self._events.update(events)
+
+    async def _update_feed_update_entries(self, feed_external_ids: set[str]) -> int:
+        """Update entities after feed update."""
+        if not self._update_changed_only:
+            return await super()._update_feed_update_entries(feed_external_ids)
+        # Only update entities whose event's version or alert level changed.
+        update_external_ids: set[str] = {
+            external_id
+            for external_id in self._managed_external_ids.intersection(
+                feed_external_ids
+            )
+            if self._event_changed(self.feed_entries[external_id])
+        }
+        count_updated = len(update_external_ids)
+        await self._update_entities(update_external_ids)
+        return count_updated
+
+    async def _generate_new_entities(self, external_ids: set[str]):
+        """Generate new entities for events."""
+        await self._publish_changes(
+            EntryAdded(external_id, self.feed_entries[external_id])
+            for external_id in sorted(external_ids)
+        )
+        if not self._callback_dispatcher:
+            await super()._generate_new_entities(external_ids)
+            return
+        errors = await self._callback_dispatcher.dispatch(
+            self._generate_async_callback, external_ids
+        )
+        self._callback_errors.update(errors)
+        # Entities that failed to generate will be reported as new again.
+        self._managed_external_ids.update(external_ids.difference(errors))
+
+    async def _update_entities(self, external_ids: set[str]):
+        """Update entities."""
+        await self._publish_changes(
+            EntryUpdated(
+                external_id,
+                self.feed_entries[external_id],
+                self._changed_fields(external_id),
+            )
+            for external_id in sorted(external_ids)
+        )
+        if not self._callback_dispatcher:
+            await super()._update_entities(external_ids)
+            return
+        errors = await self._callback_dispatcher.dispatch(
+            self._update_async_callback, external_ids
+        )
+        self._callback_errors.update(errors)
+
+    async def _remove_entities(self, external_ids: set[str]):
+        """Remove entities."""
+        await self._publish_changes(
+            EntryRemoved(external_id, self._previous_entries.get(external_id))
+            for external_id in sorted(external_ids)
+        )
+        if not self._callback_dispatcher:
+            await super()._remove_entities(external_ids)
+            return
+        self._managed_external_ids.difference_update(external_ids)
+        errors = await self._callback_dispatcher.dispatch(
+            self._remove_async_callback, external_ids
+        )
+        self._callback_errors.update(errors)
+
+    def changes(
+        self, max_size: int = DEFAULT_MAX_SIZE, overflow: str = OVERFLOW_BLOCK
+    ) -> GdacsChangeStream:
+        """Return a new stream of all added, updated and removed entries.
+
+        The stream receives a change for each callback from now on, until
+        it is closed.
+        """
+        stream = GdacsChangeStream(max_size, overflow, self._change_streams.remove)
+        self._change_streams.append(stream)
+        return stream
+
+    async def _publish_changes(self, changes: Iterable[GdacsChange]):
+        """Add changes to all open change streams."""
+        if not self._change_streams:
+            return
+        changes = list(changes)
+        for stream in list(self._change_streams):
+            for change in changes:
+                await stream.put(change)
+
+    def _changed_fields(self, external_id: str) -> dict:
+        """Return fields of the entry's event changed since the last update."""
+        return changed_fields(
+            self._previous_events.get(external_id), self.events.get(external_id)
+        )
+
+    async def _status_update(
+        self, status: str, count_created: int, count_updated: int, count_removed: int
+    ):
+        """Record counts of the update and provide status update."""
+        self._metrics.count("created_entries", count_created)
+        self._metrics.count("updated_entries", count_updated)
+        self._metrics.count("removed_entries", count_removed)
+        await super()._status_update(
+            status, count_created, count_updated, count_removed
+        )
+
+    def save_snapshot(self, path: str | os.PathLike) -> int:
+        """Save managed events to the snapshot file, return number of events."""
+        records = []
+        for external_id in sorted(self._managed_external_ids):
+            entry = self.feed_entries.get(external_id)
+            if entry is not None:
+                records.append(
+                    SnapshotRecord(
+                        external_id,
+                        entry.event_type_short,
+                        entry.event_id,
+                        entry.version,
+                        entry.alert_level,
+                        self._last_update_successful,
+                    )
+                )
+            elif external_id in self._restored_records:
+                records.append(self._restored_records[external_id])
+        write_snapshot(path, records)
+        return len(records)
+
+    def load_snapshot(self, path: str | os.PathLike) -> int:
+        """Restore managed events from the snapshot file, return number of events.
+
+        Restored events are not reported as new in the next update.
+        """
+        try:
+            records = read_snapshot(path)
+        except FileNotFoundError:
+            _LOGGER.debug("No snapshot found at %s", path)
+            return 0
+        except ValueError as error:
+            _LOGGER.warning("Unable to load snapshot from %s: %s", path, error)
+            return 0
+        self._managed_external_ids = {record.external_id for record in records}
+        self._restored_records = {record.external_id: record for record in records}
+        self._event_versions = {
+            (record.event_type_short, record.event_id): (
+                record.version,
+                record.alert_level,
+            )
+            for record in records
+        }
+        return len(records)
+
+    def _store_event_versions(self, feed_entries: list[GdacsFeedEntry]):
+        """Keep version and alert level of all events for the next update."""
+        self._event_versions = {
+            GdacsFeedManagerBase._event_key(entry): GdacsFeedManagerBase._event_version(
+                entry
+            )
+            for entry in feed_entries
+        }
+
+    def _event_changed(self, entry: GdacsFeedEntry) -> bool:
+        """Check if entry differs from the event in the last feed update."""
+        key = GdacsFeedManagerBase._event_key(entry)
+        if key not in self._event_versions:
+            return True
+        return self._event_versions[key] != GdacsFeedManagerBase._event_version(entry)
+
+    @staticmethod
+    def _event_key(entry: GdacsFeedEntry) -> tuple[str | None, int | None]:
+        """Return the key identifying the entry's event."""
+        return entry.event_type_short, entry.event_id
+
+    @staticmethod
+    def _event_version(entry: GdacsFeedEntry) -> tuple[int | None, str | None]:
+        """Return the version and alert level of the entry's event."""
+        return entry.version, entry.alert_level
+
+    @property
+    def archive(self) -> GdacsArchive | None:
+        """Return the archive of event versions, if any."""
+        return self._archive
+
+    @property
+    def callback_errors(self) -> dict[str, Exception]:
+        """Return errors of failed callbacks in the last update by external id."""
+        return self._callback_errors
+
+    @property
+    def events(self) -> GdacsEventStore:
+        """Return the store of all events in the last feed update."""
+        self._update_events()
+        return self._events
+
+    @property
+    def feed(self) -> GeoRssFeed[GdacsFeedEntry] | GdacsMultiFeed:
+        """Return the feed of this feed manager."""
+        return self._feed
+
+    @property
+    def status(self) -> str | None:
+        """Return the status of the last update."""
+        return self._status
+
+
+class GdacsFeedManager(GdacsFeedManagerBase):
     """Feed Manager for GDACS feed."""
 
     def __init__(
@@ -24,6 +419,19 @@ class GdacsFeedManager(FeedManagerBase):
         filter_radius: float | None = None,
         filter_categories: list[str] | None = None,
         status_async_callback: Callable[[StatusUpdate], Awaitable[None]] | None = None,
+        streaming_parser: bool = False,
+        conditional_requests: bool = False,
+        skip_unchanged_content: bool = False,
+        skip_unchanged_pub_date: bool = False,
+        update_changed_only: bool = False,
+        callback_concurrency: int | None = None,
+        callback_timeout: float | None = None,
+        url: str = URL,
+        fetcher: GdacsFetcher | None = None,
+        metrics: GdacsMetrics | None = None,
+        executor: Executor | None = None,
+        cache: GdacsCache | None = None,
+        archive: GdacsArchive | None = None,
     ):
         """Initialize the GDACS Feed Manager."""
         feed = GdacsFeed(
@@ -31,11 +439,80 @@ class GdacsFeedManager(FeedManagerBase):
             coordinates,
             filter_radius=filter_radius,
             filter_categories=filter_categories,
+            streaming_parser=streaming_parser,
+            conditional_requests=conditional_requests,
+            skip_unchanged_content=skip_unchanged_content,
+            skip_unchanged_pub_date=skip_unchanged_pub_date,
+            url=url,
+            fetcher=fetcher,
+            metrics=metrics,
+            executor=executor,
+            cache=cache,
         )
         super().__init__(
             feed,
             generate_async_callback,
             update_async_callback,
             remove_async_callback,
-            status_async_callback,
+            status_async_callback=status_async_callback,
+            update_changed_only=update_changed_only,
+            callback_concurrency=callback_concurrency,
+            callback_timeout=callback_timeout,
+            metrics=metrics,
+            archive=archive,
+        )
+
+
+class GdacsMultiFeedManager(GdacsFeedManagerBase):
+    """Feed Manager for multiple GDACS feeds."""
+
+    def __init__(
+        self,
+        websession: ClientSession,
+        generate_async_callback: Callable[[str], Awaitable[None]],
+        update_async_callback: Callable[[str], Awaitable[None]],
+        remove_async_callback: Callable[[str], Awaitable[None]],
+        coordinates: tuple[float, float],
+        urls: Sequence[str],
+        filter_radius: float | None = None,
+        filter_categories: list[str] | None = None,
+        status_async_callback: Callable[[StatusUpdate], Awaitable[None]] | None = None,
+        streaming_parser: bool = False,
+        conditional_requests: bool = False,
+        skip_unchanged_content: bool = False,
+        skip_unchanged_pub_date: bool = True,
+        update_changed_only: bool = False,
+        callback_concurrency: int | None = None,
+        callback_timeout: float | None = None,
+        metrics: GdacsMetrics | None = None,
+        executor: Executor | None = None,
+        cache: GdacsCache | None = None,
+        archive: GdacsArchive | None = None,
+    ):
+        """Initialize the GDACS Multi Feed Manager."""
+        feed = GdacsMultiFeed(
+            websession,
+            coordinates,
+            urls,
+            filter_radius=filter_radius,
+            filter_categories=filter_categories,
+            streaming_parser=streaming_parser,
+            conditional_requests=conditional_requests,
+            skip_unchanged_content=skip_unchanged_content,
+            skip_unchanged_pub_date=skip_unchanged_pub_date,
+            metrics=metrics,
+            executor=executor,
+            cache=cache,
+        )
+        super().__init__(
+            feed,
+            generate_async_callback,
+            update_async_callback,
+            remove_async_callback,
+            status_async_callback=status_async_callback,
+            update_changed_only=update_changed_only,
+            callback_concurrency=callback_concurrency,
+            callback_timeout=callback_timeout,
+            metrics=metrics,
+            archive=archive,
         )
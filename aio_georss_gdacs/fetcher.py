@@ -0,0 +1,242 @@
+"""Fetchers retrieving GDACS feeds."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from http import HTTPStatus
+import json
+import logging
+import os
+import time
+
+import aiohttp
+from aiohttp import ClientSession
+from multidict import CIMultiDict, CIMultiDictProxy
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = "utf-8"
+XML_SUFFIX = ".xml"
+METADATA_SUFFIX = ".json"
+
+
+@dataclass(frozen=True, slots=True)
+class FeedResponse:
+    """Response to a feed request."""
+
+    status: int
+    headers: CIMultiDictProxy[str] | CIMultiDict[str]
+    body: bytes
+    encoding: str = DEFAULT_ENCODING
+
+
+class GdacsFetcher(ABC):
+    """Base class of fetchers retrieving the raw feed."""
+
+    @abstractmethod
+    async def fetch(
+        self,
+        url: str,
+        method: str = "GET",
+        headers: Mapping[str, str] | None = None,
+        params: Mapping[str, str] | None = None,
+    ) -> FeedResponse:
+        """Fetch the feed, raise ClientError or TimeoutError if unsuccessful."""
+
+
+class HttpFetcher(GdacsFetcher):
+    """Fetcher retrieving the feed over HTTP."""
+
+    def __init__(self, websession: ClientSession, timeout: float | None = None):
+        """Initialise the fetcher."""
+        self._websession: ClientSession = websession
+        self._timeout: float | None = timeout
+
+    def __repr__(self):
+        """Return string representation of this fetcher."""
+        return f"<{self.__class__.__name__}(timeout={self._timeout})>"
+
+    async def fetch(
+        self,
+        url: str,
+        method: str = "GET",
+        headers: Mapping[str, str] | None = None,
+        params: Mapping[str, str] | None = None,
+    ) -> FeedResponse:
+        """Fetch the feed, raise ClientError or TimeoutError if unsuccessful."""
+        timeout = aiohttp.ClientTimeout(total=self._timeout)
+        async with self._websession.request(
+            method, url, headers=headers, params=params, timeout=timeout
+        ) as response:
+            if response.status == HTTPStatus.NOT_MODIFIED:
+                return FeedResponse(response.status, response.headers, b"")
+            body = await response.read()
+            return FeedResponse(
+                response.status, response.headers, body, response.get_encoding()
+            )
+
+
+class ReplayFetcher(GdacsFetcher):
+    """Fetcher replaying recorded responses from a directory.
+
+    Every request is answered with the next XML file in the directory, in
+    order of their names, starting over after the last one. Status and
+    headers are taken from a JSON file with the same name if present, as
+    written by the recording fetcher. Files are read outside of the event
+    loop, and no network requests are made.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        delay: float = 0.0,
+        recorded_delay: bool = False,
+        repeat: bool = True,
+        sleep: Callable[[float], Awaitable] = asyncio.sleep,
+    ):
+        """Initialise the fetcher.
+
+        Each response is delayed by the provided seconds, or by the time the
+        recorded request took if recorded_delay is set.
+        """
+        self._directory: str = os.fspath(directory)
+        self._files: list[str] = sorted(
+            name for name in os.listdir(directory) if name.endswith(XML_SUFFIX)
+        )
+        if not self._files:
+            raise ValueError(f"No {XML_SUFFIX} files found in {self._directory}")
+        self._delay: float = delay
+        self._recorded_delay: bool = recorded_delay
+        self._repeat: bool = repeat
+        self._sleep: Callable[[float], Awaitable] = sleep
+        self._index: int = 0
+
+    def __repr__(self):
+        """Return string representation of this fetcher."""
+        return (
+            f"<{self.__class__.__name__}(directory={self._directory}, "
+            f"files={len(self._files)})>"
+        )
+
+    async def fetch(
+        self,
+        url: str,
+        method: str = "GET",
+        headers: Mapping[str, str] | None = None,
+        params: Mapping[str, str] | None = None,
+    ) -> FeedResponse:
+        """Return the next recorded response."""
+        if self._index >= len(self._files):
+            if not self._repeat:
+                raise aiohttp.ClientConnectionError(
+                    f"No more recorded responses in {self._directory}"
+                )
+            self._index = 0
+        name = self._files[self._index]
+        self._index += 1
+        path = os.path.join(self._directory, name)
+        body, metadata = await asyncio.get_running_loop().run_in_executor(
+            None, _read_recording, path
+        )
+        delay = metadata.get("elapsed", 0.0) if self._recorded_delay else self._delay
+        if delay:
+            await self._sleep(delay)
+        _LOGGER.debug("Replaying %s for %s", path, url)
+        return FeedResponse(
+            metadata.get("status", HTTPStatus.OK),
+            CIMultiDict(metadata.get("headers", {})),
+            body,
+            metadata.get("encoding", DEFAULT_ENCODING),
+        )
+
+
+class RecordingFetcher(GdacsFetcher):
+    """Fetcher recording responses of another fetcher into a directory.
+
+    Each response body is stored as a numbered XML file, along with a JSON
+    file holding URL, status, headers, encoding and the time the request
+    took, so that the directory can be replayed later. Files are written
+    outside of the event loop.
+    """
+
+    def __init__(self, fetcher: GdacsFetcher, directory: str | os.PathLike):
+        """Initialise the fetcher."""
+        self._fetcher: GdacsFetcher = fetcher
+        self._directory: str = os.fspath(directory)
+        os.makedirs(self._directory, exist_ok=True)
+        # Continue after the highest recording, not to overwrite any.
+        self._count: int = max(
+            (
+                int(name[: -len(XML_SUFFIX)])
+                for name in os.listdir(directory)
+                if name.endswith(XML_SUFFIX) and name[: -len(XML_SUFFIX)].isdigit()
+            ),
+            default=0,
+        )
+
+    def __repr__(self):
+        """Return string representation of this fetcher."""
+        return (
+            f"<{self.__class__.__name__}(fetcher={self._fetcher}, "
+            f"directory={self._directory})>"
+        )
+
+    async def fetch(
+        self,
+        url: str,
+        method: str = "GET",
+        headers: Mapping[str, str] | None = None,
+        params: Mapping[str, str] | None = None,
+    ) -> FeedResponse:
+        """Fetch the feed with the other fetcher and record the response."""
+        start = time.monotonic()
+        response = await self._fetcher.fetch(url, method, headers, params)
+        elapsed = time.monotonic() - start
+        self._count += 1
+        path = os.path.join(self._directory, f"{self._count:06d}")
+        metadata = {
+            "url": url,
+            "status": response.status,
+            # Pairs of name and value, headers may be repeated.
+            "headers": list(response.headers.items()),
+            "encoding": response.encoding,
+            "elapsed": round(elapsed, 3),
+        }
+        await asyncio.get_running_loop().run_in_executor(
+            None, _write_recording, path, response.body, metadata
+        )
+        return response
+
+
+def _write_recording(path: str, body: bytes, metadata: dict):
+    """Write body and metadata of a recorded response."""
+    with open(path + XML_SUFFIX, "wb") as file:
+        file.write(body)
+    with open(path + METADATA_SUFFIX, "w", encoding="utf-8") as file:
+        json.dump(metadata, file, indent=2)
+
+
+def _read_recording(path: str) -> tuple[bytes, dict]:
+    """Read body and metadata of a recorded response."""
+    with open(path, "rb") as file:
+        body = file.read()
+    return body, _read_metadata(path[: -len(XML_SUFFIX)] + METADATA_SUFFIX)
+
+
+def _read_metadata(path: str) -> dict:
+    """Read metadata of a recorded response, if available and valid."""
+    try:
+        with open(path, encoding="utf-8") as file:
+            metadata = json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as error:
+        _LOGGER.warning("Unable to read metadata %s: %s", path, error)
+        return {}
+    if not isinstance(metadata, dict):
+        _LOGGER.warning("Unable to read metadata %s: not an object", path)
+        return {}
+    return metadata
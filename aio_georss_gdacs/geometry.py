@@ -0,0 +1,164 @@
+"""Compact geometries of GDACS feed entries."""
+
+from __future__ import annotations
+
+from array import array
+import logging
+import math
+
+from .consts import AVERAGE_EARTH_RADIUS, XML_TEXT
+
+_LOGGER = logging.getLogger(__name__)
+
+# Points on a polygon's boundary are moved by this much to avoid ambiguity.
+BOUNDARY_OFFSET = 0.00000001
+
+
+def decode_coordinates(value: str | dict | tuple) -> array:
+    """Decode coordinates into a flat array of latitudes and longitudes.
+
+    Values are either whitespace separated text or numbers already parsed
+    by the XML parser. An unpaired last number is dropped.
+    """
+    if isinstance(value, dict):
+        value = value.get(XML_TEXT, "")
+    try:
+        if isinstance(value, str):
+            coordinates = array("d", map(float, value.split()))
+        else:
+            coordinates = array("d", value)
+    except (TypeError, ValueError) as error:
+        _LOGGER.warning("Unable to decode coordinates %s: %s", value, error)
+        return array("d")
+    if len(coordinates) % 2:
+        del coordinates[-1]
+    return coordinates
+
+
+def centroid(coordinates: array) -> tuple[float, float]:
+    """Return the average of all coordinates (latitude, longitude)."""
+    count = len(coordinates) // 2
+    return sum(coordinates[0::2]) / count, sum(coordinates[1::2]) / count
+
+
+def distance(
+    home_coordinates: tuple[float, float], latitude: float, longitude: float
+) -> float:
+    """Return the great circle distance in km to the coordinates."""
+    # Same calculation as the haversine library, without its range checks.
+    latitude = math.radians(latitude)
+    longitude = math.radians(longitude)
+    home_latitude = math.radians(home_coordinates[0])
+    home_longitude = math.radians(home_coordinates[1])
+    delta_latitude = home_latitude - latitude
+    delta_longitude = home_longitude - longitude
+    haversine = (
+        math.sin(delta_latitude * 0.5) ** 2
+        + math.cos(latitude)
+        * math.cos(home_latitude)
+        * math.sin(delta_longitude * 0.5) ** 2
+    )
+    return AVERAGE_EARTH_RADIUS * (2 * math.asin(math.sqrt(haversine)))
+
+
+def distance_to_points(home_coordinates: tuple[float, float], points: array) -> float:
+    """Return the distance in km to the closest of the points."""
+    return min(
+        (
+            distance(home_coordinates, points[index], points[index + 1])
+            for index in range(0, len(points), 2)
+        ),
+        default=math.inf,
+    )
+
+
+def distance_to_polygon(home_coordinates: tuple[float, float], polygon: array) -> float:
+    """Return the distance in km to the polygon, 0 if inside of it.
+
+    Same as the distance to a polygon of the GeoRSS client: the closest of
+    its points and of the perpendicular points on its edges.
+    """
+    if is_inside(polygon, home_coordinates):
+        return 0.0
+    result = distance_to_points(home_coordinates, polygon)
+    for index in range(2, len(polygon), 2):
+        perpendicular = _perpendicular_point(
+            home_coordinates,
+            polygon[index - 2],
+            polygon[index - 1],
+            polygon[index],
+            polygon[index + 1],
+        )
+        if perpendicular is not None:
+            result = min(result, distance(home_coordinates, *perpendicular))
+    return result
+
+
+def is_inside(polygon: array, coordinates: tuple[float, float]) -> bool:
+    """Check if the coordinates are inside the polygon, using ray casting."""
+    crossings = 0
+    for index in range(2, len(polygon), 2):
+        if _ray_crosses_segment(
+            coordinates,
+            polygon[index - 2],
+            polygon[index - 1],
+            polygon[index],
+            polygon[index + 1],
+        ):
+            crossings += 1
+    return crossings % 2 == 1
+
+
+def _ray_crosses_segment(
+    coordinates: tuple[float, float], ay: float, ax: float, by: float, bx: float
+) -> bool:
+    """Check if a ray from the coordinates crosses the edge from a to b."""
+    py, px = coordinates
+    if ay > by:
+        ax, ay, bx, by = bx, by, ax, ay
+    # Alter longitude to cater for 180 degree crossings.
+    if px < 0:
+        px += 360.0
+    if ax < 0:
+        ax += 360.0
+    if bx < 0:
+        bx += 360.0
+    if py in (ay, by):
+        py += BOUNDARY_OFFSET
+    if (py > by or py < ay) or (px > max(ax, bx)):
+        return False
+    if px < min(ax, bx):
+        return True
+    red = ((by - ay) / (bx - ax)) if (ax != bx) else math.inf
+    blue = ((py - ay) / (px - ax)) if (ax != px) else math.inf
+    return blue >= red
+
+
+def _perpendicular_point(
+    coordinates: tuple[float, float], ay: float, ax: float, by: float, bx: float
+) -> tuple[float, float] | None:
+    """Return the perpendicular point on the edge from a to b, if any."""
+    # Both ends of the edge are the same point.
+    if ay == by and ax == bx:
+        return None
+    py, px = coordinates
+    # Alter longitude to cater for 180 degree crossings.
+    if px < 0:
+        px += 360.0
+    if ax < 0:
+        ax += 360.0
+    if bx < 0:
+        bx += 360.0
+    if ay > by or ax > bx:
+        ax, ay, bx, by = bx, by, ax, ay
+    dx = abs(bx - ax)
+    dy = abs(by - ay)
+    shortest_length = ((dx * (px - ax)) + (dy * (py - ay))) / ((dx * dx) + (dy * dy))
+    rx = ax + dx * shortest_length
+    ry = ay + dy * shortest_length
+    if bx >= rx >= ax and by >= ry >= ay:
+        if rx > 180:
+            # Correct longitude.
+            rx -= 360.0
+        return ry, rx
+    return None
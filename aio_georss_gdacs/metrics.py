@@ -0,0 +1,113 @@
+"""Metrics of GDACS feed and feed manager updates."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+import functools
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PREFIX = "gdacs"
+
+
+class GdacsMetrics:
+    """Metrics sink ignoring all measurements.
+
+    Feeds report the durations of the stages "fetch", "parse", "entries"
+    (creating feed entries) and "filter", and the counts "response_bytes",
+    "entries" and "filtered_entries". Feed managers report the durations
+    "feed_update", "entities_update" (comparing entries and running
+    callbacks) and of each "generate_callback", "update_callback" and
+    "remove_callback", and the counts "created_entries", "updated_entries"
+    and "removed_entries".
+    """
+
+    def __repr__(self):
+        """Return string representation of this sink."""
+        return f"<{self.__class__.__name__}()>"
+
+    def duration(self, name: str, seconds: float) -> None:
+        """Record the duration of a stage or callback."""
+
+    def count(self, name: str, value: int) -> None:
+        """Record a count of one update."""
+
+
+class LoggingMetrics(GdacsMetrics):
+    """Metrics sink logging all measurements."""
+
+    def __init__(
+        self, logger: logging.Logger | None = None, level: int = logging.DEBUG
+    ):
+        """Initialise the sink."""
+        self._logger: logging.Logger = logger or _LOGGER
+        self._level: int = level
+
+    def duration(self, name: str, seconds: float) -> None:
+        """Log the duration of a stage or callback."""
+        self._logger.log(self._level, "Duration of %s: %.3fms", name, seconds * 1000)
+
+    def count(self, name: str, value: int) -> None:
+        """Log a count of one update."""
+        self._logger.log(self._level, "Count of %s: %d", name, value)
+
+
+class PrometheusMetrics(GdacsMetrics):
+    """Metrics sink aggregating measurements for a Prometheus scrape.
+
+    Durations are exported as summaries in seconds and counts as counters
+    summed over all updates, in OpenMetrics text format.
+    """
+
+    def __init__(self, prefix: str = DEFAULT_PREFIX):
+        """Initialise the sink."""
+        self._prefix: str = prefix
+        # Number and sum of durations by name.
+        self._durations: dict[str, tuple[int, float]] = {}
+        self._counts: dict[str, int] = {}
+
+    def __repr__(self):
+        """Return string representation of this sink."""
+        return f"<{self.__class__.__name__}(prefix={self._prefix})>"
+
+    def duration(self, name: str, seconds: float) -> None:
+        """Add the duration of a stage or callback."""
+        count, total = self._durations.get(name, (0, 0.0))
+        self._durations[name] = (count + 1, total + seconds)
+
+    def count(self, name: str, value: int) -> None:
+        """Add a count of one update."""
+        self._counts[name] = self._counts.get(name, 0) + value
+
+    def export(self) -> str:
+        """Return all metrics in OpenMetrics text format."""
+        lines = []
+        for name, (count, total) in sorted(self._durations.items()):
+            metric = f"{self._prefix}_{name}_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            lines.append(f"{metric}_count {count}")
+            lines.append(f"{metric}_sum {total}")
+        for name, value in sorted(self._counts.items()):
+            metric = f"{self._prefix}_{name}"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}_total {value}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def timed_callback(
+    metrics: GdacsMetrics, name: str, callback: Callable[[str], Awaitable[None]]
+) -> Callable[[str], Awaitable[None]]:
+    """Wrap callback to record the duration of each call."""
+
+    @functools.wraps(callback)
+    async def _callback(external_id: str) -> None:
+        start = time.perf_counter()
+        try:
+            await callback(external_id)
+        finally:
+            metrics.duration(name, time.perf_counter() - start)
+
+    return _callback
@@ -0,0 +1,169 @@
+"""Multiple GDACS feeds."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from datetime import datetime
+import logging
+from typing import TYPE_CHECKING
+
+from aio_georss_client.consts import UPDATE_ERROR, UPDATE_OK, UPDATE_OK_NO_DATA
+from aiohttp import ClientSession
+
+from .consts import UPDATE_OK_NOT_MODIFIED
+from .event import GdacsEvent
+from .feed import GdacsFeed
+from .feed_entry import GdacsFeedEntry
+from .metrics import GdacsMetrics
+
+if TYPE_CHECKING:
+    from .cache import GdacsCache
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GdacsMultiFeed:
+    """Multiple GDACS feeds, for example the 24 hour and 7 day feeds.
+
+    All feeds are fetched concurrently over the same web session and their
+    entries are combined, keeping only the highest version of each event.
+    Feeds are not parsed again while their publication date is unchanged.
+    While some of the feeds fail, their entries of the last successful
+    update are used.
+    """
+
+    def __init__(
+        self,
+        websession: ClientSession,
+        home_coordinates: tuple[float, float],
+        urls: Sequence[str],
+        filter_radius: float | None = None,
+        filter_categories: list[str] | None = None,
+        streaming_parser: bool = False,
+        conditional_requests: bool = False,
+        skip_unchanged_content: bool = False,
+        skip_unchanged_pub_date: bool = True,
+        metrics: GdacsMetrics | None = None,
+        executor: Executor | None = None,
+        cache: GdacsCache | None = None,
+    ):
+        """Initialise this service."""
+        self._home_coordinates: tuple[float, float] = home_coordinates
+        self._filter_radius: float | None = filter_radius
+        self._filter_categories: list[str] | None = filter_categories
+        self._feeds: list[GdacsFeed] = [
+            GdacsFeed(
+                websession,
+                home_coordinates,
+                filter_radius=filter_radius,
+                filter_categories=filter_categories,
+                streaming_parser=streaming_parser,
+                conditional_requests=conditional_requests,
+                skip_unchanged_content=skip_unchanged_content,
+                skip_unchanged_pub_date=skip_unchanged_pub_date,
+                url=url,
+                metrics=metrics,
+                executor=executor,
+                cache=cache,
+            )
+            for url in urls
+        ]
+        # Entries of each feed's last successful update.
+        self._feed_entries: list[list[GdacsFeedEntry] | None] = [None] * len(
+            self._feeds
+        )
+        self._last_entries: list[GdacsFeedEntry] | None = None
+
+    def __repr__(self):
+        """Return string representation of this feed."""
+        return (
+            f"<{self.__class__.__name__}(home={self._home_coordinates}, "
+            f"urls={[feed.url for feed in self._feeds]}, "
+            f"radius={self._filter_radius}, categories={self._filter_categories})>"
+        )
+
+    async def update(self) -> tuple[str, list[GdacsFeedEntry] | None]:
+        """Update all feeds and return their combined filtered entries."""
+        results = await asyncio.gather(*(feed.update() for feed in self._feeds))
+        statuses = {status for status, _ in results}
+        if statuses == {UPDATE_OK_NOT_MODIFIED}:
+            # None of the feeds has changed since last update.
+            return UPDATE_OK_NOT_MODIFIED, self._last_entries
+        if not statuses & {UPDATE_OK, UPDATE_OK_NOT_MODIFIED}:
+            self._feed_entries = [None] * len(self._feeds)
+            self._last_entries = None
+            if UPDATE_OK_NO_DATA in statuses:
+                return UPDATE_OK_NO_DATA, None
+            return UPDATE_ERROR, None
+        for index, (status, entries) in enumerate(results):
+            if status in (UPDATE_OK, UPDATE_OK_NOT_MODIFIED) and entries is not None:
+                self._feed_entries[index] = entries
+        if UPDATE_ERROR in statuses:
+            # Entries of failed feeds are kept until they recover, so that
+            # their events are not removed and added again.
+            _LOGGER.warning(
+                "Update not successful, keeping last entries of %s",
+                [
+                    feed.url
+                    for feed, (status, _) in zip(self._feeds, results, strict=True)
+                    if status == UPDATE_ERROR
+                ],
+            )
+        if UPDATE_OK not in statuses and self._last_entries is not None:
+            # Feeds have either not changed or kept their last entries.
+            return UPDATE_OK_NOT_MODIFIED, self._last_entries
+        self._last_entries = GdacsMultiFeed._deduplicate(
+            entry for entries in self._feed_entries if entries for entry in entries
+        )
+        return UPDATE_OK, self._last_entries
+
+    async def update_events(self) -> tuple[str, list[GdacsEvent] | None]:
+        """Update all feeds and return their combined filtered events."""
+        status, entries = await self.update()
+        if entries is None:
+            return status, None
+        return status, [GdacsEvent.from_entry(entry) for entry in entries]
+
+    @staticmethod
+    def _deduplicate(entries) -> list[GdacsFeedEntry]:
+        """Keep only the entry with the highest version of each event."""
+        unique_entries: dict = {}
+        for entry in entries:
+            key = (
+                (entry.event_type_short, entry.event_id)
+                if entry.event_id is not None
+                else entry.external_id
+            )
+            existing = unique_entries.get(key)
+            if existing is None or (entry.version or 0) > (existing.version or 0):
+                unique_entries[key] = entry
+        return list(unique_entries.values())
+
+    @property
+    def feeds(self) -> list[GdacsFeed]:
+        """Return the individual feeds."""
+        return list(self._feeds)
+
+    @property
+    def published(self) -> datetime | None:
+        """Return the latest publication date of any feed."""
+        dates = [feed.published for feed in self._feeds if feed.published is not None]
+        return max(dates, default=None)
+
+    @property
+    def max_age(self) -> float | None:
+        """Return the shortest time any of the last responses may be cached."""
+        max_ages = [feed.max_age for feed in self._feeds if feed.max_age is not None]
+        return min(max_ages, default=None)
+
+    @property
+    def last_timestamp(self) -> datetime | None:
+        """Return the last timestamp extracted from any feed."""
+        timestamps = [
+            feed.last_timestamp
+            for feed in self._feeds
+            if feed.last_timestamp is not None
+        ]
+        return max(timestamps, default=None)
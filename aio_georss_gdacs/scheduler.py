@@ -0,0 +1,190 @@
+"""Adaptive update scheduler for GDACS feed managers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import contextlib
+import logging
+import random
+import time
+
+from aio_georss_client.consts import UPDATE_ERROR, UPDATE_OK
+
+from .feed_manager import GdacsFeedManagerBase
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MIN_INTERVAL = 60.0
+DEFAULT_MAX_INTERVAL = 1800.0
+DEFAULT_INITIAL_INTERVAL = 300.0
+# Interval is multiplied by these factors after updates with and without
+# changed events.
+CHANGED_FACTOR = 0.5
+UNCHANGED_FACTOR = 1.5
+# Delay after the expected publication of the feed before polling.
+PUBLICATION_GRACE = 10.0
+# Backoff stops doubling the interval after this many consecutive errors.
+MAX_BACKOFF_EXPONENT = 32
+
+
+class GdacsUpdateScheduler:
+    """Adaptive update scheduler for GDACS feed managers.
+
+    The interval until the next update shrinks while events are added or
+    change their version, and grows while the feed stays the same. Updates
+    are moved forward to shortly after the feed is expected to be published
+    again, based on the interval between its last publication dates, but
+    are not scheduled before the last response expires according to its
+    cache headers. After errors the interval grows exponentially with
+    random jitter. Clock, sleep and random number generator can be replaced,
+    for example in tests.
+    """
+
+    def __init__(
+        self,
+        feed_manager: GdacsFeedManagerBase,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable] = asyncio.sleep,
+        random_number: Callable[[], float] = random.random,
+    ):
+        """Initialise the scheduler."""
+        if not 0 < min_interval <= initial_interval <= max_interval:
+            raise ValueError(
+                "Intervals must satisfy 0 < min_interval <= initial_interval "
+                f"<= max_interval, got {min_interval}, {initial_interval}, "
+                f"{max_interval}"
+            )
+        self._feed_manager: GdacsFeedManagerBase = feed_manager
+        self._min_interval: float = min_interval
+        self._max_interval: float = max_interval
+        self._interval: float = initial_interval
+        self._clock: Callable[[], float] = clock
+        self._sleep: Callable[[float], Awaitable] = sleep
+        self._random_number: Callable[[], float] = random_number
+        self._errors: int = 0
+        self._versions: dict | None = None
+        self._published: float | None = None
+        self._publication_interval: float | None = None
+        self._next_interval: float | None = None
+        self._task: asyncio.Task | None = None
+
+    def __repr__(self):
+        """Return string representation of this scheduler."""
+        return (
+            f"<{self.__class__.__name__}(feed_manager={self._feed_manager}, "
+            f"interval={self._next_interval})>"
+        )
+
+    async def update(self) -> float:
+        """Update the feed manager and return seconds until the next update."""
+        await self._feed_manager.update()
+        status = self._feed_manager.status
+        if status == UPDATE_ERROR:
+            self._errors += 1
+            self._next_interval = self._backoff()
+        else:
+            self._errors = 0
+            self._next_interval = self._adapt(status)
+        _LOGGER.debug(
+            "Next update of %s in %ss", self._feed_manager, self._next_interval
+        )
+        return self._next_interval
+
+    async def run(self):
+        """Update the feed manager repeatedly until cancelled.
+
+        Updates raising an exception are logged and retried like failed
+        updates.
+        """
+        while True:
+            try:
+                interval = await self.update()
+            except Exception:
+                self._errors += 1
+                self._next_interval = interval = self._backoff()
+                _LOGGER.exception(
+                    "Updating %s failed, retrying in %ss", self._feed_manager, interval
+                )
+            await self._sleep(interval)
+
+    def start(self) -> asyncio.Task:
+        """Start updating the feed manager in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self):
+        """Stop updating the feed manager in the background."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def _adapt(self, status: str | None) -> float:
+        """Return the interval after a successful update."""
+        if status == UPDATE_OK and self._events_changed():
+            self._interval = max(self._interval * CHANGED_FACTOR, self._min_interval)
+        else:
+            self._interval = min(self._interval * UNCHANGED_FACTOR, self._max_interval)
+        interval = self._interval
+        next_publication = self._next_publication()
+        if next_publication is not None:
+            until_publication = next_publication + PUBLICATION_GRACE - self._clock()
+            if 0 < until_publication < interval:
+                interval = until_publication
+        max_age = self._feed_manager.feed.max_age
+        if max_age is not None:
+            interval = max(interval, max_age)
+        return min(max(interval, self._min_interval), self._max_interval)
+
+    def _backoff(self) -> float:
+        """Return the interval after consecutive errors."""
+        exponent = min(self._errors - 1, MAX_BACKOFF_EXPONENT)
+        interval = min(self._min_interval * 2**exponent, self._max_interval)
+        # Random jitter spreads out clients that failed at the same time, by
+        # up to half the interval, but not below the minimum interval.
+        earliest = max(interval / 2, self._min_interval)
+        interval = earliest + self._random_number() * interval / 2
+        return min(interval, self._max_interval)
+
+    def _events_changed(self) -> bool:
+        """Check if events were added or changed their version."""
+        versions = {
+            (entry.event_type_short, entry.event_id): entry.version
+            for entry in self._feed_manager.feed_entries.values()
+        }
+        previous_versions, self._versions = self._versions, versions
+        if previous_versions is None:
+            return False
+        return any(
+            key not in previous_versions or previous_versions[key] != version
+            for key, version in versions.items()
+        )
+
+    def _next_publication(self) -> float | None:
+        """Return the time the feed is expected to be published again."""
+        published = self._feed_manager.feed.published
+        if published is None:
+            return None
+        timestamp = published.timestamp()
+        if self._published is not None and timestamp > self._published:
+            self._publication_interval = timestamp - self._published
+        self._published = timestamp
+        if self._publication_interval is None:
+            return None
+        return timestamp + self._publication_interval
+
+    @property
+    def next_interval(self) -> float | None:
+        """Return seconds until the next update, as of the last update."""
+        return self._next_interval
+
+    @property
+    def errors(self) -> int:
+        """Return the number of consecutive failed updates."""
+        return self._errors
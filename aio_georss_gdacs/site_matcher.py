@@ -0,0 +1,136 @@
+"""Bulk matching of GDACS events against many sites."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .consts import AVERAGE_EARTH_RADIUS
+from .event import GdacsEvent
+from .feed_entry import GdacsFeedEntry
+
+# Number of sites processed at once, limits the size of temporary arrays.
+CHUNK_SIZE = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class SiteMatch:
+    """Event within the radius of a site."""
+
+    site: int
+    event: int
+    distance: float
+
+
+def match_sites(
+    sites: Sequence[tuple[float, float]],
+    radii: Sequence[float] | float,
+    events: Sequence[GdacsFeedEntry | GdacsEvent],
+) -> list[SiteMatch]:
+    """Return all events within the radius of each site.
+
+    Sites are coordinates (tuple of latitude/longitude), with either one
+    radius in km per site or the same radius for all sites. Distances are
+    measured to each event's coordinates, and events without coordinates
+    never match. Matches refer to sites and events by their index and are
+    ordered by site, then event.
+    """
+    if isinstance(radii, int | float):
+        radii = [float(radii)] * len(sites)
+    if len(radii) != len(sites):
+        raise ValueError(
+            f"Expected {len(sites)} radii for {len(sites)} sites, got {len(radii)}"
+        )
+    event_indexes = [
+        index for index, event in enumerate(events) if event.coordinates is not None
+    ]
+    event_coordinates = [events[index].coordinates for index in event_indexes]
+    if not sites or not event_indexes:
+        return []
+    if np is not None:
+        matches = _match_numpy(sites, radii, event_coordinates)
+    else:
+        matches = _match_array(sites, radii, event_coordinates)
+    return [
+        SiteMatch(site, event_indexes[event], distance)
+        for site, event, distance in matches
+    ]
+
+
+def _match_numpy(
+    sites: Sequence[tuple[float, float]],
+    radii: Sequence[float],
+    event_coordinates: list[tuple[float, float]],
+) -> list[tuple[int, int, float]]:
+    """Match sites and events with NumPy, one chunk of sites at a time."""
+    site_coordinates = np.radians(np.asarray(sites, dtype=np.float64))
+    site_radii = np.asarray(radii, dtype=np.float64)
+    event_latitudes, event_longitudes = np.radians(
+        np.asarray(event_coordinates, dtype=np.float64)
+    ).T
+    event_latitudes_cos = np.cos(event_latitudes)
+    matches = []
+    for start in range(0, len(site_coordinates), CHUNK_SIZE):
+        chunk = site_coordinates[start : start + CHUNK_SIZE]
+        latitudes = chunk[:, 0, np.newaxis]
+        longitudes = chunk[:, 1, np.newaxis]
+        haversine = (
+            np.sin((event_latitudes - latitudes) / 2) ** 2
+            + np.cos(latitudes)
+            * event_latitudes_cos
+            * np.sin((event_longitudes - longitudes) / 2) ** 2
+        )
+        distances = (
+            2 * AVERAGE_EARTH_RADIUS * np.arcsin(np.sqrt(np.minimum(haversine, 1.0)))
+        )
+        site_indexes, event_indexes = np.nonzero(
+            distances <= site_radii[start : start + CHUNK_SIZE, np.newaxis]
+        )
+        matches.extend(
+            zip(
+                (site_indexes + start).tolist(),
+                event_indexes.tolist(),
+                distances[site_indexes, event_indexes].tolist(),
+                strict=True,
+            )
+        )
+    return matches
+
+
+def _match_array(
+    sites: Sequence[tuple[float, float]],
+    radii: Sequence[float],
+    event_coordinates: list[tuple[float, float]],
+) -> list[tuple[int, int, float]]:
+    """Match sites and events without NumPy."""
+    event_latitudes = array("d", (math.radians(lat) for lat, _ in event_coordinates))
+    event_longitudes = array("d", (math.radians(lon) for _, lon in event_coordinates))
+    event_latitudes_cos = array("d", (math.cos(lat) for lat in event_latitudes))
+    events = range(len(event_latitudes))
+    matches = []
+    for site, ((site_latitude, site_longitude), radius) in enumerate(
+        zip(sites, radii, strict=True)
+    ):
+        latitude = math.radians(site_latitude)
+        longitude = math.radians(site_longitude)
+        latitude_cos = math.cos(latitude)
+        for event in events:
+            haversine = (
+                math.sin((event_latitudes[event] - latitude) / 2) ** 2
+                + latitude_cos
+                * event_latitudes_cos[event]
+                * math.sin((event_longitudes[event] - longitude) / 2) ** 2
+            )
+            distance = (
+                2 * AVERAGE_EARTH_RADIUS * math.asin(math.sqrt(min(haversine, 1.0)))
+            )
+            if distance <= radius:
+                matches.append((site, event, distance))
+    return matches
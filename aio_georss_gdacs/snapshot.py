@@ -0,0 +1,88 @@
+"""Snapshot of the events managed by a GDACS feed manager."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+import json
+import os
+import tempfile
+
+SNAPSHOT_FORMAT = 1
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotRecord:
+    """Event managed by a feed manager."""
+
+    external_id: str
+    event_type_short: str | None
+    event_id: int | None
+    version: int | None
+    alert_level: str | None
+    last_seen: datetime | None
+
+    def to_dict(self) -> dict:
+        """Convert record into a dict for serialisation."""
+        return {
+            "external_id": self.external_id,
+            "event_type": self.event_type_short,
+            "event_id": self.event_id,
+            "version": self.version,
+            "alert_level": self.alert_level,
+            "last_seen": self.last_seen.isoformat() if self.last_seen else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> SnapshotRecord:
+        """Create record from a deserialised dict."""
+        return cls(
+            data["external_id"],
+            data["event_type"],
+            data["event_id"],
+            data["version"],
+            data["alert_level"],
+            datetime.fromisoformat(data["last_seen"]) if data["last_seen"] else None,
+        )
+
+
+def write_snapshot(path: str | os.PathLike, records: Iterable[SnapshotRecord]):
+    """Write records to the snapshot file, replacing it atomically.
+
+    The snapshot is written in JSON lines format: a header, followed by one
+    line per record.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=directory, suffix=".tmp", delete=False
+    ) as file:
+        try:
+            file.write(json.dumps({"format": SNAPSHOT_FORMAT}) + "\n")
+            file.writelines(
+                json.dumps(record.to_dict(), separators=(",", ":")) + "\n"
+                for record in records
+            )
+            file.flush()
+            os.fsync(file.fileno())
+        except BaseException:
+            file.close()
+            os.unlink(file.name)
+            raise
+    os.replace(file.name, path)
+
+
+def read_snapshot(path: str | os.PathLike) -> list[SnapshotRecord]:
+    """Read records from the snapshot file, raise ValueError if invalid."""
+    with open(path, encoding="utf-8") as file:
+        try:
+            header = json.loads(file.readline() or "null")
+            if not isinstance(header, dict) or header.get("format") != SNAPSHOT_FORMAT:
+                raise ValueError(f"Unsupported snapshot format: {header}")
+            return [
+                SnapshotRecord.from_dict(json.loads(line))
+                for line in file
+                if line.strip()
+            ]
+        except (KeyError, TypeError) as error:
+            raise ValueError(f"Invalid snapshot record: {error}") from error
@@ -0,0 +1,207 @@
+"""Spatial index over GDACS feed entries."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+import math
+
+from .consts import AVERAGE_EARTH_RADIUS
+from .feed_entry import GdacsFeedEntry
+from .geometry import distance, distance_to_polygon, is_inside
+
+DEFAULT_CELL_SIZE = 10.0
+# Widen search windows slightly to be safe from rounding errors.
+WINDOW_MARGIN = 1e-6
+
+
+@dataclass(eq=False, slots=True)
+class _IndexedGeometry:
+    """Point or polygon of an entry with its bounds (south, west, north, east).
+
+    Coordinates are a flat array of latitudes and longitudes, as decoded by
+    the entry.
+    """
+
+    entry: GdacsFeedEntry
+    coordinates: array
+    polygon: bool
+    bounds: tuple[float, float, float, float]
+
+
+class GdacsSpatialIndex:
+    """Grid index over the geometries of GDACS feed entries.
+
+    The bounds of each point and polygon are computed once when an entry is
+    added, and the entry is registered in every grid cell its geometries
+    overlap. A query only computes exact distances to geometries whose
+    bounds overlap the area around the queried coordinates.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[GdacsFeedEntry] = (),
+        cell_size: float = DEFAULT_CELL_SIZE,
+    ):
+        """Initialise the spatial index."""
+        if cell_size <= 0:
+            raise ValueError(f"Cell size must be positive, got {cell_size}")
+        self._cell_size: float = cell_size
+        self._rows: int = math.ceil(180 / cell_size)
+        self._columns: int = math.ceil(360 / cell_size)
+        self._cells: dict[tuple[int, int], set[_IndexedGeometry]] = {}
+        self._entries: dict[str, list[_IndexedGeometry]] = {}
+        for entry in entries:
+            self.add(entry)
+
+    def __repr__(self):
+        """Return string representation of this index."""
+        return (
+            f"<{self.__class__.__name__}(entries={len(self._entries)}, "
+            f"cell_size={self._cell_size})>"
+        )
+
+    def __len__(self) -> int:
+        """Return the number of entries in this index."""
+        return len(self._entries)
+
+    def add(self, entry: GdacsFeedEntry):
+        """Add entry, replacing an entry with the same external id."""
+        self.remove(entry.external_id)
+        points, polygons = entry.shapes
+        records = [
+            _IndexedGeometry(
+                entry,
+                points[index : index + 2],
+                False,
+                (points[index], points[index + 1], points[index], points[index + 1]),
+            )
+            for index in range(0, len(points), 2)
+        ]
+        records.extend(
+            _IndexedGeometry(
+                entry,
+                polygon,
+                True,
+                (
+                    min(polygon[0::2]),
+                    min(polygon[1::2]),
+                    max(polygon[0::2]),
+                    max(polygon[1::2]),
+                ),
+            )
+            for polygon in polygons
+            if polygon
+        )
+        for record in records:
+            for cell in self._cells_in(record.bounds):
+                self._cells.setdefault(cell, set()).add(record)
+        self._entries[entry.external_id] = records
+
+    def remove(self, external_id: str | None):
+        """Remove the entry with the provided external id, if present."""
+        for record in self._entries.pop(external_id, []):
+            for cell in self._cells_in(record.bounds):
+                records = self._cells[cell]
+                records.discard(record)
+                if not records:
+                    del self._cells[cell]
+
+    def clear(self):
+        """Remove all entries."""
+        self._cells.clear()
+        self._entries.clear()
+
+    def query(
+        self, coordinates: tuple[float, float], radius: float = 0.0
+    ) -> list[tuple[GdacsFeedEntry, float]]:
+        """Return entries within radius (km) of the coordinates by distance.
+
+        With the default radius of 0 only entries with a polygon containing
+        the coordinates or a point at exactly these coordinates match.
+        """
+        windows = _windows(coordinates, radius)
+        matches: dict[str | None, tuple[GdacsFeedEntry, float]] = {}
+        candidates: set[_IndexedGeometry] = set()
+        for window in windows:
+            for cell in self._cells_in(window):
+                candidates.update(self._cells.get(cell, ()))
+        for record in candidates:
+            if not any(_overlap(record.bounds, window) for window in windows):
+                continue
+            record_distance = _distance(coordinates, record, radius)
+            external_id = record.entry.external_id
+            if record_distance <= radius and (
+                external_id not in matches or record_distance < matches[external_id][1]
+            ):
+                matches[external_id] = (record.entry, record_distance)
+        return sorted(matches.values(), key=lambda match: match[1])
+
+    def _cells_in(self, bounds: tuple[float, float, float, float]) -> Iterator:
+        """Return all grid cells overlapping the bounds."""
+        south, west, north, east = bounds
+        for row in range(self._row(south), self._row(north) + 1):
+            for column in range(self._column(west), self._column(east) + 1):
+                yield row, column
+
+    def _row(self, latitude: float) -> int:
+        """Return the grid row of the latitude."""
+        return min(max(int((latitude + 90) // self._cell_size), 0), self._rows - 1)
+
+    def _column(self, longitude: float) -> int:
+        """Return the grid column of the longitude."""
+        return min(max(int((longitude + 180) // self._cell_size), 0), self._columns - 1)
+
+
+def _windows(
+    coordinates: tuple[float, float], radius: float
+) -> list[tuple[float, float, float, float]]:
+    """Return bounds covering everything within radius of the coordinates."""
+    latitude, longitude = coordinates
+    angle = radius / AVERAGE_EARTH_RADIUS
+    delta_latitude = math.degrees(angle) + WINDOW_MARGIN
+    south = latitude - delta_latitude
+    north = latitude + delta_latitude
+    if south <= -90 or north >= 90 or angle >= math.pi / 2:
+        # Area includes a pole.
+        return [(max(south, -90.0), -180.0, min(north, 90.0), 180.0)]
+    delta_longitude = (
+        math.degrees(
+            math.asin(min(math.sin(angle) / math.cos(math.radians(latitude)), 1.0))
+        )
+        + WINDOW_MARGIN
+    )
+    west = longitude - delta_longitude
+    east = longitude + delta_longitude
+    # Split area crossing the 180 degree meridian.
+    if west < -180:
+        return [(south, west + 360, north, 180.0), (south, -180.0, north, east)]
+    if east > 180:
+        return [(south, west, north, 180.0), (south, -180.0, north, east - 360)]
+    return [(south, west, north, east)]
+
+
+def _overlap(
+    bounds: tuple[float, float, float, float],
+    window: tuple[float, float, float, float],
+) -> bool:
+    """Check if bounds and window overlap."""
+    return (
+        bounds[0] <= window[2]
+        and bounds[2] >= window[0]
+        and bounds[1] <= window[3]
+        and bounds[3] >= window[1]
+    )
+
+
+def _distance(
+    coordinates: tuple[float, float], record: _IndexedGeometry, radius: float
+) -> float:
+    """Return the distance between coordinates and the indexed geometry."""
+    if not record.polygon:
+        return distance(coordinates, record.coordinates[0], record.coordinates[1])
+    if radius <= 0:
+        # Only containment matters, distance to edges is not needed.
+        return 0.0 if is_inside(record.coordinates, coordinates) else math.inf
+    return distance_to_polygon(coordinates, record.coordinates)
@@ -0,0 +1,252 @@
+"""GDACS streaming XML parser."""
+
+from __future__ import annotations
+
+from io import BytesIO
+import logging
+
+from aio_georss_client.consts import (
+    XML_TAG_CATEGORY,
+    XML_TAG_CHANNEL,
+    XML_TAG_DESCRIPTION,
+    XML_TAG_GDACS_BBOX,
+    XML_TAG_GEO_LAT,
+    XML_TAG_GEO_LONG,
+    XML_TAG_GEO_POINT,
+    XML_TAG_GEORSS_POINT,
+    XML_TAG_GEORSS_POLYGON,
+    XML_TAG_GEORSS_WHERE,
+    XML_TAG_GUID,
+    XML_TAG_ITEM,
+    XML_TAG_LINK,
+    XML_TAG_PUB_DATE,
+    XML_TAG_RSS,
+    XML_TAG_TITLE,
+)
+from aio_georss_client.xml_parser import DEFAULT_NAMESPACES, KEYS_DATE, XmlParser
+from aio_georss_client.xml_parser.feed import Feed
+
+try:
+    from lxml import etree
+except ImportError:
+    from xml.etree import ElementTree as etree  # noqa: ICN001, N813
+
+from .consts import (
+    XML_ATTRIBUTE_PREFIX,
+    XML_TAG_DC_SUBJECT,
+    XML_TAG_GDACS_ALERT_LEVEL,
+    XML_TAG_GDACS_COUNTRY,
+    XML_TAG_GDACS_DURATION_IN_WEEK,
+    XML_TAG_GDACS_EVENT_ID,
+    XML_TAG_GDACS_EVENT_NAME,
+    XML_TAG_GDACS_EVENT_TYPE,
+    XML_TAG_GDACS_FROM_DATE,
+    XML_TAG_GDACS_ICON,
+    XML_TAG_GDACS_IS_CURRENT,
+    XML_TAG_GDACS_POPULATION,
+    XML_TAG_GDACS_SEVERITY,
+    XML_TAG_GDACS_TEMPORARY,
+    XML_TAG_GDACS_TO_DATE,
+    XML_TAG_GDACS_VERSION,
+    XML_TAG_GDACS_VULNERABILITY,
+    XML_TEXT,
+)
+from .date_parser import parse_date
+
+_LOGGER = logging.getLogger(__name__)
+
+# Errors raised by the underlying XML library for malformed documents.
+ParseError = etree.ParseError
+
+# Only these tags of each item are kept, everything else is discarded.
+ITEM_TAGS = {
+    XML_TAG_CATEGORY,
+    XML_TAG_DC_SUBJECT,
+    XML_TAG_DESCRIPTION,
+    XML_TAG_GDACS_ALERT_LEVEL,
+    XML_TAG_GDACS_BBOX,
+    XML_TAG_GDACS_COUNTRY,
+    XML_TAG_GDACS_DURATION_IN_WEEK,
+    XML_TAG_GDACS_EVENT_ID,
+    XML_TAG_GDACS_EVENT_NAME,
+    XML_TAG_GDACS_EVENT_TYPE,
+    XML_TAG_GDACS_FROM_DATE,
+    XML_TAG_GDACS_ICON,
+    XML_TAG_GDACS_IS_CURRENT,
+    XML_TAG_GDACS_POPULATION,
+    XML_TAG_GDACS_SEVERITY,
+    XML_TAG_GDACS_TEMPORARY,
+    XML_TAG_GDACS_TO_DATE,
+    XML_TAG_GDACS_VERSION,
+    XML_TAG_GDACS_VULNERABILITY,
+    XML_TAG_GEO_LAT,
+    XML_TAG_GEO_LONG,
+    XML_TAG_GEO_POINT,
+    XML_TAG_GEORSS_POINT,
+    XML_TAG_GEORSS_POLYGON,
+    XML_TAG_GEORSS_WHERE,
+    XML_TAG_GUID,
+    XML_TAG_LINK,
+    XML_TAG_PUB_DATE,
+    XML_TAG_TITLE,
+}
+
+
+class GdacsXmlParser:
+    """Streaming XML parser for GDACS feeds.
+
+    Instead of building a dict of the whole document, items are processed
+    one at a time while the document is read, only the tags relevant for
+    GDACS feed entries are kept and each item's elements are discarded as
+    soon as the item is complete. The result has the same structure as
+    the one produced by the generic XML parser, except that polygons are
+    kept as text until feed entries decode them when first needed.
+    """
+
+    def __init__(self, additional_namespaces: dict | None = None):
+        """Initialise the XML parser."""
+        self._namespaces = dict(DEFAULT_NAMESPACES)
+        if additional_namespaces:
+            self._namespaces.update(additional_namespaces)
+        self._names: dict[str, str] = {}
+
+    def parse(self, xml: bytes | str) -> Feed | None:
+        """Parse the provided xml."""
+        if not xml:
+            return None
+        if isinstance(xml, str):
+            xml = xml.encode("utf-8")
+        state = _ParserState()
+        for event, element in _iterparse(xml):
+            if event == "start":
+                state.depth += 1
+                if not self._start(state, element):
+                    return None
+            else:
+                state.depth -= 1
+                self._end(state, element)
+        if state.channel_element is None:
+            _LOGGER.warning(
+                "Invalid structure: %s not followed by %s",
+                XML_TAG_RSS,
+                XML_TAG_CHANNEL,
+            )
+            return None
+        if state.items:
+            state.channel[XML_TAG_ITEM] = (
+                state.items if len(state.items) > 1 else state.items[0]
+            )
+        return Feed(state.channel)
+
+    def _start(self, state: _ParserState, element) -> bool:
+        """Process start of element, return False if document is not RSS."""
+        name = self._name(element.tag)
+        if state.depth == 1:
+            return name == XML_TAG_RSS
+        if state.depth == 2 and name == XML_TAG_CHANNEL:
+            state.channel_element = element
+        elif (
+            state.depth == 3
+            and state.channel_element is not None
+            and name == XML_TAG_ITEM
+        ):
+            state.item = {}
+        return True
+
+    def _end(self, state: _ParserState, element) -> None:
+        """Process end of element."""
+        if state.channel_element is None:
+            return
+        if state.depth == 3 and state.item is not None:
+            # Direct child of an item.
+            key = self._name(element.tag)
+            if key in ITEM_TAGS:
+                _add_value(state.item, key, self._process(key, element))
+            element.clear()
+        elif state.depth == 2:
+            if state.item is not None:
+                state.items.append(state.item)
+                state.item = None
+            else:
+                # Direct child of the channel, other than an item.
+                key = self._name(element.tag)
+                _add_value(state.channel, key, self._process(key, element))
+            state.channel_element.remove(element)
+
+    def _name(self, tag: str) -> str:
+        """Convert namespaced tag into name with namespace prefix."""
+        name = self._names.get(tag)
+        if name is None:
+            name = tag
+            if tag[0] == "{":
+                namespace, local_name = tag[1:].split("}", 1)
+                prefix = self._namespaces.get(namespace, namespace)
+                name = f"{prefix}:{local_name}" if prefix else local_name
+            self._names[tag] = name
+        return name
+
+    def _process(self, key: str, element) -> str | float | int | tuple | dict | None:
+        """Convert element into the value the generic parser would produce."""
+        value = self._value(element)
+        if key == XML_TAG_GEORSS_POLYGON:
+            return value
+        if key in KEYS_DATE and isinstance(value, str):
+            try:
+                return parse_date(value)
+            except ValueError as error:
+                _LOGGER.warning("Unable to process (%s/%s): %s", key, value, error)
+                return value
+        return XmlParser.postprocessor([], key, value)[1]
+
+    def _value(self, element) -> str | dict | None:
+        """Convert element into text or a dict of attributes and children."""
+        text = element.text.strip() if element.text else None
+        if not len(element) and not element.attrib:
+            return text or None
+        value: dict = {
+            f"{XML_ATTRIBUTE_PREFIX}{self._name(name)}": attribute
+            for name, attribute in element.attrib.items()
+        }
+        for child in element:
+            if isinstance(child.tag, str):
+                key = self._name(child.tag)
+                _add_value(value, key, self._process(key, child))
+        if text:
+            value[XML_TEXT] = text
+        return value
+
+
+class _ParserState:
+    """State of the document being parsed."""
+
+    def __init__(self):
+        """Initialise parser state."""
+        self.depth: int = 0
+        self.channel_element = None
+        self.channel: dict = {}
+        self.item: dict | None = None
+        self.items: list[dict] = []
+
+
+def _add_value(target: dict, key: str, value) -> None:
+    """Add value to target, turning repeated keys into a list."""
+    if key in target:
+        existing = target[key]
+        if isinstance(existing, list):
+            existing.append(value)
+        else:
+            target[key] = [existing, value]
+    else:
+        target[key] = value
+
+
+def _iterparse(xml: bytes):
+    """Return iterator over start and end events of the provided xml."""
+    if etree.__name__.startswith("lxml"):
+        return etree.iterparse(  # noqa: S314
+            BytesIO(xml),
+            events=("start", "end"),
+            remove_comments=True,
+            resolve_entities=False,
+        )
+    return etree.iterparse(BytesIO(xml), events=("start", "end"))  # noqa: S314
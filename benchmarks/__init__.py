@@ -0,0 +1 @@
+"""Benchmarks for GDACS feed library."""
@@ -0,0 +1,22 @@
+"""Configuration for benchmarks."""
+
+import pytest
+
+from benchmarks.utils import load_sample, parse_feed_items, peak_memory
+
+
+@pytest.fixture(scope="session")
+def feed_items_7d():
+    """Return feed items parsed from the 7-day sample feed."""
+    return parse_feed_items(load_sample("gdacs-rss-7d.xml"))
+
+
+@pytest.fixture
+def benchmark_memory(benchmark):
+    """Benchmark a function and record its peak memory in the results."""
+
+    def _benchmark(function, *args):
+        benchmark.extra_info["peak_memory"] = peak_memory(function, *args)
+        return benchmark(function, *args)
+
+    return _benchmark
@@ -0,0 +1,49 @@
+"""Benchmarks for the GDACS date parser."""
+
+import glob
+import os
+import re
+
+from dateutil import parser
+import pytest
+
+from aio_georss_gdacs.date_parser import parse_date
+
+DATE_PATTERN = re.compile(
+    r"<(?:gdacs:fromdate|gdacs:todate|pubDate)>([^<]+)</", re.MULTILINE
+)
+
+
+def _sample_dates():
+    """Return all dates found in the sample feeds."""
+    dates = []
+    pattern = os.path.join(os.path.dirname(__file__), "..", "samples", "*.xml")
+    for filename in sorted(glob.glob(pattern)):
+        with open(filename, encoding="utf-8-sig") as fptr:
+            dates.extend(DATE_PATTERN.findall(fptr.read()))
+    return dates
+
+
+SAMPLE_DATES = _sample_dates()
+
+
+def test_sample_dates_match_dateutil():
+    """Test that all sample dates are parsed identically to dateutil."""
+    assert SAMPLE_DATES
+    for value in SAMPLE_DATES:
+        expected = parser.parse(value)
+        parsed_date = parse_date(value)
+        assert parsed_date == expected
+        assert parsed_date.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.benchmark(group="date_parser")
+def test_parse_sample_dates_dateutil(benchmark):
+    """Parse all sample dates with dateutil."""
+    benchmark(lambda: [parser.parse(value) for value in SAMPLE_DATES])
+
+
+@pytest.mark.benchmark(group="date_parser")
+def test_parse_sample_dates(benchmark):
+    """Parse all sample dates with the GDACS date parser."""
+    benchmark(lambda: [parse_date(value) for value in SAMPLE_DATES])
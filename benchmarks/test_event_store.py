@@ -0,0 +1,59 @@
+"""Benchmarks for the GDACS event store."""
+
+import datetime
+
+import pytest
+
+from aio_georss_gdacs.event import GdacsEvent
+from aio_georss_gdacs.event_store import GdacsEventStore
+from benchmarks.utils import (
+    create_entries,
+    load_sample,
+    parse_feed_items,
+    synthetic_feed,
+)
+
+START = datetime.datetime(2019, 12, 20, tzinfo=datetime.UTC)
+END = datetime.datetime(2019, 12, 27, tzinfo=datetime.UTC)
+
+
+@pytest.fixture(scope="module")
+def entries():
+    """Return entries of a synthetic feed with 10,000 items."""
+    return create_entries(
+        parse_feed_items(synthetic_feed(load_sample("gdacs-rss-7d.xml"), 10000))
+    )
+
+
+def _matches(entry):
+    """Check if the entry matches the query."""
+    return (
+        entry.alert_level in ("Orange", "Red")
+        and entry.event_type_short in ("EQ", "TC")
+        and entry.is_current
+        and entry.from_date <= END
+        and entry.to_date >= START
+    )
+
+
+@pytest.mark.benchmark(group="event_query")
+def test_query_scan(benchmark, entries):
+    """Query by scanning all feed entries."""
+    result = benchmark(lambda: [entry for entry in entries if _matches(entry)])
+    assert result
+
+
+@pytest.mark.benchmark(group="event_query")
+def test_query_store(benchmark, entries):
+    """Query the event store."""
+    store = GdacsEventStore(GdacsEvent.from_entry(entry) for entry in entries)
+    result = benchmark(
+        lambda: store.query(
+            alert_levels=["Orange", "Red"],
+            event_types=["EQ", "TC"],
+            is_current=True,
+            start=START,
+            end=END,
+        )
+    )
+    assert len(result) == len([entry for entry in entries if _matches(entry)])
@@ -0,0 +1,141 @@
+"""Benchmarks for the GDACS feed entry."""
+
+import math
+import re
+
+from aio_georss_client.feed_entry import FeedEntry
+from aio_georss_client.geo_rss_distance_helper import GeoRssDistanceHelper
+from aio_georss_client.xml_parser.geometry import Point
+import pytest
+
+from benchmarks.utils import (
+    HOME_COORDINATES,
+    create_entries,
+    load_sample,
+    parse_feed_items,
+)
+
+PROPERTIES = [
+    "alert_level",
+    "country",
+    "duration_in_week",
+    "event_id",
+    "event_name",
+    "event_type_short",
+    "event_type",
+    "from_date",
+    "icon_url",
+    "is_current",
+    "population",
+    "severity",
+    "temporary",
+    "to_date",
+    "version",
+    "vulnerability",
+]
+READS_PER_UPDATE = 10
+POLYGON_POINTS = 500
+POINT_PATTERN = re.compile(r"<georss:point>(\S+) (\S+)</georss:point>")
+
+
+def _read_all_properties(entries):
+    """Read all GDACS properties of all entries."""
+    for entry in entries:
+        for name in PROPERTIES:
+            getattr(entry, name)
+
+
+@pytest.mark.benchmark(group="feed_entry_property_access")
+def test_property_access_decode_every_read(benchmark, feed_items_7d):
+    """Read properties with a fresh entry for every read (previous behaviour)."""
+
+    def _run():
+        for _ in range(READS_PER_UPDATE):
+            _read_all_properties(create_entries(feed_items_7d))
+
+    benchmark(_run)
+
+
+@pytest.mark.benchmark(group="feed_entry_property_access")
+def test_property_access_decode_once(benchmark, feed_items_7d):
+    """Read properties repeatedly from the same entries."""
+
+    def _run():
+        entries = create_entries(feed_items_7d)
+        for _ in range(READS_PER_UPDATE):
+            _read_all_properties(entries)
+
+    benchmark(_run)
+
+
+def _with_polygon(match):
+    """Add a polygon around the point, as published for floods and droughts."""
+    latitude, longitude = float(match.group(1)), float(match.group(2))
+    coordinates = []
+    for index in range(POLYGON_POINTS + 1):
+        angle = 2 * math.pi * (index % POLYGON_POINTS) / POLYGON_POINTS
+        coordinates.append(
+            f"{max(-89.0, min(89.0, latitude + 2 * math.sin(angle))):.4f}"
+        )
+        coordinates.append(f"{(longitude + 3 * math.cos(angle) + 180) % 360 - 180:.4f}")
+    return f"{match.group(0)}<georss:polygon>{' '.join(coordinates)}</georss:polygon>"
+
+
+@pytest.fixture(scope="module", params=["points", "polygons"])
+def geometry_feed_items(request, feed_items_7d):
+    """Return feed items of the 7-day sample feed, optionally with polygons."""
+    if request.param == "points":
+        return feed_items_7d
+    return parse_feed_items(
+        POINT_PATTERN.sub(_with_polygon, load_sample("gdacs-rss-7d.xml"))
+    )
+
+
+def _previous_coordinates_and_distance(entry):
+    """Return coordinates and distance, building geometries on every access."""
+    geometries = FeedEntry.geometries.fget(entry)
+    points = [geometry for geometry in geometries if isinstance(geometry, Point)]
+    coordinates = GeoRssDistanceHelper.extract_coordinates(
+        (points or FeedEntry.geometries.fget(entry))[0]
+    )
+    distance = min(
+        GeoRssDistanceHelper.distance_to_geometry(HOME_COORDINATES, geometry)
+        for geometry in FeedEntry.geometries.fget(entry)
+    )
+    return coordinates, distance
+
+
+@pytest.mark.benchmark(group="feed_entry_geometry")
+def test_geometry_decode_every_access(benchmark, geometry_feed_items):
+    """Create entries and read coordinates and distance (previous behaviour)."""
+
+    def _run():
+        for entry in create_entries(geometry_feed_items):
+            _previous_coordinates_and_distance(entry)
+
+    benchmark(_run)
+
+
+@pytest.mark.benchmark(group="feed_entry_geometry")
+def test_geometry_decode_lazily(benchmark, geometry_feed_items):
+    """Create entries and read coordinates and distance from decoded arrays."""
+
+    def _run():
+        for entry in create_entries(geometry_feed_items):
+            _ = entry.coordinates, entry.distance_to_home
+
+    benchmark(_run)
+
+
+@pytest.mark.benchmark(group="feed_entry_geometry")
+def test_geometry_not_needed(benchmark, geometry_feed_items):
+    """Create entries and filter by alert level only, decoding no geometries."""
+
+    def _run():
+        return [
+            entry
+            for entry in create_entries(geometry_feed_items)
+            if entry.alert_level == "Orange"
+        ]
+
+    benchmark(_run)
@@ -0,0 +1,119 @@
+"""Benchmarks for the parse, entry, filter and diff pipeline."""
+
+import asyncio
+from http import HTTPStatus
+import itertools
+
+from aio_georss_client.xml_parser import XmlParser
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from aio_georss_gdacs.feed import GdacsFeed
+from aio_georss_gdacs.feed_manager import GdacsFeedManagerBase
+from aio_georss_gdacs.xml_parser import GdacsXmlParser
+from benchmarks.utils import (
+    HOME_COORDINATES,
+    create_entries,
+    load_sample,
+    synthetic_feed,
+)
+
+SAMPLES = ["gdacs-rss.xml", "gdacs-rss-24h.xml", "gdacs-rss-7d.xml"]
+SIZES = [1000, 10000]
+SAMPLE_7D = load_sample("gdacs-rss-7d.xml")
+SYNTHETIC_FEEDS = {size: synthetic_feed(SAMPLE_7D, size) for size in SIZES}
+FILTER_RADIUS = 5000.0
+FILTER_CATEGORIES = ["Earthquake", "Tropical Cyclone"]
+
+
+def _parse(xml, streaming_parser):
+    """Parse the provided feed into entries."""
+    if streaming_parser:
+        feed = GdacsXmlParser().parse(xml.encode("utf-8"))
+    else:
+        feed = XmlParser().parse(xml)
+    return create_entries(feed.entries)
+
+
+async def _callback(external_id: str) -> None:
+    """Ignore callback."""
+
+
+@pytest.mark.benchmark(group="parse_samples")
+@pytest.mark.parametrize("streaming_parser", [False, True])
+@pytest.mark.parametrize("sample", SAMPLES)
+def test_parse_sample(benchmark_memory, sample, streaming_parser):
+    """Parse a sample feed into entries."""
+    entries = benchmark_memory(_parse, load_sample(sample), streaming_parser)
+    assert entries
+
+
+@pytest.mark.benchmark(group="parse_synthetic")
+@pytest.mark.parametrize("streaming_parser", [False, True])
+@pytest.mark.parametrize("size", SIZES)
+def test_parse_synthetic(benchmark_memory, size, streaming_parser):
+    """Parse a synthetic feed into entries."""
+    entries = benchmark_memory(_parse, SYNTHETIC_FEEDS[size], streaming_parser)
+    assert len(entries) == size
+
+
+@pytest.mark.benchmark(group="filter")
+@pytest.mark.parametrize(
+    ("filter_radius", "filter_categories"),
+    [(FILTER_RADIUS, None), (None, FILTER_CATEGORIES)],
+    ids=["radius", "categories"],
+)
+@pytest.mark.parametrize("size", SIZES)
+def test_filter(benchmark_memory, size, filter_radius, filter_categories):
+    """Filter fresh entries of a synthetic feed by radius or category."""
+    feed = GdacsFeed(
+        None,
+        HOME_COORDINATES,
+        filter_radius=filter_radius,
+        filter_categories=filter_categories,
+    )
+    feed_items = GdacsXmlParser().parse(SYNTHETIC_FEEDS[size].encode()).entries
+
+    def _filter():
+        return feed._filter_entries(create_entries(feed_items))  # noqa: SLF001
+
+    entries = benchmark_memory(_filter)
+    assert 0 < len(entries) < size
+
+
+@pytest.mark.benchmark(group="feed_manager")
+@pytest.mark.parametrize("streaming_parser", [False, True])
+def test_feed_manager_update(benchmark_memory, streaming_parser):
+    """Update a feed manager from a local server serving the samples in turn.
+
+    Every update adds, updates and removes entries.
+    """
+    bodies = itertools.cycle([load_sample(sample) for sample in SAMPLES])
+
+    async def _handler(request):
+        """Return the next sample feed."""
+        return web.Response(
+            status=HTTPStatus.OK, text=next(bodies), content_type="application/xml"
+        )
+
+    app = web.Application()
+    app.router.add_get("/xml/rss.xml", _handler)
+    loop = asyncio.new_event_loop()
+    server = TestServer(app, loop=loop)
+    loop.run_until_complete(server.start_server())
+    websession = ClientSession(loop=loop)
+    try:
+        feed = GdacsFeed(
+            websession,
+            HOME_COORDINATES,
+            streaming_parser=streaming_parser,
+            url=str(server.make_url("/xml/rss.xml")),
+        )
+        feed_manager = GdacsFeedManagerBase(feed, _callback, _callback, _callback)
+        benchmark_memory(lambda: loop.run_until_complete(feed_manager.update()))
+        assert feed_manager.feed_entries
+    finally:
+        loop.run_until_complete(websession.close())
+        loop.run_until_complete(server.close())
+        loop.close()
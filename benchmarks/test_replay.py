@@ -0,0 +1,36 @@
+"""Benchmarks for updating a feed manager from recorded feeds."""
+
+import asyncio
+import os
+
+import pytest
+
+from aio_georss_gdacs.feed import GdacsFeed
+from aio_georss_gdacs.feed_manager import GdacsFeedManagerBase
+from aio_georss_gdacs.fetcher import ReplayFetcher
+from benchmarks.utils import HOME_COORDINATES
+
+SAMPLES = os.path.join(os.path.dirname(__file__), "..", "samples")
+
+
+async def _callback(external_id: str) -> None:
+    """Ignore callback."""
+
+
+@pytest.mark.benchmark(group="replay")
+@pytest.mark.parametrize("streaming_parser", [False, True])
+def test_update_from_samples(benchmark, streaming_parser):
+    """Update a feed manager from each of the sample feeds in turn."""
+    feed = GdacsFeed(
+        None,
+        HOME_COORDINATES,
+        streaming_parser=streaming_parser,
+        fetcher=ReplayFetcher(SAMPLES),
+    )
+    feed_manager = GdacsFeedManagerBase(feed, _callback, _callback, _callback)
+    loop = asyncio.new_event_loop()
+    try:
+        benchmark(lambda: loop.run_until_complete(feed_manager.update()))
+    finally:
+        loop.close()
+    assert feed_manager.feed_entries
@@ -0,0 +1,77 @@
+"""Benchmarks for the bulk matching of GDACS events against sites."""
+
+import dataclasses
+import random
+
+from haversine import haversine
+import pytest
+
+from aio_georss_gdacs import site_matcher
+from aio_georss_gdacs.event import GdacsEvent
+from aio_georss_gdacs.site_matcher import match_sites
+from benchmarks.utils import create_entries
+
+SITE_COUNT = 10000
+EVENT_COUNT = 500
+RADIUS = 1000.0
+
+
+@pytest.fixture(scope="module")
+def sites():
+    """Return random site coordinates."""
+    generator = random.Random(1)
+    return [
+        (generator.uniform(-90, 90), generator.uniform(-180, 180))
+        for _ in range(SITE_COUNT)
+    ]
+
+
+@pytest.fixture(scope="module")
+def events(feed_items_7d):
+    """Return events of the sample feed, moved to random coordinates."""
+    generator = random.Random(2)
+    templates = [
+        GdacsEvent.from_entry(entry) for entry in create_entries(feed_items_7d)
+    ]
+    return [
+        dataclasses.replace(
+            templates[index % len(templates)],
+            coordinates=(generator.uniform(-90, 90), generator.uniform(-180, 180)),
+        )
+        for index in range(EVENT_COUNT)
+    ]
+
+
+@pytest.mark.benchmark(group="site_matcher")
+def test_match_sites_haversine(benchmark, sites, events):
+    """Match events against sites one by one."""
+    site_sample = sites[: SITE_COUNT // 100]
+
+    def _match():
+        return [
+            (site, event, distance)
+            for site, coordinates in enumerate(site_sample)
+            for event, entry in enumerate(events)
+            if (distance := haversine(coordinates, entry.coordinates)) <= RADIUS
+        ]
+
+    # Only 1% of the sites, otherwise this takes too long.
+    benchmark(_match)
+
+
+@pytest.mark.benchmark(group="site_matcher")
+def test_match_sites_array(benchmark, monkeypatch, sites, events):
+    """Match events against sites without NumPy."""
+    monkeypatch.setattr(site_matcher, "np", None)
+    matches = benchmark.pedantic(
+        match_sites, args=(sites, RADIUS, events), rounds=1, iterations=1
+    )
+    assert matches
+
+
+@pytest.mark.benchmark(group="site_matcher")
+def test_match_sites_numpy(benchmark, sites, events):
+    """Match events against sites with NumPy."""
+    pytest.importorskip("numpy")
+    matches = benchmark(match_sites, sites, RADIUS, events)
+    assert matches
@@ -0,0 +1,98 @@
+"""Benchmarks for the GDACS spatial index."""
+
+import math
+import random
+
+from aio_georss_client.xml_parser import XmlParser
+import pytest
+
+from aio_georss_gdacs.feed_entry import GdacsFeedEntry
+from aio_georss_gdacs.spatial_index import GdacsSpatialIndex
+from benchmarks.utils import HOME_COORDINATES, create_entries
+
+SITE_COUNT = 200
+POLYGON_COUNT = 50
+POLYGON_POINTS = 1000
+RADIUS = 100.0
+
+FEED = """<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:georss="http://www.georss.org/georss">
+  <channel>{items}</channel>
+</rss>"""
+ITEM = """<item>
+  <guid>DR{event_id}</guid>
+  <georss:point>{latitude} {longitude}</georss:point>
+  <georss:polygon>{polygon}</georss:polygon>
+</item>"""
+
+
+def _polygon_entries():
+    """Return entries with large polygons at random locations."""
+    generator = random.Random(1)
+    items = []
+    for event_id in range(POLYGON_COUNT):
+        latitude = generator.uniform(-60, 60)
+        longitude = generator.uniform(-160, 160)
+        points = []
+        for index in range(POLYGON_POINTS + 1):
+            angle = 2 * math.pi * (index % POLYGON_POINTS) / POLYGON_POINTS
+            points.append(f"{latitude + 10 * math.sin(angle):.4f}")
+            points.append(f"{longitude + 15 * math.cos(angle):.4f}")
+        items.append(
+            ITEM.format(
+                event_id=event_id,
+                latitude=latitude,
+                longitude=longitude,
+                polygon=" ".join(points),
+            )
+        )
+    feed = XmlParser().parse(FEED.format(items="".join(items)))
+    return [GdacsFeedEntry(HOME_COORDINATES, item) for item in feed.entries]
+
+
+@pytest.fixture(scope="module")
+def entries(feed_items_7d):
+    """Return entries of the sample feed and entries with large polygons."""
+    return create_entries(feed_items_7d) + _polygon_entries()
+
+
+@pytest.fixture(scope="module")
+def sites():
+    """Return random site coordinates."""
+    generator = random.Random(2)
+    return [
+        (generator.uniform(-60, 60), generator.uniform(-180, 180))
+        for _ in range(SITE_COUNT)
+    ]
+
+
+@pytest.mark.benchmark(group="spatial_index")
+def test_query_distance_to_home(benchmark, entries, sites):
+    """Find entries affecting each site by distance to home."""
+    site_sample = sites[: SITE_COUNT // 10]
+    # Only 10% of the sites, otherwise this takes too long.
+    benchmark.pedantic(
+        lambda: [
+            [
+                entry
+                for entry in entries
+                if entry.relocate(coordinates).distance_to_home <= RADIUS
+            ]
+            for coordinates in site_sample
+        ],
+        rounds=1,
+        iterations=1,
+    )
+
+
+@pytest.mark.benchmark(group="spatial_index")
+def test_query_spatial_index(benchmark, entries, sites):
+    """Find entries affecting each site with the spatial index."""
+    index = GdacsSpatialIndex(entries)
+    benchmark(lambda: [index.query(coordinates, RADIUS) for coordinates in sites])
+
+
+@pytest.mark.benchmark(group="spatial_index")
+def test_build_spatial_index(benchmark, entries):
+    """Build the spatial index."""
+    benchmark(GdacsSpatialIndex, entries)
@@ -0,0 +1,38 @@
+"""Benchmarks for the GDACS streaming XML parser."""
+
+from aio_georss_client.xml_parser import XmlParser
+import pytest
+
+from aio_georss_gdacs.xml_parser import GdacsXmlParser
+from benchmarks.utils import create_entries, load_sample, peak_memory
+
+SAMPLE_7D = load_sample("gdacs-rss-7d.xml")
+
+
+def _parse_generic():
+    """Parse the 7-day sample feed with the generic parser into entries."""
+    return create_entries(XmlParser().parse(SAMPLE_7D).entries)
+
+
+def _parse_streaming():
+    """Parse the 7-day sample feed with the streaming parser into entries."""
+    return create_entries(GdacsXmlParser().parse(SAMPLE_7D.encode("utf-8")).entries)
+
+
+def test_streaming_parser_peak_memory():
+    """Test that the streaming parser needs less memory."""
+    assert peak_memory(_parse_streaming) < peak_memory(_parse_generic)
+
+
+@pytest.mark.benchmark(group="xml_parser")
+def test_parse_generic(benchmark_memory):
+    """Parse the 7-day sample feed with the generic parser."""
+    entries = benchmark_memory(_parse_generic)
+    assert len(entries) == 115
+
+
+@pytest.mark.benchmark(group="xml_parser")
+def test_parse_streaming(benchmark_memory):
+    """Parse the 7-day sample feed with the streaming parser."""
+    entries = benchmark_memory(_parse_streaming)
+    assert len(entries) == 115
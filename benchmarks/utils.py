@@ -0,0 +1,64 @@
+"""Benchmark utilities."""
+
+import os
+import re
+import tracemalloc
+
+from aio_georss_client.xml_parser import XmlParser
+
+from aio_georss_gdacs.feed_entry import GdacsFeedEntry
+
+HOME_COORDINATES = (-41.2, 174.7)
+ITEM_PATTERN = re.compile(r"<item>.*?</item>\s*", re.DOTALL)
+EVENT_ID_PATTERN = re.compile(
+    r"(<gdacs:eventid>|<guid isPermaLink=\"false\">[A-Z]{2})(\d+)<"
+)
+
+
+def load_sample(filename):
+    """Load a sample feed."""
+    path = os.path.join(os.path.dirname(__file__), "..", "samples", filename)
+    with open(path, encoding="utf-8-sig") as fptr:
+        return fptr.read()
+
+
+def parse_feed_items(xml):
+    """Parse the provided xml into feed items."""
+    return XmlParser().parse(xml).entries
+
+
+def create_entries(feed_items):
+    """Create feed entries from the provided feed items."""
+    return [GdacsFeedEntry(HOME_COORDINATES, feed_item) for feed_item in feed_items]
+
+
+def synthetic_feed(xml, size):
+    """Create a feed with the provided number of items from a sample feed.
+
+    Items of the sample feed are repeated with unique event ids.
+    """
+    items = ITEM_PATTERN.findall(xml)
+    start = ITEM_PATTERN.search(xml).start()
+    end = xml.index("</channel>")
+    copies = []
+    for index in range(size):
+        offset = (index // len(items)) * 10_000_000
+        copies.append(
+            EVENT_ID_PATTERN.sub(
+                lambda match, offset=offset: (
+                    f"{match.group(1)}{int(match.group(2)) + offset}<"
+                ),
+                items[index % len(items)],
+            )
+        )
+    return xml[:start] + "".join(copies) + xml[end:]
+
+
+def peak_memory(function, *args):
+    """Return the peak memory in bytes allocated while running function."""
+    tracemalloc.start()
+    try:
+        function(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
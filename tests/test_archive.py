@@ -0,0 +1,166 @@
+"""Test for the GDACS event archive."""
+
+import asyncio
+import dataclasses
+import datetime
+from http import HTTPStatus
+import sqlite3
+
+from aio_georss_client.consts import UPDATE_OK
+from aio_georss_client.status_update import StatusUpdate
+from aio_georss_client.xml_parser import XmlParser
+import aiohttp
+import pytest
+
+from aio_georss_gdacs.archive import GdacsArchive
+from aio_georss_gdacs.event import GdacsEvent
+from aio_georss_gdacs.feed_entry import GdacsFeedEntry
+from aio_georss_gdacs.feed_manager import GdacsFeedManager
+from tests.utils import load_fixture
+
+RECORDED = datetime.datetime(2019, 12, 30, 1, 35, tzinfo=datetime.UTC)
+
+
+def _events(fixture):
+    """Return events of the fixture."""
+    return [
+        GdacsEvent.from_entry(GdacsFeedEntry((-41.2, 174.7), feed_item))
+        for feed_item in XmlParser().parse(load_fixture(fixture)).entries
+    ]
+
+
+def test_record(tmp_path):
+    """Test storing only new versions of events."""
+    path = tmp_path / "archive.db"
+    archive = GdacsArchive(path)
+    assert repr(archive) == f"<GdacsArchive(path={path})>"
+    events = _events("gdacs-1.xml")
+    assert archive.record(events, RECORDED) == 4
+    assert archive.record(events, RECORDED) == 0
+    later = RECORDED + datetime.timedelta(hours=1)
+    updated = dataclasses.replace(events[0], version=2, alert_level="Orange")
+    assert archive.record([updated, *events[1:]], later) == 1
+    # Events without version are not archived.
+    assert archive.record([dataclasses.replace(events[1], version=None)]) == 0
+    archive.close()
+
+    # Versions already archived are known after reopening.
+    archive = GdacsArchive(path)
+    assert archive.record(events, later) == 0
+    timeline = archive.timeline("TC", 1000643)
+    assert [event.version for event in timeline] == [1, 2]
+    assert [event.alert_level for event in timeline] == ["Green", "Orange"]
+    assert [event.recorded for event in timeline] == [RECORDED, later]
+    assert timeline[0].external_id == "TC1000643"
+    assert timeline[0].wind_speed == 92.592
+    assert timeline[0].severity == "Tropical Storm (maximum wind speed of 93 km/h)"
+    assert timeline[0].from_date == datetime.datetime(
+        2019, 12, 29, 12, 0, tzinfo=datetime.UTC
+    )
+    assert archive.timeline("EQ", 1) == []
+    assert len(archive.recorded_between()) == 5
+    assert [
+        (event.event_type_short, event.version)
+        for event in archive.recorded_between(start=later)
+    ] == [("TC", 2)]
+    assert len(archive.recorded_between(end=RECORDED)) == 4
+    archive.close()
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_archive(mock_aiointercept, tmp_path):
+    """Test archiving event versions of feed manager updates."""
+    for fixture in ("gdacs-1.xml", "gdacs-1.xml", "gdacs-3.xml"):
+        mock_aiointercept.get(
+            "https://www.gdacs.org/xml/rss.xml",
+            status=HTTPStatus.OK,
+            body=load_fixture(fixture),
+        )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+
+        async def _callback(external_id: str) -> None:
+            """Ignore callback."""
+
+        archive = GdacsArchive(tmp_path / "archive.db")
+        feed_manager = GdacsFeedManager(
+            websession,
+            _callback,
+            _callback,
+            _callback,
+            (-41.2, 174.7),
+            archive=archive,
+        )
+        assert feed_manager.archive is archive
+        await feed_manager.update()
+        await feed_manager.update()
+        assert len(archive.recorded_between()) == 4
+        await feed_manager.update()
+        # Only the tropical cyclone has a new version.
+        assert len(archive.recorded_between()) == 5
+        assert [event.version for event in archive.timeline("TC", 1000643)] == [1, 2]
+        archive.close()
+
+
+def test_record_failed(tmp_path):
+    """Test versions are not considered archived if writing fails."""
+    path = tmp_path / "archive.db"
+    archive = GdacsArchive(path)
+    archive._connection.execute("PRAGMA busy_timeout = 0")  # noqa: SLF001
+    events = _events("gdacs-1.xml")
+    lock = sqlite3.connect(path)
+    lock.execute("BEGIN EXCLUSIVE")
+    with pytest.raises(sqlite3.OperationalError):
+        archive.record(events, RECORDED)
+    lock.rollback()
+    lock.close()
+    assert archive.record(events, RECORDED) == 4
+    archive.close()
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_archive_failed(mock_aiointercept, tmp_path):
+    """Test feed manager updates finish if archiving fails."""
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.OK,
+        body=load_fixture("gdacs-1.xml"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        generated = []
+        status_updates = []
+
+        async def _generate_entity(external_id: str) -> None:
+            """Generate new entity."""
+            generated.append(external_id)
+
+        async def _callback(external_id: str) -> None:
+            """Ignore callback."""
+
+        async def _status(status_details: StatusUpdate) -> None:
+            """Capture status update."""
+            status_updates.append(status_details)
+
+        path = tmp_path / "archive.db"
+        archive = GdacsArchive(path)
+        archive._connection.execute("PRAGMA busy_timeout = 0")  # noqa: SLF001
+        feed_manager = GdacsFeedManager(
+            websession,
+            _generate_entity,
+            _callback,
+            _callback,
+            (-41.2, 174.7),
+            status_async_callback=_status,
+            archive=archive,
+        )
+        lock = sqlite3.connect(path)
+        lock.execute("BEGIN EXCLUSIVE")
+        await feed_manager.update()
+        lock.rollback()
+        lock.close()
+        assert len(generated) == 4
+        assert len(status_updates) == 1
+        assert status_updates[0].status == UPDATE_OK
+        assert archive.recorded_between() == []
+        archive.close()
@@ -0,0 +1,156 @@
+"""Test for the caches of parsed GDACS feeds."""
+
+import asyncio
+import datetime
+from http import HTTPStatus
+import pickle
+from unittest import mock
+
+import aiohttp
+import pytest
+
+from aio_georss_gdacs.cache import CachedFeed, FileCache, GdacsCache, MemoryCache
+from aio_georss_gdacs.consts import UPDATE_OK_NOT_MODIFIED
+from aio_georss_gdacs.feed import GdacsFeed
+from tests.utils import load_fixture
+
+PUBLISHED = datetime.datetime(2019, 12, 30, 1, 35, tzinfo=datetime.UTC)
+
+
+def _cached(version: str) -> CachedFeed:
+    """Return a cached feed without entries."""
+    return CachedFeed(version, PUBLISHED, ())
+
+
+def test_cache_abstract():
+    """Test caches must implement get, set and lock."""
+    with pytest.raises(TypeError):
+        GdacsCache()
+
+
+@pytest.mark.asyncio
+async def test_memory_cache():
+    """Test expiry and eviction of the memory cache."""
+    cache = MemoryCache(ttl=10.0, max_entries=2)
+    assert repr(cache) == "<MemoryCache(ttl=10.0)>"
+    assert cache.ttl == 10.0
+    with mock.patch("time.monotonic", return_value=100.0):
+        assert await cache.get("a") is None
+        await cache.set("a", _cached("1"))
+        await cache.set("b", _cached("2"))
+        assert (await cache.get("a")).version == "1"
+        # The least recently used feed is discarded.
+        await cache.set("c", _cached("3"))
+        assert await cache.get("b") is None
+        assert (await cache.get("a")).version == "1"
+        assert (await cache.get("c")).version == "3"
+    with mock.patch("time.monotonic", return_value=110.0):
+        assert await cache.get("a") is None
+    assert cache.lock("a") is cache.lock("a")
+
+
+@pytest.mark.asyncio
+async def test_file_cache(tmp_path):
+    """Test storing feeds in files and locking them across caches."""
+    cache = FileCache(tmp_path, ttl=10.0)
+    assert repr(cache) == f"<FileCache(directory={tmp_path}, ttl=10.0)>"
+    assert await cache.get("a") is None
+    await cache.set("a", _cached("1"))
+    other = FileCache(tmp_path, ttl=10.0)
+    assert await other.get("a") == _cached("1")
+    with mock.patch("time.time", return_value=PUBLISHED.timestamp() + 10**10):
+        assert await other.get("a") is None
+    # Unreadable files are ignored.
+    for path in tmp_path.glob("*.pickle"):
+        path.write_bytes(b"invalid")
+    assert await other.get("a") is None
+
+    acquired = []
+
+    async def _acquire(cache, name):
+        async with cache.lock("a"):
+            acquired.append(f"{name} acquired")
+            await asyncio.sleep(0.1)
+            acquired.append(f"{name} released")
+
+    await asyncio.gather(_acquire(cache, "first"), _acquire(other, "second"))
+    assert acquired == [
+        "first acquired",
+        "first released",
+        "second acquired",
+        "second released",
+    ]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        # Classes that cannot be found.
+        b"cunknown_module\nUnknownFeed\n.",
+        b"cbuiltins\nUnknownFeed\n.",
+        # Not a tuple of expiry and feed.
+        pickle.dumps(1),
+    ],
+)
+@pytest.mark.asyncio
+async def test_file_cache_unreadable(tmp_path, caplog, content):
+    """Test treating files that cannot be unpickled as a cache miss."""
+    cache = FileCache(tmp_path, ttl=10.0)
+    await cache.set("a", _cached("1"))
+    for path in tmp_path.glob("*.pickle"):
+        path.write_bytes(content)
+    assert await cache.get("a") is None
+    assert "Unable to read cached feed for a" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_file_cache_inaccessible(tmp_path, caplog):
+    """Test treating files that cannot be opened as a cache miss."""
+    cache = FileCache(tmp_path, ttl=10.0)
+    with mock.patch("builtins.open", side_effect=PermissionError("denied")):
+        assert await cache.get("a") is None
+    assert "Unable to read cached feed for a: denied" in caplog.text
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("file_cache", [False, True])
+async def test_feeds_sharing_cache(mock_aiointercept, tmp_path, file_cache):
+    """Test feeds of different home coordinates fetching the feed only once."""
+    # Only one response available, the other feeds must use the cache.
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.OK,
+        body=load_fixture("gdacs-1.xml"),
+    )
+    cache = FileCache(tmp_path) if file_cache else MemoryCache()
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        home = GdacsFeed(websession, (-41.2, 174.7), cache=cache)
+        near = GdacsFeed(websession, (-31.9, 115.9), filter_radius=500.0, cache=cache)
+        results = await asyncio.gather(home.update(), near.update())
+        assert [status for status, _ in results] == ["OK", "OK"]
+        home_entries, near_entries = (entries for _, entries in results)
+        assert len(home_entries) == 4
+        assert [entry.external_id for entry in near_entries] == ["DR1013588"]
+        assert near_entries[0].distance_to_home == pytest.approx(125.2, abs=0.1)
+        assert home_entries[3].distance_to_home == pytest.approx(5157.2, abs=0.1)
+        assert home.last_timestamp is not None
+
+        # Unchanged cached feed.
+        status, entries = await near.update()
+        assert status == UPDATE_OK_NOT_MODIFIED
+        assert entries == near_entries
+
+        # A new feed reads the cache as well.
+        other = GdacsFeed(websession, (-41.2, 174.7), cache=cache)
+        status, entries = await other.update()
+        assert status == "OK"
+        assert len(entries) == 4
+        assert [entry.title for entry in entries] == [
+            entry.title for entry in home_entries
+        ]
+
+        # Only plain data is cached, no objects of the GeoRSS client.
+        cached = await cache.get("https://www.gdacs.org/xml/rss.xml")
+        assert len(cached.items) == 4
+        assert b"aio_georss_client" not in pickle.dumps(cached)
@@ -0,0 +1,56 @@
+"""Test for the callback dispatcher."""
+
+import asyncio
+
+import pytest
+
+from aio_georss_gdacs.callback_dispatcher import CallbackDispatcher
+
+
+@pytest.mark.asyncio
+async def test_dispatch_concurrency():
+    """Test that no more than the configured number of callbacks run."""
+    running = 0
+    max_running = 0
+    called = []
+
+    async def _callback(external_id: str) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        called.append(external_id)
+        running -= 1
+
+    dispatcher = CallbackDispatcher(concurrency=3)
+    assert repr(dispatcher) == "<CallbackDispatcher(concurrency=3, timeout=None)>"
+    errors = await dispatcher.dispatch(_callback, [str(i) for i in range(10)])
+    assert errors == {}
+    assert sorted(called) == sorted(str(i) for i in range(10))
+    assert max_running == 3
+
+
+@pytest.mark.asyncio
+async def test_dispatch_errors_and_timeouts():
+    """Test that failing and slow callbacks do not affect other callbacks."""
+    called = []
+
+    async def _callback(external_id: str) -> None:
+        if external_id == "error":
+            raise RuntimeError("Callback failed")
+        if external_id == "slow":
+            await asyncio.sleep(10)
+        called.append(external_id)
+
+    dispatcher = CallbackDispatcher(concurrency=2, timeout=0.05)
+    errors = await dispatcher.dispatch(_callback, ["1", "error", "slow", "2"])
+    assert sorted(called) == ["1", "2"]
+    assert set(errors) == {"error", "slow"}
+    assert isinstance(errors["error"], RuntimeError)
+    assert isinstance(errors["slow"], TimeoutError)
+
+
+def test_invalid_concurrency():
+    """Test that concurrency must be positive."""
+    with pytest.raises(ValueError, match="at least 1"):
+        CallbackDispatcher(concurrency=0)
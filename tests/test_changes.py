@@ -0,0 +1,141 @@
+"""Test for the change streams of the GDACS feed manager."""
+
+import asyncio
+from http import HTTPStatus
+
+import aiohttp
+import pytest
+
+from aio_georss_gdacs.changes import (
+    OVERFLOW_BLOCK,
+    OVERFLOW_DROP_NEWEST,
+    OVERFLOW_DROP_OLDEST,
+    EntryAdded,
+    EntryRemoved,
+    EntryUpdated,
+    GdacsChange,
+    GdacsChangeStream,
+)
+from aio_georss_gdacs.feed_manager import GdacsFeedManager
+from tests.utils import load_fixture
+
+
+@pytest.mark.asyncio
+async def test_stream_batches():
+    """Test taking changes one by one and in batches."""
+    stream = GdacsChangeStream(max_size=10)
+    assert repr(stream) == "<GdacsChangeStream(max_size=10, overflow=block, pending=0)>"
+    for index in range(5):
+        await stream.put(GdacsChange(str(index)))
+    assert len(stream) == 5
+    assert (await anext(stream)).external_id == "0"
+    assert [change.external_id for change in await stream.get_batch(2)] == ["1", "2"]
+    await stream.aclose()
+    assert stream.closed
+    # Changes added after closing are ignored, pending changes are still taken.
+    await stream.put(GdacsChange("5"))
+    assert [
+        [change.external_id for change in changes] async for changes in stream.batches()
+    ] == [["3", "4"]]
+    assert [change async for change in stream] == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("overflow", "expected"),
+    [(OVERFLOW_DROP_OLDEST, ["2", "3", "4"]), (OVERFLOW_DROP_NEWEST, ["0", "1", "2"])],
+)
+async def test_stream_overflow_drop(overflow, expected):
+    """Test discarding changes if the stream is full."""
+    stream = GdacsChangeStream(max_size=3, overflow=overflow)
+    for index in range(5):
+        await stream.put(GdacsChange(str(index)))
+    assert stream.dropped == 2
+    assert [change.external_id for change in await stream.get_batch()] == expected
+
+
+@pytest.mark.asyncio
+async def test_stream_overflow_block():
+    """Test waiting for the consumer if the stream is full."""
+    stream = GdacsChangeStream(max_size=2, overflow=OVERFLOW_BLOCK)
+
+    async def _produce():
+        for index in range(5):
+            await stream.put(GdacsChange(str(index)))
+        await stream.aclose()
+
+    producer = asyncio.create_task(_produce())
+    await asyncio.sleep(0)
+    assert len(stream) == 2
+    assert not producer.done()
+    received = [change.external_id async for change in stream]
+    await producer
+    assert received == ["0", "1", "2", "3", "4"]
+    assert stream.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_invalid():
+    """Test creating streams with invalid arguments."""
+    with pytest.raises(ValueError, match="Maximum size"):
+        GdacsChangeStream(max_size=0)
+    with pytest.raises(ValueError, match="overflow policy"):
+        GdacsChangeStream(overflow="invalid")
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_changes(mock_aiointercept):
+    """Test streaming changes of feed manager updates."""
+    for fixture in ("gdacs-1.xml", "gdacs-3.xml"):
+        mock_aiointercept.get(
+            "https://www.gdacs.org/xml/rss.xml",
+            status=HTTPStatus.OK,
+            body=load_fixture(fixture),
+        )
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml", status=HTTPStatus.INTERNAL_SERVER_ERROR
+    )
+    callbacks = []
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+
+        async def _callback(external_id: str) -> None:
+            """Record callback."""
+            callbacks.append(external_id)
+
+        feed_manager = GdacsFeedManager(
+            websession, _callback, _callback, _callback, (-41.2, 174.7)
+        )
+        async with feed_manager.changes() as stream:
+            await feed_manager.update()
+            changes = await stream.get_batch()
+            assert [type(change) for change in changes] == [EntryAdded] * 4
+            assert [change.external_id for change in changes] == [
+                "DR1013588",
+                "DR1013682",
+                "EQ1199929",
+                "TC1000643",
+            ]
+            assert changes[3].entry is feed_manager.feed_entries["TC1000643"]
+
+            await feed_manager.update()
+            changes = {
+                change.external_id: change for change in await stream.get_batch()
+            }
+            assert {type(change) for change in changes.values()} == {EntryUpdated}
+            assert changes["TC1000643"].changes == {"version": (1, 2)}
+            assert changes["TC1000643"].entry.version == 2
+            assert changes["DR1013682"].changes == {"alert_level": ("Green", "Orange")}
+            assert changes["EQ1199929"].changes == {}
+
+            # All entries are removed after an error.
+            previous = feed_manager.feed_entries["TC1000643"]
+            await feed_manager.update()
+            changes = await stream.get_batch()
+            assert [type(change) for change in changes] == [EntryRemoved] * 4
+            assert changes[3].entry is previous
+        assert len(callbacks) == 12
+
+        # Closed streams receive no more changes.
+        assert stream.closed
+        assert feed_manager._change_streams == []  # noqa: SLF001
@@ -0,0 +1,47 @@
+"""Test for the GDACS date parser."""
+
+import datetime
+
+from dateutil import parser
+import pytest
+
+from aio_georss_gdacs.date_parser import parse_date
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "Sun, 29 Dec 2019 12:00:00 GMT",
+        "Mon, 30 Dec 2019 01:27:00 UTC",
+        "30 Dec 2019 01:27:00 GMT",
+        "Mon, 30 Dec 2019 01:27 GMT",
+        "Mon, 30 Dec 2019 01:27:00 +0000",
+        "Mon, 30 Dec 2019 11:27:00 +1000",
+        "Mon, 30 Dec 2019 01:27:00 -0530",
+        "2019-12-29T12:00:00Z",
+        "2019-12-29T12:00:00+01:00",
+        "2019-12-29T12:00:00",
+        "2019-12-29",
+        "Mon, 30 Dec 2019 01:27:00.5 GMT",
+        "December 30, 2019 1:27 AM",
+    ],
+)
+def test_parse_date_matches_dateutil(value):
+    """Test that parsed dates are identical to dateutil's."""
+    expected = parser.parse(value)
+    parsed_date = parse_date(value)
+    assert parsed_date == expected
+    assert parsed_date.utcoffset() == expected.utcoffset()
+
+
+def test_parse_date_rfc822():
+    """Test parsing the date format used by GDACS."""
+    assert parse_date("Sun, 29 Dec 2019 12:00:00 GMT") == datetime.datetime(
+        2019, 12, 29, 12, 0, 0, tzinfo=datetime.UTC
+    )
+
+
+def test_parse_date_invalid():
+    """Test parsing an invalid date."""
+    with pytest.raises(ValueError, match="day is out of range"):
+        parse_date("Sun, 32 Dec 2019 12:00:00 GMT")
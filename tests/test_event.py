@@ -0,0 +1,56 @@
+"""Test for the GDACS event."""
+
+import dataclasses
+import datetime
+
+from aio_georss_client.xml_parser import XmlParser
+import pytest
+import pytz
+
+from aio_georss_gdacs.event import GdacsEvent
+from aio_georss_gdacs.feed_entry import GdacsFeedEntry
+from tests.utils import load_fixture
+
+
+def test_event_from_entry():
+    """Test creating an event from a feed entry."""
+    home_coordinates = (-41.2, 174.7)
+    feed_item = XmlParser().parse(load_fixture("gdacs-1.xml")).entries[0]
+    event = GdacsEvent.from_entry(GdacsFeedEntry(home_coordinates, feed_item))
+    assert event.external_id == "TC1000643"
+    assert event.event_id == 1000643
+    assert event.event_type_short == "TC"
+    assert event.event_type == "Tropical Cyclone"
+    assert event.event_name == "CALVINIA-19"
+    assert event.alert_level == "Green"
+    assert event.country == "Mauritius"
+    assert event.is_current is True
+    assert event.version == 1
+    assert event.from_date == datetime.datetime(2019, 12, 29, 12, 0, 0, tzinfo=pytz.utc)
+    assert event.to_date == datetime.datetime(2019, 12, 29, 12, 0, 0, tzinfo=pytz.utc)
+    assert event.published == datetime.datetime(2019, 12, 29, 12, 0, 0, tzinfo=pytz.utc)
+    assert event.severity == "Tropical Storm (maximum wind speed of 93 km/h)"
+    assert event.vulnerability == "Medium"
+    assert event.magnitude is None
+    assert event.depth is None
+    assert event.wind_speed == 92.592
+    assert event.affected_population == 0
+    assert event.vulnerability_score == 2.0
+    assert event.coordinates == pytest.approx((-19.4, 59.8))
+    assert event.bounding_box == pytest.approx(
+        (-46.7828750315965, 55.0780533046962, -20.7828750315965, 81.0780533046962)
+    )
+    assert round(abs(event.distance_to_home - 10517.9), 1) == 0
+    assert not hasattr(event, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        event.version = 2
+
+
+def test_event_from_empty_entry():
+    """Test creating an event from a feed entry without underlying RSS data."""
+    event = GdacsEvent.from_entry(GdacsFeedEntry((-41.2, 174.7), None))
+    assert event.external_id is None
+    assert event.event_type == "Unknown"
+    assert event.coordinates is None
+    assert event.bounding_box is None
+    assert event.distance_to_home == float("inf")
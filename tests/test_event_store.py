@@ -0,0 +1,156 @@
+"""Test for the GDACS event store."""
+
+import asyncio
+import dataclasses
+import datetime
+from http import HTTPStatus
+
+from aio_georss_client.xml_parser import XmlParser
+import aiohttp
+import pytest
+
+from aio_georss_gdacs.event import GdacsEvent
+from aio_georss_gdacs.event_store import GdacsEventStore
+from aio_georss_gdacs.feed_entry import GdacsFeedEntry
+from aio_georss_gdacs.feed_manager import GdacsFeedManager
+from tests.utils import load_fixture
+
+
+def _events(fixture):
+    """Return events of the fixture."""
+    return [
+        GdacsEvent.from_entry(GdacsFeedEntry((-41.2, 174.7), feed_item))
+        for feed_item in XmlParser().parse(load_fixture(fixture)).entries
+    ]
+
+
+def _external_ids(events):
+    """Return external ids of the events."""
+    return [event.external_id for event in events]
+
+
+def test_query():
+    """Test querying events by their indexed properties."""
+    store = GdacsEventStore(_events("gdacs-1.xml"))
+    assert repr(store) == "<GdacsEventStore(events=4)>"
+    assert len(store) == 4
+    assert "EQ1199929" in store
+    assert store.get("EQ1199929").country == "South Africa"
+    assert store.get("XX1") is None
+    assert _external_ids(store.query()) == [
+        "DR1013588",
+        "DR1013682",
+        "EQ1199929",
+        "TC1000643",
+    ]
+    assert _external_ids(store.query(event_types=["DR"])) == [
+        "DR1013588",
+        "DR1013682",
+    ]
+    assert _external_ids(store.query(event_types=["TC", "EQ"])) == [
+        "EQ1199929",
+        "TC1000643",
+    ]
+    assert store.query(alert_levels=["Red"]) == []
+    assert len(store.query(alert_levels=["Green"], is_current=True)) == 4
+    assert store.query(is_current=False) == []
+    # Events affecting several countries are found by each of them.
+    assert _external_ids(store.query(countries=["Iran"])) == ["DR1013682"]
+    assert _external_ids(store.query(countries=["Australia", "Turkey"])) == [
+        "DR1013588",
+        "DR1013682",
+    ]
+    assert store.query(countries=["Iran"], event_types=["EQ"]) == []
+
+
+def test_query_dates():
+    """Test querying events overlapping a time window."""
+    store = GdacsEventStore(_events("gdacs-1.xml"))
+    assert _external_ids(
+        store.query(
+            start=datetime.datetime(2019, 12, 29, tzinfo=datetime.UTC),
+            end=datetime.datetime(2019, 12, 29, 12, tzinfo=datetime.UTC),
+        )
+    ) == ["DR1013588", "DR1013682", "TC1000643"]
+    assert _external_ids(
+        store.query(end=datetime.datetime(2019, 10, 1, tzinfo=datetime.UTC))
+    ) == ["DR1013588"]
+    assert _external_ids(
+        store.query(
+            start=datetime.datetime(2019, 12, 29, 12, tzinfo=datetime.UTC),
+            event_types=["TC", "EQ"],
+        )
+    ) == ["TC1000643"]
+    assert _external_ids(store.query(predicate=lambda event: event.version == 1)) == [
+        "EQ1199929",
+        "TC1000643",
+    ]
+
+
+def test_add_and_remove():
+    """Test keeping indexes up to date when events change."""
+    store = GdacsEventStore()
+    events = _events("gdacs-1.xml")
+    store.update(events)
+    assert len(store) == 4
+    changed = dataclasses.replace(
+        events[2],
+        alert_level="Orange",
+        to_date=datetime.datetime(2020, 1, 1, tzinfo=datetime.UTC),
+    )
+    store.add(changed)
+    assert len(store) == 4
+    assert _external_ids(store.query(alert_levels=["Orange"])) == ["DR1013682"]
+    assert len(store.query(alert_levels=["Green"])) == 3
+    assert store.remove("DR1013682") is changed
+    assert store.remove("DR1013682") is None
+    assert store.query(countries=["Iran"]) == []
+    assert store.query(alert_levels=["Orange"]) == []
+    store.update(events[:1])
+    assert _external_ids(store) == ["TC1000643"]
+    store.clear()
+    assert len(store) == 0
+    assert store.query(event_types=["TC"]) == []
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_events(mock_aiointercept):
+    """Test that the feed manager keeps the event store up to date."""
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.OK,
+        body=load_fixture("gdacs-1.xml"),
+    )
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.OK,
+        body=load_fixture("gdacs-3.xml"),
+    )
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.INTERNAL_SERVER_ERROR,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+
+        async def _callback(external_id: str) -> None:
+            """Ignore callback."""
+
+        feed_manager = GdacsFeedManager(
+            websession, _callback, _callback, _callback, (-41.2, 174.7)
+        )
+        await feed_manager.update()
+        # Events are only built when read.
+        assert len(feed_manager._events) == 0  # noqa: SLF001
+        assert len(feed_manager.events) == 4
+        assert feed_manager.events.query(alert_levels=["Orange"]) == []
+        earthquake = feed_manager.events.get("EQ1199929")
+        await feed_manager.update()
+        # Unchanged events are kept.
+        assert feed_manager.events.get("EQ1199929") is earthquake
+        assert _external_ids(feed_manager.events.query(alert_levels=["Orange"])) == [
+            "DR1013682"
+        ]
+        assert feed_manager.events.get("TC1000643").version == 2
+        await feed_manager.update()
+        assert len(feed_manager.events) == 0
@@ -1,15 +1,22 @@
 """Test for the GDACS feed."""
 
 import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import datetime
 from http import HTTPStatus
+import threading
+from unittest import mock
 
-from aio_georss_client.consts import UPDATE_OK, UPDATE_OK_NO_DATA
+from aio_georss_client.consts import UPDATE_ERROR, UPDATE_OK, UPDATE_OK_NO_DATA
+from aio_georss_client.feed import GeoRssFeed
 import aiohttp
+from aiointercept import CallbackResult
 import pytest
 import pytz
 
-from aio_georss_gdacs.consts import ATTRIBUTION
+from aio_georss_gdacs import feed as feed_module
+from aio_georss_gdacs.consts import ATTRIBUTION, UPDATE_OK_NOT_MODIFIED, URL_24H
+from aio_georss_gdacs.event import GdacsEvent
 from aio_georss_gdacs.feed import GdacsFeed
 from tests.utils import load_fixture
 
@@ -128,6 +135,42 @@ async def test_update_ok_with_categories_filter(mock_aiointercept):
         assert feed_entry.external_id == "DR1013588"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("streaming_parser", [False, True])
+@pytest.mark.parametrize(
+    ("filter_radius", "filter_categories"),
+    [(None, None), (None, ["Drought"]), (5000.0, None), (20000.0, ["Drought"])],
+)
+async def test_update_filter_without_geometries(
+    mock_aiointercept, streaming_parser, filter_radius, filter_categories
+):
+    """Test filtering entries does not build their geometries."""
+    home_coordinates = (-41.2, 174.7)
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.OK,
+        body=load_fixture("gdacs-1.xml"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = GdacsFeed(
+            websession,
+            home_coordinates,
+            filter_radius=filter_radius,
+            filter_categories=filter_categories,
+            streaming_parser=streaming_parser,
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        for entry in entries:
+            assert "geometries" not in entry.__dict__
+        # Same entries as the filter of the GeoRSS client.
+        expected = GeoRssFeed._filter_entries(feed, entries)  # noqa: SLF001
+        assert [entry.external_id for entry in entries] == [
+            entry.external_id for entry in expected
+        ]
+
+
 @pytest.mark.asyncio
 async def test_empty_feed(mock_aiointercept):
     """Test updating feed is ok when feed does not contain any entries."""
@@ -176,3 +219,308 @@ async def test_update_not_xml(mock_aiointercept):
         status, entries = await feed.update()
         assert status == UPDATE_OK_NO_DATA
         assert entries is None
+
+
+@pytest.mark.asyncio
+async def test_update_ok_streaming_parser(mock_aiointercept):
+    """Test updating feed with streaming parser produces the same entries."""
+    home_coordinates = (-41.2, 174.7)
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.OK,
+        body=load_fixture("gdacs-1.xml"),
+        repeat=True,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = GdacsFeed(websession, home_coordinates)
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        feed = GdacsFeed(websession, home_coordinates, streaming_parser=True)
+        status, streamed_entries = await feed.update()
+        assert status == UPDATE_OK
+        assert len(streamed_entries) == len(entries) == 4
+        assert feed.last_timestamp == datetime.datetime(
+            2019, 12, 30, 1, 27, 0, tzinfo=pytz.utc
+        )
+        for entry, streamed_entry in zip(entries, streamed_entries, strict=True):
+            assert streamed_entry.external_id == entry.external_id
+            assert streamed_entry.title == entry.title
+            assert streamed_entry.geometries == entry.geometries
+            assert streamed_entry.distance_to_home == entry.distance_to_home
+            assert streamed_entry.published == entry.published
+            assert streamed_entry.from_date == entry.from_date
+            assert streamed_entry.population == entry.population
+            assert streamed_entry.severity == entry.severity
+            assert streamed_entry.vulnerability == entry.vulnerability
+
+
+@pytest.mark.asyncio
+async def test_update_not_xml_streaming_parser(mock_aiointercept):
+    """Test updating feed with streaming parser where payload is not XML."""
+    home_coordinates = (-41.2, 174.7)
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.OK,
+        body="\x00\x00\x00",
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = GdacsFeed(websession, home_coordinates, streaming_parser=True)
+        status, entries = await feed.update()
+        assert status == UPDATE_OK_NO_DATA
+        assert entries is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+@pytest.mark.parametrize("streaming_parser", [False, True])
+async def test_update_ok_executor(mock_aiointercept, executor_class, streaming_parser):
+    """Test parsing in an executor produces the same entries."""
+    home_coordinates = (-41.2, 174.7)
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.OK,
+        body=load_fixture("gdacs-1.xml"),
+        repeat=True,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = GdacsFeed(
+            websession, home_coordinates, streaming_parser=streaming_parser
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        with executor_class(max_workers=1) as executor:
+            feed = GdacsFeed(
+                websession,
+                home_coordinates,
+                streaming_parser=streaming_parser,
+                executor=executor,
+            )
+            status, executor_entries = await feed.update()
+        assert status == UPDATE_OK
+        assert feed.last_timestamp == datetime.datetime(
+            2019, 12, 30, 1, 27, 0, tzinfo=pytz.utc
+        )
+        assert len(executor_entries) == len(entries) == 4
+        for entry, executor_entry in zip(entries, executor_entries, strict=True):
+            assert executor_entry.external_id == entry.external_id
+            assert executor_entry.title == entry.title
+            assert executor_entry.geometries == entry.geometries
+            assert executor_entry.distance_to_home == entry.distance_to_home
+            assert executor_entry.published == entry.published
+            assert executor_entry.alert_level == entry.alert_level
+            assert executor_entry.population == entry.population
+
+
+@pytest.mark.asyncio
+async def test_update_not_xml_executor(mock_aiointercept):
+    """Test parsing in an executor where payload is not XML."""
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.OK,
+        body="\x00\x00\x00",
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            feed = GdacsFeed(
+                websession, (-41.2, 174.7), streaming_parser=True, executor=executor
+            )
+            status, entries = await feed.update()
+        assert status == UPDATE_OK_NO_DATA
+        assert entries is None
+
+
+@pytest.mark.asyncio
+async def test_update_executor_runs_loop(mock_aiointercept):
+    """Test that the event loop keeps running while parsing in an executor."""
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.OK,
+        body=load_fixture("gdacs-1.xml"),
+    )
+    loop_ran = threading.Event()
+    parse_feed = feed_module._parse  # noqa: SLF001
+
+    def _parse(*args):
+        """Parse only once a callback ran on the event loop."""
+        assert loop_ran.wait(5)
+        return parse_feed(*args)
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            feed = GdacsFeed(websession, (-41.2, 174.7), executor=executor)
+            with mock.patch("aio_georss_gdacs.feed._parse", wraps=_parse) as parse:
+                asyncio.get_running_loop().call_soon(loop_ran.set)
+                status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert len(entries) == 4
+        parse.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_update_events(mock_aiointercept):
+    """Test updating feed returning events."""
+    home_coordinates = (-41.2, 174.7)
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.OK,
+        body=load_fixture("gdacs-1.xml"),
+    )
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.INTERNAL_SERVER_ERROR,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = GdacsFeed(websession, home_coordinates, streaming_parser=True)
+        status, events = await feed.update_events()
+        assert status == UPDATE_OK
+        assert [event.external_id for event in events] == [
+            "TC1000643",
+            "EQ1199929",
+            "DR1013682",
+            "DR1013588",
+        ]
+        assert isinstance(events[0], GdacsEvent)
+        assert events[0].alert_level == "Green"
+
+        status, events = await feed.update_events()
+        assert status == UPDATE_ERROR
+        assert events is None
+
+
+@pytest.mark.asyncio
+async def test_update_conditional_requests(mock_aiointercept):
+    """Test updating feed with conditional requests."""
+    home_coordinates = (-41.2, 174.7)
+    request_headers = []
+
+    def _conditional_response(url, **kwargs):
+        """Return 304 if the client already has the current version."""
+        headers = kwargs["headers"]
+        request_headers.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return CallbackResult(status=HTTPStatus.NOT_MODIFIED)
+        return CallbackResult(
+            body=load_fixture("gdacs-1.xml"),
+            content_type="application/xml",
+            headers={
+                "ETag": '"v1"',
+                "Last-Modified": "Mon, 30 Dec 2019 01:30:00 GMT",
+            },
+        )
+
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        callback=_conditional_response,
+        repeat=True,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = GdacsFeed(websession, home_coordinates, conditional_requests=True)
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert len(entries) == 4
+        assert "If-None-Match" not in request_headers[0]
+
+        status, not_modified_entries = await feed.update()
+        assert status == UPDATE_OK_NOT_MODIFIED
+        assert not_modified_entries is entries
+        assert request_headers[1]["If-None-Match"] == '"v1"'
+        assert feed.not_modified_count == 1
+        assert request_headers[1]["If-Modified-Since"] == (
+            "Mon, 30 Dec 2019 01:30:00 GMT"
+        )
+        assert feed.last_timestamp == datetime.datetime(
+            2019, 12, 30, 1, 27, 0, tzinfo=pytz.utc
+        )
+
+        # Without conditional requests, validators are not sent.
+        feed = GdacsFeed(websession, home_coordinates)
+        await feed.update()
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert "If-None-Match" not in request_headers[3]
+        assert feed.not_modified_count == 0
+
+
+@pytest.mark.asyncio
+async def test_update_skip_unchanged_content(mock_aiointercept):
+    """Test updating feed skips processing when content is unchanged."""
+    home_coordinates = (-41.2, 174.7)
+    for fixture in ("gdacs-1.xml", "gdacs-1.xml", "gdacs-2.xml"):
+        mock_aiointercept.get(
+            "https://www.gdacs.org/xml/rss.xml",
+            status=HTTPStatus.OK,
+            body=load_fixture(fixture),
+        )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = GdacsFeed(websession, home_coordinates, skip_unchanged_content=True)
+        with mock.patch.object(
+            feed,
+            "_parse",
+            wraps=feed._parse,  # noqa: SLF001
+        ) as mock_parse:
+            status, entries = await feed.update()
+            assert status == UPDATE_OK
+            assert len(entries) == 4
+
+            status, unchanged_entries = await feed.update()
+            assert status == UPDATE_OK_NOT_MODIFIED
+            assert unchanged_entries is entries
+            assert mock_parse.call_count == 1
+
+            status, entries = await feed.update()
+            assert status == UPDATE_OK
+            assert len(entries) == 0
+            assert mock_parse.call_count == 2
+
+        assert feed.update_count == 3
+        assert feed.unchanged_content_count == 1
+        assert feed.not_modified_count == 0
+
+
+@pytest.mark.asyncio
+async def test_update_skip_unchanged_pub_date(mock_aiointercept):
+    """Test updating feed skips parsing when publication date is unchanged."""
+    home_coordinates = (-41.2, 174.7)
+    for fixture in ("gdacs-1.xml", "gdacs-3.xml", "gdacs-4.xml"):
+        mock_aiointercept.get(
+            "https://www.gdacs.org/xml/rss_24h.xml",
+            status=HTTPStatus.OK,
+            body=load_fixture(fixture),
+        )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = GdacsFeed(
+            websession,
+            home_coordinates,
+            skip_unchanged_pub_date=True,
+            url=URL_24H,
+        )
+        assert feed.url == "https://www.gdacs.org/xml/rss_24h.xml"
+        with mock.patch.object(
+            feed,
+            "_parse",
+            wraps=feed._parse,  # noqa: SLF001
+        ) as mock_parse:
+            status, entries = await feed.update()
+            assert status == UPDATE_OK
+            assert len(entries) == 4
+
+            # Same publication date, content is not even looked at.
+            status, unchanged_entries = await feed.update()
+            assert status == UPDATE_OK_NOT_MODIFIED
+            assert unchanged_entries is entries
+            assert mock_parse.call_count == 1
+
+            status, entries = await feed.update()
+            assert status == UPDATE_OK
+            assert len(entries) == 2
+            assert mock_parse.call_count == 2
+
+        assert feed.unchanged_content_count == 1
@@ -0,0 +1,183 @@
+"""Test for the GDACS feed aggregator."""
+
+import asyncio
+from http import HTTPStatus
+
+from aio_georss_client.consts import UPDATE_ERROR, UPDATE_OK
+from aio_georss_client.status_update import StatusUpdate
+import aiohttp
+from aiointercept import CallbackResult
+import pytest
+
+from aio_georss_gdacs.consts import UPDATE_OK_NOT_MODIFIED
+from aio_georss_gdacs.feed_aggregator import GdacsFeedAggregator
+from tests.utils import load_fixture
+
+
+class _Recorder:
+    """Record callbacks of a subscription."""
+
+    def __init__(self):
+        """Initialise the recorder."""
+        self.generated = []
+        self.updated = []
+        self.removed = []
+        self.status_updates = []
+
+    async def generate(self, external_id: str) -> None:
+        """Generate new entity."""
+        self.generated.append(external_id)
+
+    async def update(self, external_id: str) -> None:
+        """Update entity."""
+        self.updated.append(external_id)
+
+    async def remove(self, external_id: str) -> None:
+        """Remove entity."""
+        self.removed.append(external_id)
+
+    async def status(self, status_update: StatusUpdate) -> None:
+        """Record status update."""
+        self.status_updates.append(status_update)
+
+
+def _subscribe(aggregator, recorder, coordinates, **kwargs):
+    """Subscribe the recorder to the aggregator."""
+    return aggregator.subscribe(
+        recorder.generate,
+        recorder.update,
+        recorder.remove,
+        coordinates,
+        status_async_callback=recorder.status,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_feed_aggregator(mock_aiointercept):
+    """Test the feed aggregator with several subscriptions."""
+    requests = []
+
+    def _response(url, **kwargs):
+        """Return the feed and count requests."""
+        requests.append(url)
+        return CallbackResult(
+            body=load_fixture("gdacs-1.xml"), content_type="application/xml"
+        )
+
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml", callback=_response, repeat=True
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        aggregator = GdacsFeedAggregator(websession)
+        wellington = _Recorder()
+        perth = _Recorder()
+        earthquakes = _Recorder()
+        subscription_wellington = _subscribe(aggregator, wellington, (-41.2, 174.7))
+        subscription_perth = _subscribe(
+            aggregator, perth, (-31.9, 115.9), filter_radius=500.0
+        )
+        _subscribe(
+            aggregator,
+            earthquakes,
+            (-41.2, 174.7),
+            filter_categories=["Earthquake"],
+        )
+        assert repr(aggregator).endswith("subscriptions=3)>")
+        assert (
+            repr(subscription_perth) == "<GdacsFeedManagerBase("
+            "feed=<GdacsSubscriptionFeed(home=(-31.9, 115.9), "
+            "url=https://www.gdacs.org/xml/rss.xml, "
+            "radius=500.0, categories=None)>)>"
+        )
+
+        await aggregator.update()
+
+        assert len(requests) == 1
+        assert aggregator.status == UPDATE_OK
+        assert len(aggregator.feed_entries) == 4
+        assert len(wellington.generated) == 4
+        assert perth.generated == ["DR1013588"]
+        assert earthquakes.generated == ["EQ1199929"]
+        assert earthquakes.status_updates[0].status == UPDATE_OK
+        # Distances are relative to each subscription's home coordinates.
+        assert subscription_perth.feed_entries[
+            "DR1013588"
+        ].distance_to_home == pytest.approx(125.2, 0.001)
+        assert subscription_wellington.feed_entries[
+            "DR1013588"
+        ].distance_to_home == pytest.approx(5157.2, 0.001)
+
+        aggregator.unsubscribe(subscription_wellington)
+        await aggregator.update()
+
+        assert len(requests) == 2
+        assert len(wellington.generated) == 4
+        assert len(wellington.updated) == 0
+        assert perth.updated == ["DR1013588"]
+        assert len(aggregator.subscriptions) == 2
+
+
+@pytest.mark.asyncio
+async def test_feed_aggregator_not_modified(mock_aiointercept):
+    """Test the feed aggregator with a feed that has not been modified."""
+
+    def _conditional_response(url, **kwargs):
+        """Return 304 if the client already has the current version."""
+        if kwargs["headers"].get("If-None-Match") == '"v1"':
+            return CallbackResult(status=HTTPStatus.NOT_MODIFIED)
+        return CallbackResult(
+            body=load_fixture("gdacs-1.xml"),
+            content_type="application/xml",
+            headers={"ETag": '"v1"'},
+        )
+
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        callback=_conditional_response,
+        repeat=True,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        aggregator = GdacsFeedAggregator(websession, conditional_requests=True)
+        first = _Recorder()
+        _subscribe(aggregator, first, (-41.2, 174.7))
+        await aggregator.update()
+
+        # Subscription added later still receives all entries.
+        second = _Recorder()
+        _subscribe(aggregator, second, (-41.2, 174.7))
+        await aggregator.update()
+
+        assert aggregator.status == UPDATE_OK_NOT_MODIFIED
+        assert len(first.generated) == 4
+        assert len(first.updated) == 0
+        assert first.status_updates[1].status == UPDATE_OK_NOT_MODIFIED
+        assert len(second.generated) == 4
+        assert second.status_updates[0].status == UPDATE_OK
+
+
+@pytest.mark.asyncio
+async def test_feed_aggregator_error(mock_aiointercept):
+    """Test the feed aggregator removing entities after an error."""
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.OK,
+        body=load_fixture("gdacs-1.xml"),
+    )
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.INTERNAL_SERVER_ERROR,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        aggregator = GdacsFeedAggregator(websession)
+        recorder = _Recorder()
+        _subscribe(aggregator, recorder, (-41.2, 174.7))
+        await aggregator.update()
+        await aggregator.update()
+
+        assert aggregator.status == UPDATE_ERROR
+        assert recorder.status_updates[1].status == UPDATE_ERROR
+        assert sorted(recorder.removed) == sorted(recorder.generated)
@@ -1,6 +1,12 @@
 """Test for the GDACS feed entry."""
 
+import datetime
+from unittest import mock
+
+from aio_georss_client.xml_parser.feed_item import FeedItem
+from aio_georss_client.xml_parser.geometry import Point, Polygon
 import pytest
+import pytz
 
 from aio_georss_gdacs.feed_entry import GdacsFeedEntry
 
@@ -10,8 +16,11 @@ async def test_empty_feed_entry():
     """Test feed entry without underlying RSS data."""
     home_coordinates = (-41.2, 174.7)
     feed_entry = GdacsFeedEntry(home_coordinates, None)
+    assert feed_entry.affected_population is None
     assert feed_entry.alert_level is None
+    assert feed_entry.bounding_box is None
     assert feed_entry.country is None
+    assert feed_entry.depth is None
     assert feed_entry.duration_in_week is None
     assert feed_entry.event_id is None
     assert feed_entry.event_name is None
@@ -20,9 +29,175 @@ async def test_empty_feed_entry():
     assert feed_entry.from_date is None
     assert feed_entry.icon_url is None
     assert feed_entry.is_current is None
+    assert feed_entry.magnitude is None
     assert feed_entry.population is None
     assert feed_entry.severity is None
     assert feed_entry.temporary is None
     assert feed_entry.to_date is None
     assert feed_entry.version is None
     assert feed_entry.vulnerability is None
+    assert feed_entry.vulnerability_score is None
+    assert feed_entry.wind_speed is None
+
+
+def test_feed_entry_decodes_attributes_once():
+    """Test that feed entry attributes are only decoded on first access."""
+    home_coordinates = (-41.2, 174.7)
+    feed_item = FeedItem(
+        {
+            "gdacs:eventid": "1000643",
+            "gdacs:fromdate": "Sun, 29 Dec 2019 12:00:00 GMT",
+        }
+    )
+    feed_entry = GdacsFeedEntry(home_coordinates, feed_item)
+    with mock.patch.object(
+        feed_item,
+        "get_additional_attribute",
+        wraps=feed_item.get_additional_attribute,
+    ) as mock_get:
+        assert feed_entry.event_id == 1000643
+        from_date = feed_entry.from_date
+        assert from_date == datetime.datetime(2019, 12, 29, 12, 0, 0, tzinfo=pytz.utc)
+        assert feed_entry.event_id == 1000643
+        assert feed_entry.from_date is from_date
+        assert mock_get.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("attributes", "expected"),
+    [
+        (
+            {
+                "gdacs:severity": {
+                    "@unit": "M",
+                    "@value": "5.5",
+                    "#text": "Magnitude 5.5M, Depth:10.25km",
+                },
+                "gdacs:population": {
+                    "@unit": "Population in 100km",
+                    "@value": "70691",
+                    "#text": "About 70000 people within 100km",
+                },
+                "gdacs:vulnerability": {"@value": "1.3145341380124"},
+            },
+            (5.5, 10.25, None, 70691, 1.3145341380124),
+        ),
+        (
+            {
+                "gdacs:severity": {
+                    "@unit": "km/h",
+                    "@value": "92.592",
+                    "#text": "Tropical Storm (maximum wind speed of 93 km/h)",
+                },
+                "gdacs:population": {"@unit": "Pop74", "@value": "4476940"},
+                "gdacs:vulnerability": {"@value": "2", "#text": "Medium"},
+            },
+            (None, None, 92.592, 4476940, 2.0),
+        ),
+        (
+            {
+                "gdacs:severity": {
+                    "@unit": "km2",
+                    "@value": "349846",
+                    "#text": "Minor impact for agricultural drought in 349846 km2",
+                },
+                "gdacs:population": {"@unit": "", "@value": "0"},
+                "gdacs:vulnerability": {"@value": "invalid"},
+            },
+            (None, None, None, 0, None),
+        ),
+        (
+            {
+                "gdacs:severity": "Magnitude 5.5M, Depth:10km",
+                "gdacs:population": "No people within 100km",
+            },
+            (None, None, None, None, None),
+        ),
+    ],
+)
+def test_feed_entry_numerical_attributes(attributes, expected):
+    """Test numerical values of severity, population and vulnerability."""
+    feed_entry = GdacsFeedEntry((-41.2, 174.7), FeedItem(attributes))
+    assert (
+        feed_entry.magnitude,
+        feed_entry.depth,
+        feed_entry.wind_speed,
+        feed_entry.affected_population,
+        feed_entry.vulnerability_score,
+    ) == expected
+
+
+def test_feed_entry_decodes_geometries_lazily():
+    """Test that geometries are only decoded when needed."""
+    feed_item = FeedItem(
+        {
+            "gdacs:alertlevel": "Green",
+            "georss:point": (-25.0, 134.0),
+            "geo:Point": {"geo:lat": -25.0, "geo:long": 134.0},
+            "georss:polygon": "-12.0 130.0 -12.0 142.0 -38.0 146.0 -12.0 130.0 1.0",
+        }
+    )
+    feed_entry = GdacsFeedEntry((-41.2, 174.7), feed_item)
+    assert feed_entry.alert_level == "Green"
+    assert "shapes" not in feed_entry.__dict__
+    assert feed_entry.coordinates == (-25.0, 134.0)
+    assert "shapes" in feed_entry.__dict__
+    # Points are only included once, an unpaired last number is dropped.
+    assert feed_entry.geometries == [
+        Point(-25.0, 134.0),
+        Polygon(
+            [
+                Point(-12.0, 130.0),
+                Point(-12.0, 142.0),
+                Point(-38.0, 146.0),
+                Point(-12.0, 130.0),
+            ]
+        ),
+    ]
+    assert feed_entry.geometries is feed_entry.geometries
+    assert feed_entry.bounding_box == (-38.0, 130.0, -12.0, 146.0)
+    assert feed_entry.distance_to_home == pytest.approx(2473.1, abs=0.1)
+    # Home inside the polygon.
+    assert feed_entry.relocate((-20.0, 140.0)).distance_to_home == 0.0
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        {"georss:point": [(-25.0, 134.0), (-26.0, 135.0)]},
+        {"georss:where": {"gml:Point": {"gml:pos": (44.11, -66.23)}}},
+        {
+            "georss:where": {
+                "gml:Polygon": {
+                    "gml:exterior": {
+                        "gml:LinearRing": {
+                            "gml:posList": (42.36, -71.10, 42.37, -71.11, 42.36, -71.10)
+                        }
+                    }
+                }
+            }
+        },
+        {"geo:Point": {"geo:lat": 38.3728, "geo:long": 15.7213}},
+        {"geo:lat": -23.126413, "geo:long": 119.948006},
+        {"geo:lat": -23.126413},
+        {
+            "georss:point": (-25.0, 134.0),
+            "georss:polygon": [
+                (-10.0, 130.0, -20.0, 140.0),
+                (-30.0, 120.0, -31.0, 121.0),
+            ],
+        },
+    ],
+)
+def test_feed_entry_shapes(source):
+    """Test shapes match the geometries of the feed item."""
+    feed_item = FeedItem(source)
+    feed_entry = GdacsFeedEntry((-41.2, 174.7), feed_item)
+    assert feed_entry.geometries == feed_item.geometries
+
+
+def test_feed_entry_polygon_coordinates():
+    """Test coordinates of an entry with only a polygon."""
+    feed_item = FeedItem({"georss:polygon": (-10.0, 130.0, -20.0, 140.0, -30.0, 120.0)})
+    feed_entry = GdacsFeedEntry((-41.2, 174.7), feed_item)
+    assert feed_entry.coordinates == pytest.approx((-20.0, 130.0))
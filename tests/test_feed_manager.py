@@ -3,12 +3,17 @@
 import asyncio
 import datetime
 from http import HTTPStatus
+from unittest import mock
 
+from aio_georss_client.consts import UPDATE_OK
+from aio_georss_client.status_update import StatusUpdate
 import aiohttp
+from aiointercept import CallbackResult
 import pytest
 import pytz
 
-from aio_georss_gdacs.feed_manager import GdacsFeedManager
+from aio_georss_gdacs.consts import UPDATE_OK_NOT_MODIFIED, URL_7D, URL_24H
+from aio_georss_gdacs.feed_manager import GdacsFeedManager, GdacsMultiFeedManager
 from tests.utils import load_fixture
 
 
@@ -64,3 +69,345 @@ async def test_feed_manager(mock_aiointercept):
         assert len(generated_entity_external_ids) == 4
         assert len(updated_entity_external_ids) == 0
         assert len(removed_entity_external_ids) == 0
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_not_modified(mock_aiointercept):
+    """Test the feed manager with a feed that has not been modified."""
+    home_coordinates = (-41.2, 174.7)
+
+    def _conditional_response(url, **kwargs):
+        """Return 304 if the client already has the current version."""
+        if kwargs["headers"].get("If-None-Match") == '"v1"':
+            return CallbackResult(status=HTTPStatus.NOT_MODIFIED)
+        return CallbackResult(
+            body=load_fixture("gdacs-1.xml"),
+            content_type="application/xml",
+            headers={"ETag": '"v1"'},
+        )
+
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        callback=_conditional_response,
+        repeat=True,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        generated_entity_external_ids = []
+        updated_entity_external_ids = []
+        removed_entity_external_ids = []
+        status_updates = []
+
+        async def _generate_entity(external_id: str) -> None:
+            """Generate new entity."""
+            generated_entity_external_ids.append(external_id)
+
+        async def _update_entity(external_id: str) -> None:
+            """Update entity."""
+            updated_entity_external_ids.append(external_id)
+
+        async def _remove_entity(external_id: str) -> None:
+            """Remove entity."""
+            removed_entity_external_ids.append(external_id)
+
+        async def _status(status_update: StatusUpdate) -> None:
+            """Record status update."""
+            status_updates.append(status_update)
+
+        feed_manager = GdacsFeedManager(
+            websession,
+            _generate_entity,
+            _update_entity,
+            _remove_entity,
+            home_coordinates,
+            status_async_callback=_status,
+            conditional_requests=True,
+        )
+        await feed_manager.update()
+        assert len(generated_entity_external_ids) == 4
+        assert status_updates[0].status == UPDATE_OK
+
+        await feed_manager.update()
+        assert status_updates[1].status == UPDATE_OK_NOT_MODIFIED
+        assert status_updates[1].total == 4
+        assert status_updates[1].created == 0
+        assert status_updates[1].updated == 0
+        assert status_updates[1].removed == 0
+        assert len(feed_manager.feed_entries) == 4
+        assert len(generated_entity_external_ids) == 4
+        assert len(updated_entity_external_ids) == 0
+        assert len(removed_entity_external_ids) == 0
+        assert feed_manager.last_update_successful == feed_manager.last_update
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_feed_options(mock_aiointercept):
+    """Test the feed manager passing parser and skip options to its feed."""
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.OK,
+        body=load_fixture("gdacs-1.xml"),
+        repeat=True,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        status_updates = []
+
+        async def _callback(external_id: str) -> None:
+            """Ignore callback."""
+
+        async def _status(status_update: StatusUpdate) -> None:
+            """Record status update."""
+            status_updates.append(status_update)
+
+        feed_manager = GdacsFeedManager(
+            websession,
+            _callback,
+            _callback,
+            _callback,
+            (-41.2, 174.7),
+            status_async_callback=_status,
+            streaming_parser=True,
+            skip_unchanged_pub_date=True,
+        )
+        # The generic parser is not used.
+        with mock.patch("aio_georss_gdacs.feed.XmlParser", side_effect=AssertionError):
+            await feed_manager.update()
+            await feed_manager.update()
+        assert [status.status for status in status_updates] == [
+            UPDATE_OK,
+            UPDATE_OK_NOT_MODIFIED,
+        ]
+        assert len(feed_manager.feed_entries) == 4
+        assert feed_manager.feed.unchanged_content_count == 1
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_update_changed_only(mock_aiointercept):
+    """Test the feed manager only updating changed events."""
+    home_coordinates = (-41.2, 174.7)
+    for fixture in ("gdacs-1.xml", "gdacs-1.xml", "gdacs-3.xml"):
+        mock_aiointercept.get(
+            "https://www.gdacs.org/xml/rss.xml",
+            status=HTTPStatus.OK,
+            body=load_fixture(fixture),
+        )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        generated_entity_external_ids = []
+        updated_entity_external_ids = []
+        removed_entity_external_ids = []
+        status_updates = []
+
+        async def _generate_entity(external_id: str) -> None:
+            """Generate new entity."""
+            generated_entity_external_ids.append(external_id)
+
+        async def _update_entity(external_id: str) -> None:
+            """Update entity."""
+            updated_entity_external_ids.append(external_id)
+
+        async def _remove_entity(external_id: str) -> None:
+            """Remove entity."""
+            removed_entity_external_ids.append(external_id)
+
+        async def _status(status_update: StatusUpdate) -> None:
+            """Record status update."""
+            status_updates.append(status_update)
+
+        feed_manager = GdacsFeedManager(
+            websession,
+            _generate_entity,
+            _update_entity,
+            _remove_entity,
+            home_coordinates,
+            status_async_callback=_status,
+            update_changed_only=True,
+        )
+        await feed_manager.update()
+        assert len(generated_entity_external_ids) == 4
+        assert len(updated_entity_external_ids) == 0
+
+        # Same versions and alert levels.
+        await feed_manager.update()
+        assert len(generated_entity_external_ids) == 4
+        assert len(updated_entity_external_ids) == 0
+        assert status_updates[1].updated == 0
+
+        # New version of one event, new alert level of another event.
+        await feed_manager.update()
+        assert sorted(updated_entity_external_ids) == ["DR1013682", "TC1000643"]
+        assert status_updates[2].updated == 2
+        assert len(removed_entity_external_ids) == 0
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_concurrent_callbacks(mock_aiointercept):
+    """Test the feed manager dispatching callbacks concurrently."""
+    home_coordinates = (-41.2, 174.7)
+    for fixture in ("gdacs-1.xml", "gdacs-1.xml", "gdacs-2.xml"):
+        mock_aiointercept.get(
+            "https://www.gdacs.org/xml/rss.xml",
+            status=HTTPStatus.OK,
+            body=load_fixture(fixture),
+        )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        generated_entity_external_ids = []
+        updated_entity_external_ids = []
+        removed_entity_external_ids = []
+
+        async def _generate_entity(external_id: str) -> None:
+            """Generate new entity, failing for one of them."""
+            await asyncio.sleep(0)
+            if external_id == "EQ1199929":
+                raise RuntimeError("Generating entity failed")
+            generated_entity_external_ids.append(external_id)
+
+        async def _update_entity(external_id: str) -> None:
+            """Update entity."""
+            await asyncio.sleep(0)
+            updated_entity_external_ids.append(external_id)
+
+        async def _remove_entity(external_id: str) -> None:
+            """Remove entity."""
+            await asyncio.sleep(0)
+            removed_entity_external_ids.append(external_id)
+
+        feed_manager = GdacsFeedManager(
+            websession,
+            _generate_entity,
+            _update_entity,
+            _remove_entity,
+            home_coordinates,
+            callback_concurrency=2,
+            callback_timeout=1,
+        )
+        await feed_manager.update()
+        assert len(generated_entity_external_ids) == 3
+        assert set(feed_manager.callback_errors) == {"EQ1199929"}
+
+        # Entity that failed to generate is reported as new again.
+        await feed_manager.update()
+        assert len(generated_entity_external_ids) == 3
+        assert len(updated_entity_external_ids) == 3
+        assert set(feed_manager.callback_errors) == {"EQ1199929"}
+
+        await feed_manager.update()
+        assert len(removed_entity_external_ids) == 3
+        assert feed_manager.callback_errors == {}
+
+
+@pytest.mark.asyncio
+async def test_multi_feed_manager(mock_aiointercept):
+    """Test the feed manager for multiple feeds."""
+    home_coordinates = (-41.2, 174.7)
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss_24h.xml",
+        status=HTTPStatus.OK,
+        body=load_fixture("gdacs-1.xml"),
+    )
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss_7d.xml",
+        status=HTTPStatus.OK,
+        body=load_fixture("gdacs-4.xml"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        generated_entity_external_ids = []
+
+        async def _generate_entity(external_id: str) -> None:
+            """Generate new entity."""
+            generated_entity_external_ids.append(external_id)
+
+        async def _update_entity(external_id: str) -> None:
+            """Update entity."""
+
+        async def _remove_entity(external_id: str) -> None:
+            """Remove entity."""
+
+        feed_manager = GdacsMultiFeedManager(
+            websession,
+            _generate_entity,
+            _update_entity,
+            _remove_entity,
+            home_coordinates,
+            [URL_24H, URL_7D],
+            streaming_parser=True,
+        )
+        # The generic parser is not used.
+        with mock.patch("aio_georss_gdacs.feed.XmlParser", side_effect=AssertionError):
+            await feed_manager.update()
+        assert len(feed_manager.feed_entries) == 6
+        assert sorted(generated_entity_external_ids) == [
+            "DR1013588",
+            "DR1013682",
+            "DR1013900",
+            "EQ1199929",
+            "EQ1199950",
+            "TC1000643",
+        ]
+        assert feed_manager.last_timestamp == datetime.datetime(
+            2019, 12, 30, 1, 27, 0, tzinfo=pytz.utc
+        )
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_snapshot(mock_aiointercept, tmp_path):
+    """Test the feed manager restoring managed events from a snapshot."""
+    home_coordinates = (-41.2, 174.7)
+    path = tmp_path / "snapshot.jsonl"
+    for fixture in ("gdacs-1.xml", "gdacs-3.xml"):
+        mock_aiointercept.get(
+            "https://www.gdacs.org/xml/rss.xml",
+            status=HTTPStatus.OK,
+            body=load_fixture(fixture),
+        )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        generated_entity_external_ids = []
+        updated_entity_external_ids = []
+        removed_entity_external_ids = []
+
+        async def _generate_entity(external_id: str) -> None:
+            """Generate new entity."""
+            generated_entity_external_ids.append(external_id)
+
+        async def _update_entity(external_id: str) -> None:
+            """Update entity."""
+            updated_entity_external_ids.append(external_id)
+
+        async def _remove_entity(external_id: str) -> None:
+            """Remove entity."""
+            removed_entity_external_ids.append(external_id)
+
+        def _feed_manager():
+            return GdacsFeedManager(
+                websession,
+                _generate_entity,
+                _update_entity,
+                _remove_entity,
+                home_coordinates,
+                update_changed_only=True,
+            )
+
+        feed_manager = _feed_manager()
+        assert feed_manager.load_snapshot(path) == 0
+        await feed_manager.update()
+        assert len(generated_entity_external_ids) == 4
+        assert feed_manager.save_snapshot(path) == 4
+
+        # Restart with the snapshot.
+        generated_entity_external_ids.clear()
+        feed_manager = _feed_manager()
+        assert feed_manager.load_snapshot(path) == 4
+        assert feed_manager.save_snapshot(tmp_path / "copy.jsonl") == 4
+        await feed_manager.update()
+        assert generated_entity_external_ids == []
+        assert sorted(updated_entity_external_ids) == ["DR1013682", "TC1000643"]
+        assert removed_entity_external_ids == []
+
+        # Invalid snapshot is ignored.
+        path.write_text("invalid", encoding="utf-8")
+        feed_manager = _feed_manager()
+        assert feed_manager.load_snapshot(path) == 0
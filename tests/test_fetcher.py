@@ -0,0 +1,204 @@
+"""Test for the GDACS feed fetchers."""
+
+import asyncio
+from http import HTTPStatus
+import json
+import os
+import shutil
+import threading
+from unittest import mock
+
+from aio_georss_client.consts import UPDATE_ERROR, UPDATE_OK
+import aiohttp
+from multidict import CIMultiDict
+import pytest
+
+from aio_georss_gdacs import fetcher as fetcher_module
+from aio_georss_gdacs.consts import UPDATE_OK_NOT_MODIFIED
+from aio_georss_gdacs.feed import GdacsFeed
+from aio_georss_gdacs.fetcher import (
+    GdacsFetcher,
+    HttpFetcher,
+    RecordingFetcher,
+    ReplayFetcher,
+)
+from tests.utils import load_fixture
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _copy_fixtures(directory, *filenames):
+    """Copy fixtures into the directory in the provided order."""
+    for index, filename in enumerate(filenames):
+        shutil.copy(os.path.join(FIXTURES, filename), directory / f"{index}.xml")
+
+
+def test_fetcher_abstract():
+    """Test fetchers must implement fetch."""
+    with pytest.raises(TypeError):
+        GdacsFetcher()
+
+
+@pytest.mark.asyncio
+async def test_replay(tmp_path):
+    """Test replaying a directory of feeds."""
+    _copy_fixtures(tmp_path, "gdacs-1.xml", "gdacs-4.xml")
+    (tmp_path / "1.json").write_text(
+        json.dumps({"status": 200, "headers": {"Cache-Control": "max-age=60"}}),
+        encoding="utf-8",
+    )
+    sleeps = []
+
+    async def _sleep(delay):
+        sleeps.append(delay)
+
+    fetcher = ReplayFetcher(tmp_path, delay=0.5, sleep=_sleep)
+    assert repr(fetcher) == f"<ReplayFetcher(directory={tmp_path}, files=2)>"
+    feed = GdacsFeed(None, (-41.2, 174.7), fetcher=fetcher)
+    results = [await feed.update() for _ in range(3)]
+    assert [status for status, _ in results] == [UPDATE_OK] * 3
+    assert [len(entries) for _, entries in results] == [4, 2, 4]
+    assert sleeps == [0.5, 0.5, 0.5]
+    assert feed.max_age is None
+
+
+@pytest.mark.asyncio
+async def test_replay_without_repeat(tmp_path):
+    """Test replaying a directory of feeds only once."""
+    _copy_fixtures(tmp_path, "gdacs-1.xml")
+    feed = GdacsFeed(
+        None, (-41.2, 174.7), fetcher=ReplayFetcher(tmp_path, repeat=False)
+    )
+    status, _ = await feed.update()
+    assert status == UPDATE_OK
+    status, _ = await feed.update()
+    assert status == UPDATE_ERROR
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("metadata", ['{"status": 200, "hea', "[]", "\udcff"])
+async def test_replay_invalid_metadata(tmp_path, caplog, metadata):
+    """Test replaying a feed whose metadata cannot be read."""
+    _copy_fixtures(tmp_path, "gdacs-1.xml")
+    (tmp_path / "0.json").write_text(
+        metadata, encoding="utf-8", errors="surrogateescape"
+    )
+    feed = GdacsFeed(None, (-41.2, 174.7), fetcher=ReplayFetcher(tmp_path))
+    status, entries = await feed.update()
+    assert status == UPDATE_OK
+    assert len(entries) == 4
+    assert "Unable to read metadata" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_replay_outside_event_loop(tmp_path):
+    """Test reading recorded responses outside of the event loop."""
+    _copy_fixtures(tmp_path, "gdacs-1.xml")
+    threads = []
+    read_recording = fetcher_module._read_recording  # noqa: SLF001
+
+    def _read_recording(path):
+        """Read the recording, remembering the thread."""
+        threads.append(threading.get_ident())
+        return read_recording(path)
+
+    with mock.patch(
+        "aio_georss_gdacs.fetcher._read_recording", side_effect=_read_recording
+    ):
+        response = await ReplayFetcher(tmp_path).fetch("https://www.gdacs.org")
+    assert response.body == load_fixture("gdacs-1.xml").encode("utf-8")
+    assert threads
+    assert threading.get_ident() not in threads
+
+
+def test_replay_empty_directory(tmp_path):
+    """Test replaying an empty directory."""
+    with pytest.raises(ValueError, match="No .xml files found"):
+        ReplayFetcher(tmp_path)
+
+
+@pytest.mark.asyncio
+async def test_record_and_replay(mock_aiointercept, tmp_path):
+    """Test recording responses and replaying them."""
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.OK,
+        body=load_fixture("gdacs-1.xml"),
+        headers=CIMultiDict(
+            [("ETag", '"v1"'), ("Set-Cookie", "a=1"), ("Set-Cookie", "b=2")]
+        ),
+    )
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.NOT_MODIFIED,
+    )
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss.xml",
+        status=HTTPStatus.INTERNAL_SERVER_ERROR,
+    )
+    statuses = [UPDATE_OK, UPDATE_OK_NOT_MODIFIED, UPDATE_ERROR]
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        fetcher = RecordingFetcher(HttpFetcher(websession), tmp_path)
+        assert repr(fetcher) == (
+            f"<RecordingFetcher(fetcher=<HttpFetcher(timeout=None)>, "
+            f"directory={tmp_path})>"
+        )
+        feed = GdacsFeed(
+            websession, (-41.2, 174.7), conditional_requests=True, fetcher=fetcher
+        )
+        assert [(await feed.update())[0] for _ in range(3)] == statuses
+
+    assert sorted(os.listdir(tmp_path)) == [
+        "000001.json",
+        "000001.xml",
+        "000002.json",
+        "000002.xml",
+        "000003.json",
+        "000003.xml",
+    ]
+    metadata = json.loads((tmp_path / "000001.json").read_text(encoding="utf-8"))
+    assert metadata["url"] == "https://www.gdacs.org/xml/rss.xml"
+    assert metadata["status"] == 200
+    headers = [(name.lower(), value) for name, value in metadata["headers"]]
+    assert ("etag", '"v1"') in headers
+    assert headers.count(("set-cookie", "a=1")) == 1
+    assert headers.count(("set-cookie", "b=2")) == 1
+    response = await ReplayFetcher(tmp_path).fetch("https://www.gdacs.org")
+    assert response.headers.getall("Set-Cookie") == ["a=1", "b=2"]
+
+    sleeps = []
+
+    async def _sleep(delay):
+        sleeps.append(delay)
+
+    feed = GdacsFeed(
+        None,
+        (-41.2, 174.7),
+        conditional_requests=True,
+        fetcher=ReplayFetcher(tmp_path, recorded_delay=True, sleep=_sleep),
+    )
+    assert [(await feed.update())[0] for _ in range(3)] == statuses
+    assert len(sleeps) <= 3
+
+
+@pytest.mark.asyncio
+async def test_record_after_gaps(tmp_path):
+    """Test recording after the highest existing recording."""
+    source = tmp_path / "source"
+    source.mkdir()
+    _copy_fixtures(source, "gdacs-1.xml")
+    recordings = tmp_path / "recordings"
+    recordings.mkdir()
+    for name in ("000001.xml", "000005.xml", "notes.xml"):
+        (recordings / name).write_text("kept", encoding="utf-8")
+    fetcher = RecordingFetcher(ReplayFetcher(source), recordings)
+    await fetcher.fetch("https://www.gdacs.org")
+    assert sorted(os.listdir(recordings)) == [
+        "000001.xml",
+        "000005.xml",
+        "000006.json",
+        "000006.xml",
+        "notes.xml",
+    ]
+    assert (recordings / "000005.xml").read_text(encoding="utf-8") == "kept"
@@ -0,0 +1,71 @@
+"""Test for the compact geometries of GDACS feed entries."""
+
+from array import array
+
+from aio_georss_client.geo_rss_distance_helper import GeoRssDistanceHelper
+from aio_georss_client.xml_parser.geometry import Point, Polygon
+import pytest
+
+from aio_georss_gdacs.geometry import (
+    centroid,
+    decode_coordinates,
+    distance,
+    distance_to_points,
+    distance_to_polygon,
+    is_inside,
+)
+
+# Polygon crossing the 180 degree meridian, closed by repeating the first point.
+POLYGON = (-15.0, 170.0, -15.0, -170.0, -25.0, -170.0, -25.0, 170.0, -15.0, 170.0)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("-12.0 130.0 -12.5 142.0", [-12.0, 130.0, -12.5, 142.0]),
+        ({"#text": "1 2 3"}, [1.0, 2.0]),
+        ((1.0, 2.0), [1.0, 2.0]),
+        ("1 invalid", []),
+        ("", []),
+    ],
+)
+def test_decode_coordinates(value, expected):
+    """Test decoding coordinates into flat arrays."""
+    coordinates = decode_coordinates(value)
+    assert isinstance(coordinates, array)
+    assert coordinates.tolist() == expected
+
+
+def test_centroid():
+    """Test the centroid of a polygon."""
+    assert centroid(array("d", (0.0, 10.0, 2.0, 20.0))) == (1.0, 15.0)
+
+
+@pytest.mark.parametrize(
+    "home_coordinates",
+    [(-41.2, 174.7), (-20.0, 179.0), (-20.0, -175.0), (-14.0, 175.0)],
+)
+def test_distances_same_as_geo_rss_client(home_coordinates):
+    """Test that distances match the ones of the GeoRSS client."""
+    polygon = array("d", POLYGON)
+    expected = Polygon(
+        [Point(POLYGON[index], POLYGON[index + 1]) for index in range(0, 10, 2)]
+    )
+    assert distance_to_polygon(home_coordinates, polygon) == pytest.approx(
+        GeoRssDistanceHelper.distance_to_geometry(home_coordinates, expected)
+    )
+    assert is_inside(polygon, home_coordinates) == expected.is_inside(
+        Point(*home_coordinates)
+    )
+    assert distance(home_coordinates, -15.0, 170.0) == pytest.approx(
+        GeoRssDistanceHelper.distance_to_geometry(home_coordinates, Point(-15.0, 170.0))
+    )
+
+
+def test_distance_to_points():
+    """Test the distance to the closest point."""
+    points = array("d", (-15.0, 170.0, -40.0, 174.0))
+    assert distance_to_points((-41.2, 174.7), points) == pytest.approx(
+        distance((-41.2, 174.7), -40.0, 174.0)
+    )
+    assert distance_to_points((-41.2, 174.7), array("d")) == float("inf")
@@ -0,0 +1,81 @@
+"""Test for importing the GDACS library."""
+
+import subprocess
+import sys
+
+import pytest
+
+import aio_georss_gdacs
+
+# Cumulative import time of the package in microseconds, as reported by
+# "python -X importtime". Importing aiohttp and the XML stack takes several
+# times as long.
+IMPORT_TIME_BUDGET = 100_000
+HEAVY_MODULES = ["aiohttp", "aio_georss_client", "dateutil", "lxml", "xmltodict"]
+
+
+def _import(statement: str) -> tuple[dict[str, int], set[str]]:
+    """Run import statement in a new interpreter.
+
+    Return the cumulative import time of each module and all loaded modules.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"{statement}; import sys; print(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line.split("|")
+            if cumulative.strip().isdigit():
+                import_times[module.strip()] = int(cumulative)
+    return import_times, set(result.stdout.split())
+
+
+def test_import_package_lazily():
+    """Test that importing the package does not import its dependencies."""
+    import_times, modules = _import("import aio_georss_gdacs")
+    assert import_times["aio_georss_gdacs"] < IMPORT_TIME_BUDGET
+    for module in HEAVY_MODULES:
+        assert module not in modules
+
+
+def test_import_feed_manager():
+    """Test that optional features are not imported with the feed manager."""
+    _, modules = _import("from aio_georss_gdacs import GdacsFeedManager")
+    assert "aio_georss_gdacs.feed_manager" in modules
+    for module in [
+        "aio_georss_gdacs.archive",
+        "aio_georss_gdacs.cache",
+        "aio_georss_gdacs.xml_parser",
+        "lxml",
+        "sqlite3",
+    ]:
+        assert module not in modules
+
+
+def test_import_date_parser():
+    """Test that dateutil is only imported for unusual dates."""
+    _, modules = _import(
+        "from aio_georss_gdacs.date_parser import parse_date; "
+        "parse_date('Sun, 29 Dec 2019 12:00:00 GMT')"
+    )
+    assert "dateutil" not in modules
+
+
+def test_lazy_attributes():
+    """Test accessing classes of the package."""
+    from aio_georss_gdacs.feed import GdacsFeed  # noqa: PLC0415
+
+    assert aio_georss_gdacs.GdacsFeed is GdacsFeed
+    assert "GdacsMultiFeedManager" in dir(aio_georss_gdacs)
+    with pytest.raises(AttributeError, match="Unknown"):
+        _ = aio_georss_gdacs.Unknown
@@ -0,0 +1,109 @@
+"""Test for the GDACS metrics."""
+
+import asyncio
+from http import HTTPStatus
+import logging
+
+import aiohttp
+import pytest
+
+from aio_georss_gdacs.feed_manager import GdacsFeedManager
+from aio_georss_gdacs.metrics import GdacsMetrics, LoggingMetrics, PrometheusMetrics
+from tests.utils import load_fixture
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_metrics(mock_aiointercept):
+    """Test recording metrics of feed manager updates."""
+    for fixture in ("gdacs-1.xml", "gdacs-3.xml"):
+        mock_aiointercept.get(
+            "https://www.gdacs.org/xml/rss.xml",
+            status=HTTPStatus.OK,
+            body=load_fixture(fixture),
+        )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        generated_entity_external_ids = []
+
+        async def _generate_entity(external_id: str) -> None:
+            """Generate new entity."""
+            generated_entity_external_ids.append(external_id)
+
+        async def _ignore(external_id: str) -> None:
+            """Ignore callback."""
+
+        metrics = PrometheusMetrics()
+        feed_manager = GdacsFeedManager(
+            websession,
+            _generate_entity,
+            _ignore,
+            _ignore,
+            (-41.2, 174.7),
+            filter_categories=["Drought"],
+            metrics=metrics,
+        )
+        assert feed_manager.feed.metrics is metrics
+        await feed_manager.update()
+        await feed_manager.update()
+        assert len(generated_entity_external_ids) == 2
+
+    samples = dict(
+        line.rsplit(" ", 1)
+        for line in metrics.export().splitlines()
+        if not line.startswith("#")
+    )
+    for name in (
+        "fetch",
+        "parse",
+        "entries",
+        "filter",
+        "feed_update",
+        "entities_update",
+        "update_callback",
+    ):
+        assert samples[f"gdacs_{name}_seconds_count"] == "2"
+        assert float(samples[f"gdacs_{name}_seconds_sum"]) > 0
+    assert samples["gdacs_generate_callback_seconds_count"] == "2"
+    assert "gdacs_remove_callback_seconds_count" not in samples
+    assert int(samples["gdacs_response_bytes_total"]) > 0
+    assert samples["gdacs_entries_total"] == "8"
+    assert samples["gdacs_filtered_entries_total"] == "4"
+    assert samples["gdacs_created_entries_total"] == "2"
+    assert samples["gdacs_updated_entries_total"] == "2"
+    assert samples["gdacs_removed_entries_total"] == "0"
+
+
+def test_prometheus_metrics():
+    """Test exporting metrics in OpenMetrics text format."""
+    metrics = PrometheusMetrics(prefix="test")
+    assert repr(metrics) == "<PrometheusMetrics(prefix=test)>"
+    assert metrics.export() == "# EOF\n"
+    metrics.duration("fetch", 0.25)
+    metrics.duration("fetch", 0.5)
+    metrics.count("entries", 3)
+    metrics.count("entries", 4)
+    assert metrics.export() == (
+        "# TYPE test_fetch_seconds summary\n"
+        "test_fetch_seconds_count 2\n"
+        "test_fetch_seconds_sum 0.75\n"
+        "# TYPE test_entries counter\n"
+        "test_entries_total 7\n"
+        "# EOF\n"
+    )
+
+
+def test_logging_metrics(caplog):
+    """Test logging metrics."""
+    metrics = LoggingMetrics(level=logging.INFO)
+    with caplog.at_level(logging.INFO, logger="aio_georss_gdacs.metrics"):
+        metrics.duration("parse", 0.0125)
+        metrics.count("entries", 3)
+    assert caplog.messages == ["Duration of parse: 12.500ms", "Count of entries: 3"]
+
+
+def test_no_metrics():
+    """Test ignoring metrics."""
+    metrics = GdacsMetrics()
+    assert repr(metrics) == "<GdacsMetrics()>"
+    assert metrics.duration("parse", 0.1) is None
+    assert metrics.count("entries", 1) is None
@@ -0,0 +1,133 @@
+"""Test for multiple GDACS feeds."""
+
+import asyncio
+from http import HTTPStatus
+
+from aio_georss_client.consts import UPDATE_ERROR, UPDATE_OK
+import aiohttp
+import pytest
+
+from aio_georss_gdacs.consts import UPDATE_OK_NOT_MODIFIED, URL_7D, URL_24H
+from aio_georss_gdacs.multi_feed import GdacsMultiFeed
+from tests.utils import load_fixture
+
+
+@pytest.mark.asyncio
+async def test_update_ok(mock_aiointercept):
+    """Test updating multiple feeds."""
+    home_coordinates = (-41.2, 174.7)
+    for _ in range(2):
+        mock_aiointercept.get(
+            "https://www.gdacs.org/xml/rss_24h.xml",
+            status=HTTPStatus.OK,
+            body=load_fixture("gdacs-1.xml"),
+        )
+        mock_aiointercept.get(
+            "https://www.gdacs.org/xml/rss_7d.xml",
+            status=HTTPStatus.OK,
+            body=load_fixture("gdacs-3.xml"),
+        )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = GdacsMultiFeed(websession, home_coordinates, [URL_24H, URL_7D])
+        assert (
+            repr(feed) == "<GdacsMultiFeed(home=(-41.2, 174.7), "
+            "urls=['https://www.gdacs.org/xml/rss_24h.xml', "
+            "'https://www.gdacs.org/xml/rss_7d.xml'], "
+            "radius=None, categories=None)>"
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert [entry.external_id for entry in entries] == [
+            "TC1000643",
+            "EQ1199929",
+            "DR1013682",
+            "DR1013588",
+        ]
+        # Highest version of each event is kept.
+        assert entries[0].version == 2
+        # Same version in both feeds, entry of the first feed is kept.
+        assert entries[2].alert_level == "Green"
+        assert feed.last_timestamp is not None
+
+        # Publication dates of both feeds unchanged.
+        status, unchanged_entries = await feed.update()
+        assert status == UPDATE_OK_NOT_MODIFIED
+        assert unchanged_entries is entries
+        assert [feed.unchanged_content_count for feed in feed.feeds] == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_update_partial_error(mock_aiointercept):
+    """Test updating multiple feeds with one failing."""
+    home_coordinates = (-41.2, 174.7)
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss_24h.xml",
+        status=HTTPStatus.INTERNAL_SERVER_ERROR,
+    )
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss_7d.xml",
+        status=HTTPStatus.OK,
+        body=load_fixture("gdacs-4.xml"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = GdacsMultiFeed(websession, home_coordinates, [URL_24H, URL_7D])
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert [entry.external_id for entry in entries] == ["DR1013900", "EQ1199950"]
+
+
+@pytest.mark.asyncio
+async def test_update_partial_error_recovered(mock_aiointercept):
+    """Test keeping entries of a failing feed until it recovers."""
+    home_coordinates = (-41.2, 174.7)
+    for response in (
+        {"status": HTTPStatus.OK, "body": load_fixture("gdacs-1.xml")},
+        {"status": HTTPStatus.INTERNAL_SERVER_ERROR},
+        {"status": HTTPStatus.OK, "body": load_fixture("gdacs-3.xml")},
+    ):
+        mock_aiointercept.get("https://www.gdacs.org/xml/rss_24h.xml", **response)
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss_7d.xml",
+        status=HTTPStatus.OK,
+        body=load_fixture("gdacs-4.xml"),
+        repeat=True,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = GdacsMultiFeed(websession, home_coordinates, [URL_24H, URL_7D])
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert len(entries) == 6
+        # Entries of the failing feed are kept, and nothing else changed.
+        status, kept_entries = await feed.update()
+        assert status == UPDATE_OK_NOT_MODIFIED
+        assert kept_entries is entries
+        # Recovered feed replaces its entries.
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert len(entries) == 6
+        versions = {entry.external_id: entry.version for entry in entries}
+        assert versions["TC1000643"] == 2
+
+
+@pytest.mark.asyncio
+async def test_update_error(mock_aiointercept):
+    """Test updating multiple feeds with all failing."""
+    home_coordinates = (-41.2, 174.7)
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss_24h.xml",
+        status=HTTPStatus.INTERNAL_SERVER_ERROR,
+    )
+    mock_aiointercept.get(
+        "https://www.gdacs.org/xml/rss_7d.xml",
+        status=HTTPStatus.INTERNAL_SERVER_ERROR,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = GdacsMultiFeed(websession, home_coordinates, [URL_24H, URL_7D])
+        status, entries = await feed.update()
+        assert status == UPDATE_ERROR
+        assert entries is None
+        assert feed.last_timestamp is None
@@ -0,0 +1,269 @@
+"""Test for the GDACS update scheduler."""
+
+import asyncio
+import datetime
+from http import HTTPStatus
+
+import aiohttp
+import pytest
+
+from aio_georss_gdacs.feed_manager import GdacsFeedManager
+from aio_georss_gdacs.scheduler import GdacsUpdateScheduler
+from tests.utils import load_fixture
+
+# Publication dates of the test fixtures.
+PUBLISHED_1 = datetime.datetime(2019, 12, 30, 1, 35, 11, tzinfo=datetime.UTC)
+PUBLISHED_4 = datetime.datetime(2019, 12, 30, 2, 5, 0, tzinfo=datetime.UTC)
+
+
+class _FakeClock:
+    """Clock that only moves when told to."""
+
+    def __init__(self, now: datetime.datetime):
+        """Initialise the clock."""
+        self.now = now.timestamp()
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def _feed_manager(websession):
+    """Return a feed manager ignoring all callbacks."""
+
+    async def _callback(external_id: str) -> None:
+        """Ignore callback."""
+
+    return GdacsFeedManager(websession, _callback, _callback, _callback, (0.0, 0.0))
+
+
+def _mock_responses(mock_aiointercept, *responses):
+    """Mock the feed with the provided fixtures or statuses in order."""
+    for response in responses:
+        if isinstance(response, str):
+            mock_aiointercept.get(
+                "https://www.gdacs.org/xml/rss.xml",
+                status=HTTPStatus.OK,
+                body=load_fixture(response),
+            )
+        else:
+            mock_aiointercept.get("https://www.gdacs.org/xml/rss.xml", **response)
+
+
+@pytest.mark.asyncio
+async def test_interval_follows_changes(mock_aiointercept):
+    """Test that the interval shrinks with changes and grows without."""
+    _mock_responses(
+        mock_aiointercept, "gdacs-1.xml", "gdacs-1.xml", "gdacs-3.xml", "gdacs-3.xml"
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        clock = _FakeClock(PUBLISHED_1)
+        scheduler = GdacsUpdateScheduler(
+            _feed_manager(websession),
+            min_interval=60.0,
+            max_interval=1800.0,
+            initial_interval=400.0,
+            clock=clock,
+        )
+        assert await scheduler.update() == 600.0
+        assert await scheduler.update() == 900.0
+        # Version of one event changed.
+        assert await scheduler.update() == 450.0
+        assert await scheduler.update() == 675.0
+        assert scheduler.next_interval == 675.0
+        assert repr(scheduler).endswith("interval=675.0)>")
+
+
+@pytest.mark.asyncio
+async def test_interval_follows_publication(mock_aiointercept):
+    """Test polling shortly after the feed is expected to be published."""
+    _mock_responses(mock_aiointercept, "gdacs-1.xml", "gdacs-4.xml", "gdacs-4.xml")
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        clock = _FakeClock(PUBLISHED_1)
+        scheduler = GdacsUpdateScheduler(
+            _feed_manager(websession),
+            min_interval=60.0,
+            max_interval=3600.0,
+            initial_interval=1200.0,
+            clock=clock,
+        )
+        assert await scheduler.update() == 1800.0
+        clock.now = PUBLISHED_4.timestamp() + 30
+        assert await scheduler.update() == 900.0
+        clock.now = PUBLISHED_4.timestamp() + 600
+        # Feed was published 1789s after the previous publication.
+        assert await scheduler.update() == pytest.approx(1789 + 10 - 600)
+
+
+@pytest.mark.asyncio
+async def test_interval_follows_cache_headers(mock_aiointercept):
+    """Test not polling before the response expires."""
+    _mock_responses(
+        mock_aiointercept,
+        {
+            "status": HTTPStatus.OK,
+            "body": load_fixture("gdacs-1.xml"),
+            "headers": {"Cache-Control": "public, max-age=700", "Age": "100"},
+        },
+        {
+            "status": HTTPStatus.OK,
+            "body": load_fixture("gdacs-1.xml"),
+            "headers": {
+                "Date": "Mon, 30 Dec 2019 01:40:00 GMT",
+                "Expires": "Mon, 30 Dec 2019 02:00:00 GMT",
+            },
+        },
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed_manager = _feed_manager(websession)
+        scheduler = GdacsUpdateScheduler(
+            feed_manager,
+            min_interval=60.0,
+            max_interval=1800.0,
+            initial_interval=200.0,
+            clock=_FakeClock(PUBLISHED_1),
+        )
+        assert await scheduler.update() == 600.0
+        assert feed_manager.feed.max_age == 600
+        assert await scheduler.update() == 1200.0
+        assert feed_manager.feed.max_age == 1200.0
+
+
+@pytest.mark.asyncio
+async def test_backoff_after_errors(mock_aiointercept):
+    """Test exponential backoff with jitter after errors."""
+    _mock_responses(
+        mock_aiointercept,
+        *[{"status": HTTPStatus.INTERNAL_SERVER_ERROR}] * 6,
+        "gdacs-1.xml",
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        scheduler = GdacsUpdateScheduler(
+            _feed_manager(websession),
+            min_interval=60.0,
+            max_interval=1000.0,
+            initial_interval=300.0,
+            clock=_FakeClock(PUBLISHED_1),
+            random_number=lambda: 0.5,
+        )
+        intervals = [await scheduler.update() for _ in range(6)]
+        assert intervals == [75.0, 90.0, 180.0, 360.0, 720.0, 750.0]
+        assert scheduler.errors == 6
+        assert await scheduler.update() == 450.0
+        assert scheduler.errors == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("random_number", "interval"), [(0.0, 60.0), (1.0, 90.0)])
+async def test_backoff_jitter_after_first_error(
+    mock_aiointercept, random_number, interval
+):
+    """Test the jitter after the first error is not clamped away."""
+    _mock_responses(mock_aiointercept, {"status": HTTPStatus.INTERNAL_SERVER_ERROR})
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        scheduler = GdacsUpdateScheduler(
+            _feed_manager(websession),
+            min_interval=60.0,
+            random_number=lambda: random_number,
+        )
+        assert await scheduler.update() == interval
+
+
+@pytest.mark.asyncio
+async def test_backoff_long_outage(mock_aiointercept):
+    """Test backoff after more errors than the interval can double."""
+    _mock_responses(mock_aiointercept, {"status": HTTPStatus.INTERNAL_SERVER_ERROR})
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        scheduler = GdacsUpdateScheduler(
+            _feed_manager(websession),
+            min_interval=60.0,
+            max_interval=1000.0,
+            initial_interval=300.0,
+            random_number=lambda: 0.5,
+        )
+        scheduler._errors = 5000  # noqa: SLF001
+        assert await scheduler.update() == 750.0
+        assert scheduler.errors == 5001
+
+
+@pytest.mark.asyncio
+async def test_run(mock_aiointercept):
+    """Test updating in the background."""
+    _mock_responses(mock_aiointercept, "gdacs-1.xml", "gdacs-1.xml")
+    sleeps = []
+    blocked = asyncio.Event()
+
+    async def _sleep(delay: float) -> None:
+        """Record delay and block on the second call."""
+        sleeps.append(delay)
+        if len(sleeps) > 1:
+            await blocked.wait()
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed_manager = _feed_manager(websession)
+        scheduler = GdacsUpdateScheduler(
+            feed_manager, clock=_FakeClock(PUBLISHED_1), sleep=_sleep
+        )
+        task = scheduler.start()
+        assert scheduler.start() is task
+        while len(sleeps) < 2:
+            await asyncio.sleep(0)
+        await scheduler.stop()
+        assert task.cancelled()
+        assert sleeps == [450.0, 675.0]
+        assert len(feed_manager.feed_entries) == 4
+        await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_run_after_exception(mock_aiointercept, caplog):
+    """Test updating in the background continues after an exception."""
+    _mock_responses(mock_aiointercept, "gdacs-1.xml", "gdacs-1.xml")
+    sleeps = []
+    blocked = asyncio.Event()
+
+    async def _sleep(delay: float) -> None:
+        """Record delay and block on the second call."""
+        sleeps.append(delay)
+        if len(sleeps) > 1:
+            await blocked.wait()
+
+    async def _generate_entity(external_id: str) -> None:
+        """Fail generating entities during the first update."""
+        if len(sleeps) == 0:
+            raise RuntimeError("Entity failed")
+
+    async def _callback(external_id: str) -> None:
+        """Ignore callback."""
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed_manager = GdacsFeedManager(
+            websession, _generate_entity, _callback, _callback, (0.0, 0.0)
+        )
+        scheduler = GdacsUpdateScheduler(
+            feed_manager,
+            clock=_FakeClock(PUBLISHED_1),
+            sleep=_sleep,
+            random_number=lambda: 0.5,
+        )
+        task = scheduler.start()
+        while len(sleeps) < 2:
+            await asyncio.sleep(0)
+        assert not task.done()
+        # Backoff after the exception, then the interval of an update.
+        assert sleeps == [75.0, 450.0]
+        assert scheduler.errors == 0
+        assert "Entity failed" in caplog.text
+        await scheduler.stop()
+
+
+def test_invalid_intervals():
+    """Test creating a scheduler with invalid intervals."""
+    with pytest.raises(ValueError, match="Intervals must satisfy"):
+        GdacsUpdateScheduler(None, min_interval=600.0, initial_interval=300.0)
@@ -0,0 +1,96 @@
+"""Test for the bulk matching of GDACS events against sites."""
+
+from aio_georss_client.xml_parser import XmlParser
+from haversine import haversine
+import pytest
+
+from aio_georss_gdacs import site_matcher
+from aio_georss_gdacs.event import GdacsEvent
+from aio_georss_gdacs.feed_entry import GdacsFeedEntry
+from aio_georss_gdacs.site_matcher import SiteMatch, match_sites
+from tests.utils import load_fixture
+
+SITES = [(-41.2, 174.7), (-31.9, 115.9), (-20.0, 60.0), (52.5, 13.4)]
+RADII = [20000.0, 500.0, 1000.0, 100.0]
+
+
+def _entries():
+    """Return feed entries of the test fixture."""
+    feed_items = XmlParser().parse(load_fixture("gdacs-1.xml")).entries
+    return [GdacsFeedEntry(SITES[0], feed_item) for feed_item in feed_items]
+
+
+def _expected_matches(events):
+    """Return matches computed one by one."""
+    return [
+        (site, event)
+        for site, coordinates in enumerate(SITES)
+        for event, entry in enumerate(events)
+        if haversine(coordinates, entry.coordinates) <= RADII[site]
+    ]
+
+
+@pytest.mark.parametrize("numpy_available", [True, False])
+def test_match_sites(monkeypatch, numpy_available):
+    """Test matching events against sites."""
+    if not numpy_available:
+        monkeypatch.setattr(site_matcher, "np", None)
+    entries = _entries()
+    matches = match_sites(SITES, RADII, entries)
+    assert [(match.site, match.event) for match in matches] == [
+        (0, 0),
+        (0, 1),
+        (0, 2),
+        (0, 3),
+        (1, 3),
+        (2, 0),
+    ]
+    assert [(match.site, match.event) for match in matches] == _expected_matches(
+        entries
+    )
+    for match in matches:
+        assert match.distance == pytest.approx(
+            haversine(SITES[match.site], entries[match.event].coordinates)
+        )
+    # Events can also be compact records.
+    events = [GdacsEvent.from_entry(entry) for entry in entries]
+    assert match_sites(SITES, RADII, events) == matches
+
+
+@pytest.mark.parametrize("numpy_available", [True, False])
+def test_match_sites_single_radius(monkeypatch, numpy_available):
+    """Test matching events against sites with the same radius."""
+    if not numpy_available:
+        monkeypatch.setattr(site_matcher, "np", None)
+    entries = _entries()
+    matches = match_sites(SITES, 1000, entries)
+    assert [(match.site, match.event) for match in matches] == [(1, 3), (2, 0)]
+    assert matches[1] == SiteMatch(2, 0, pytest.approx(69.9, 0.001))
+
+
+def test_match_sites_chunks(monkeypatch):
+    """Test matching more sites than fit into one chunk."""
+    monkeypatch.setattr(site_matcher, "CHUNK_SIZE", 3)
+    entries = _entries()
+    assert match_sites(SITES * 2, RADII * 2, entries) == [
+        *match_sites(SITES, RADII, entries),
+        *(
+            SiteMatch(match.site + len(SITES), match.event, match.distance)
+            for match in match_sites(SITES, RADII, entries)
+        ),
+    ]
+
+
+def test_match_sites_without_coordinates():
+    """Test matching events without coordinates."""
+    entries = [GdacsFeedEntry(SITES[0], None), *_entries()]
+    matches = match_sites(SITES, 20000.0, entries)
+    assert {match.event for match in matches} == {1, 2, 3, 4}
+    assert match_sites([], [], entries) == []
+    assert match_sites(SITES, 100.0, []) == []
+
+
+def test_match_sites_invalid_radii():
+    """Test matching events with the wrong number of radii."""
+    with pytest.raises(ValueError, match="Expected 4 radii for 4 sites, got 2"):
+        match_sites(SITES, [1.0, 2.0], _entries())
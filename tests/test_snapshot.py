@@ -0,0 +1,66 @@
+"""Test for the snapshot of managed events."""
+
+import datetime
+import os
+
+import pytest
+
+from aio_georss_gdacs.snapshot import SnapshotRecord, read_snapshot, write_snapshot
+
+RECORDS = [
+    SnapshotRecord(
+        "TC1000643",
+        "TC",
+        1000643,
+        1,
+        "Green",
+        datetime.datetime(2019, 12, 30, 1, 40, tzinfo=datetime.UTC),
+    ),
+    SnapshotRecord("custom", None, None, None, None, None),
+]
+
+
+def test_write_read(tmp_path):
+    """Test writing and reading a snapshot."""
+    path = tmp_path / "snapshot.jsonl"
+    write_snapshot(path, RECORDS)
+    assert read_snapshot(path) == RECORDS
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == '{"format": 1}'
+    assert len(lines) == 3
+    # Snapshot is replaced, no temporary files are left behind.
+    write_snapshot(path, RECORDS[:1])
+    assert read_snapshot(path) == RECORDS[:1]
+    assert os.listdir(tmp_path) == ["snapshot.jsonl"]
+
+
+def test_write_error(tmp_path):
+    """Test that a failed write keeps the previous snapshot."""
+    path = tmp_path / "snapshot.jsonl"
+    write_snapshot(path, RECORDS)
+
+    def _records():
+        yield RECORDS[0]
+        raise RuntimeError("Failed")
+
+    with pytest.raises(RuntimeError, match="Failed"):
+        write_snapshot(path, _records())
+    assert read_snapshot(path) == RECORDS
+    assert os.listdir(tmp_path) == ["snapshot.jsonl"]
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        ("", "Unsupported snapshot format: None"),
+        ('{"format": 2}\n', "Unsupported snapshot format"),
+        ("not json\n", "Expecting value"),
+        ('{"format": 1}\n{"external_id": "TC1000643"}\n', "Invalid snapshot record"),
+    ],
+)
+def test_read_invalid(tmp_path, content, message):
+    """Test reading an invalid snapshot."""
+    path = tmp_path / "snapshot.jsonl"
+    path.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError, match=message):
+        read_snapshot(path)
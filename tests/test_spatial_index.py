@@ -0,0 +1,95 @@
+"""Test for the GDACS spatial index."""
+
+import random
+
+from aio_georss_client.xml_parser import XmlParser
+import pytest
+
+from aio_georss_gdacs.feed_entry import GdacsFeedEntry
+from aio_georss_gdacs.spatial_index import GdacsSpatialIndex
+from tests.utils import load_fixture
+
+
+def _entries(filename):
+    """Return feed entries of the test fixture."""
+    feed_items = XmlParser().parse(load_fixture(filename)).entries
+    return [GdacsFeedEntry((0.0, 0.0), feed_item) for feed_item in feed_items]
+
+
+def _external_ids(matches):
+    """Return external ids of the matches."""
+    return [entry.external_id for entry, _ in matches]
+
+
+def test_query_polygon():
+    """Test querying entries with polygons."""
+    entries = _entries("gdacs-4.xml")
+    index = GdacsSpatialIndex(entries)
+    assert repr(index) == "<GdacsSpatialIndex(entries=2, cell_size=10.0)>"
+    assert len(index) == 2
+    # Indexing only uses the arrays of coordinates.
+    assert all("geometries" not in entry.__dict__ for entry in entries)
+    # Inside the polygon, but far away from its point.
+    matches = index.query((-30.0, 120.0))
+    assert _external_ids(matches) == ["DR1013900"]
+    assert matches[0][1] == 0.0
+    # Outside the polygon.
+    assert index.query((-33.9, 151.2)) == []
+    assert index.query((-33.9, 151.2), 200.0) == []
+    matches = index.query((-33.9, 151.2), 300.0)
+    assert _external_ids(matches) == ["DR1013900"]
+    assert matches[0][1] == pytest.approx(256.5, 0.001)
+
+
+def test_query_180_degree_meridian():
+    """Test querying entries across the 180 degree meridian."""
+    index = GdacsSpatialIndex(_entries("gdacs-4.xml"))
+    matches = index.query((-17.5, -179.9), 50.0)
+    assert _external_ids(matches) == ["EQ1199950"]
+    assert matches[0][1] == pytest.approx(21.2, 0.001)
+    assert index.query((-17.5, -179.9)) == []
+
+
+def test_query_matches_distance_to_home():
+    """Test that queries match filtering by distance to home."""
+    entries = _entries("gdacs-1.xml") + _entries("gdacs-4.xml")
+    index = GdacsSpatialIndex(entries, cell_size=5.0)
+    generator = random.Random(1)
+    for _ in range(500):
+        coordinates = (generator.uniform(-89.0, 89.0), generator.uniform(-180, 180))
+        radius = generator.choice([0.0, 100.0, 1000.0, 5000.0, 15000.0])
+        expected = sorted(
+            (distance, entry.external_id)
+            for entry in entries
+            if (distance := entry.relocate(coordinates).distance_to_home) <= radius
+        )
+        assert [
+            (distance, entry.external_id)
+            for entry, distance in index.query(coordinates, radius)
+        ] == expected
+
+
+def test_add_remove():
+    """Test adding and removing entries."""
+    entries = _entries("gdacs-4.xml")
+    index = GdacsSpatialIndex()
+    assert index.query((-30.0, 120.0), 20000.0) == []
+    index.add(entries[0])
+    index.add(entries[0])
+    assert len(index) == 1
+    assert _external_ids(index.query((-30.0, 120.0))) == ["DR1013900"]
+    index.add(entries[1])
+    index.remove("DR1013900")
+    index.remove("DR1013900")
+    assert len(index) == 1
+    assert index.query((-30.0, 120.0)) == []
+    assert _external_ids(index.query((-30.0, 120.0), 20000.0)) == ["EQ1199950"]
+    index.clear()
+    assert len(index) == 0
+    assert index.query((-30.0, 120.0), 20000.0) == []
+
+
+def test_invalid_cell_size():
+    """Test creating an index with invalid cell size."""
+    with pytest.raises(ValueError, match="Cell size must be positive, got 0"):
+        GdacsSpatialIndex(cell_size=0)
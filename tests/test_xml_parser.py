@@ -0,0 +1,68 @@
+"""Test for the GDACS streaming XML parser."""
+
+from unittest import mock
+from xml.etree import ElementTree as ET
+
+from aio_georss_client.xml_parser import XmlParser
+import pytest
+
+from aio_georss_gdacs import xml_parser
+from aio_georss_gdacs.feed_entry import GdacsFeedEntry
+from aio_georss_gdacs.xml_parser import GdacsXmlParser
+from tests.utils import load_fixture
+
+
+@pytest.mark.parametrize("etree", [xml_parser.etree, ET])
+def test_parse_same_as_generic_parser(etree):
+    """Test that feed items contain the same values as the generic parser's."""
+    xml = load_fixture("gdacs-1.xml")
+    expected = XmlParser().parse(xml)
+    with mock.patch.object(xml_parser, "etree", etree):
+        feed = GdacsXmlParser().parse(xml.encode("utf-8"))
+    assert feed.title == expected.title
+    assert feed.published_date == expected.published_date
+    assert feed.author == expected.author
+    assert len(feed.entries) == len(expected.entries) == 4
+    for item, expected_item in zip(feed.entries, expected.entries, strict=True):
+        # Only relevant tags are kept.
+        assert "gdacs:resources" not in item._source  # noqa: SLF001
+        for key, value in item._source.items():  # noqa: SLF001
+            assert value == expected_item._source[key]  # noqa: SLF001
+        assert item.geometries == expected_item.geometries
+
+
+def test_parse_single_item():
+    """Test parsing a feed with a single item."""
+    xml = (
+        '<rss xmlns:gdacs="http://www.gdacs.org"><channel><item>'
+        "<guid>EQ1</guid><gdacs:severity unit='M' value='5.2'>Magnitude 5.2M"
+        "</gdacs:severity><gdacs:glide /></item></channel></rss>"
+    )
+    feed = GdacsXmlParser().parse(xml)
+    assert len(feed.entries) == 1
+    item = feed.entries[0]
+    assert item.guid == "EQ1"
+    assert item.get_additional_attribute("gdacs:severity") == {
+        "@unit": "M",
+        "@value": "5.2",
+        "#text": "Magnitude 5.2M",
+    }
+    assert item.get_additional_attribute("gdacs:glide") is None
+
+
+@pytest.mark.parametrize("xml", ["", "<feed></feed>", "<rss><something /></rss>"])
+def test_parse_unsupported(xml):
+    """Test parsing documents that are not GDACS RSS feeds."""
+    assert GdacsXmlParser().parse(xml) is None
+
+
+def test_parse_polygon_decoded_by_entries():
+    """Test that polygons are kept as text and decoded by feed entries."""
+    xml = load_fixture("gdacs-4.xml")
+    expected = XmlParser().parse(xml).entries[0]
+    item = GdacsXmlParser().parse(xml).entries[0]
+    assert item.get_additional_attribute("georss:polygon").startswith("-12.0 130.0")
+    entry = GdacsFeedEntry((-41.2, 174.7), item)
+    expected_entry = GdacsFeedEntry((-41.2, 174.7), expected)
+    assert entry.geometries == expected_entry.geometries
+    assert entry.distance_to_home == expected_entry.distance_to_home